@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""音声再生の手動確認用スクリプト（実際の出力デバイスで samples/ のWAVを再生する）
+
+プロジェクトルートで実行: uv run python samples/play_test_wav.py
+自動テストは tests/test_play.py（PyAudioをモックして実行）。
+"""
+
+import sys
+from pathlib import Path
+
+# プロジェクトルートをパスに追加
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.audio_player import AudioPlayer
+
+
+def main():
+    player = AudioPlayer()
+
+    # デバイス一覧を表示
+    print("=== 音声出力デバイス一覧 ===")
+    player.print_output_devices()
+
+    # デフォルトデバイスで再生
+    print("\n【テスト1】デフォルトデバイスで440Hz音声を再生")
+    try:
+        player.play_wav("samples/test_440hz.wav")
+        print("✓ 再生完了\n")
+    except Exception as e:
+        print(f"✗ エラー: {e}\n")
+
+    # 2つ目のファイルも再生
+    print("【テスト2】デフォルトデバイスで880Hz音声を再生")
+    try:
+        player.play_wav("samples/test_880hz.wav")
+        print("✓ 再生完了\n")
+    except Exception as e:
+        print(f"✗ エラー: {e}\n")
+
+
+if __name__ == "__main__":
+    main()
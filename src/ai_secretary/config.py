@@ -9,12 +9,40 @@
 
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import yaml
 
 
+def _stat_key(path: Path) -> Tuple[str, int, int]:
+    """キャッシュキー用に (絶対パス, 更新時刻, サイズ) を返す"""
+    stat = path.stat()
+    return str(path.resolve()), stat.st_mtime_ns, stat.st_size
+
+
+@lru_cache(maxsize=128)
+def _load_yaml_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """YAMLファイルを読み込む
+
+    キーにファイルの更新時刻とサイズを含めるため、変更されていないファイルは再パースしない。
+    戻り値はキャッシュと共有されるため、呼び出し側で変更しないこと。
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.safe_load(f)
+
+
+@lru_cache(maxsize=128)
+def _load_text_cached(path: str, mtime_ns: int, size: int) -> str:
+    """テキストファイルを読み込み前後の空白を除いて返す
+
+    未変更なら再読込・UTF-8の再デコードをせず、同じ文字列オブジェクトを返す。
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read().strip()
+
+
 @dataclass
 class OllamaConfig:
     """Ollama API設定"""
@@ -76,8 +104,7 @@ class Config:
             project_root = Path(__file__).parent.parent.parent
             config_path = project_root / "config" / "app_config.yaml"
 
-        with open(config_path, "r", encoding="utf-8") as f:
-            yaml_data: Dict[str, Any] = yaml.safe_load(f)
+        yaml_data: Dict[str, Any] = _load_yaml_cached(*_stat_key(config_path))
 
         # YAML構造から設定を抽出
         ollama_data = yaml_data.get("ollama", {})
@@ -91,9 +118,13 @@ class Config:
         system_prompt_file = ai_data.get("system_prompt_file")
         if system_prompt_file:
             prompt_path = config_path.parent.parent / system_prompt_file
-            if prompt_path.exists():
-                with open(prompt_path, "r", encoding="utf-8") as f:
-                    system_prompt = f.read().strip()
+            # 存在確認とキャッシュキー取得を1回のstatで行う（ファイルがなければNone）
+            try:
+                prompt_key = _stat_key(prompt_path)
+            except FileNotFoundError:
+                prompt_key = None
+            if prompt_key is not None:
+                system_prompt = _load_text_cached(*prompt_key)
 
         return cls(
             ollama=OllamaConfig(
@@ -9,8 +9,22 @@
 import logging
 import random
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import List, Optional, Tuple
+
+
+@lru_cache(maxsize=64)
+def _read_template_lines(path: str, mtime_ns: int, size: int) -> Tuple[str, ...]:
+    """テンプレートファイルから有効な行（空行・#コメント行以外）を読み込む
+
+    キーにファイルの更新時刻とサイズを含めるため、変更されていないファイルは
+    reload_templates() や別インスタンスからの読み込みでも再読込しない。
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        return tuple(
+            line for line in (raw.strip() for raw in f) if line and not line.startswith("#")
+        )
 
 
 class ProactivePromptManager:
@@ -26,8 +40,25 @@ class ProactivePromptManager:
         self.templates_dir = templates_dir
         self.logger = logging.getLogger(__name__)
         self.templates: List[str] = []
+        # 最後に読み込んだ時点のテンプレートファイル一覧（パス, 更新時刻, サイズ）
+        self._templates_key: Optional[Tuple[Tuple[str, int, int], ...]] = None
         self.load_templates()
 
+    def _snapshot_files(self) -> Optional[Tuple[Tuple[str, int, int], ...]]:
+        """テンプレートファイルの (パス, 更新時刻, サイズ) 一覧を返す（ディレクトリがなければNone）"""
+        if not self.templates_dir.exists():
+            return None
+
+        snapshot = []
+        for template_file in sorted(self.templates_dir.glob("*.txt")):
+            try:
+                stat = template_file.stat()
+            except OSError as e:
+                self.logger.error(f"Failed to stat template file {template_file}: {e}")
+                continue
+            snapshot.append((str(template_file), stat.st_mtime_ns, stat.st_size))
+        return tuple(snapshot)
+
     def load_templates(self) -> None:
         """
         テンプレートファイルを読み込む
@@ -35,19 +66,15 @@ class ProactivePromptManager:
         .txtファイルから行単位でテンプレートを読み込み、空行とコメント行（#で始まる）は無視する。
         """
         self.templates = []
+        self._templates_key = snapshot = self._snapshot_files()
 
-        if not self.templates_dir.exists():
+        if snapshot is None:
             self.logger.warning(f"Templates directory not found: {self.templates_dir}")
             return
 
-        for template_file in self.templates_dir.glob("*.txt"):
+        for template_file, mtime_ns, size in snapshot:
             try:
-                with open(template_file, "r", encoding="utf-8") as f:
-                    for line in f:
-                        line = line.strip()
-                        # 空行とコメント行をスキップ
-                        if line and not line.startswith("#"):
-                            self.templates.append(line)
+                self.templates.extend(_read_template_lines(template_file, mtime_ns, size))
                 self.logger.info(f"Loaded {len(self.templates)} templates from {template_file}")
             except Exception as e:
                 self.logger.error(f"Failed to load template file {template_file}: {e}")
@@ -96,9 +123,18 @@ class ProactivePromptManager:
             template: 追加するテンプレート文字列
         """
         self.templates.append(template)
+        # 次回のreload_templates()ではファイルから読み直す（追加分は破棄される）
+        self._templates_key = None
         self.logger.info(f"Added new template: {template}")
 
     def reload_templates(self) -> None:
-        """テンプレートファイルを再読み込み"""
+        """テンプレートファイルを再読み込み
+
+        前回の読み込みからファイルの追加・削除・更新がなければ何もしない。
+        """
+        if self._templates_key is not None and self._snapshot_files() == self._templates_key:
+            self.logger.debug("Templates unchanged, skipping reload")
+            return
+
         self.logger.info("Reloading templates...")
         self.load_templates()
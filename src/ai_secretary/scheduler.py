@@ -11,7 +11,7 @@ import logging
 import threading
 import time
 from collections import deque
-from typing import Any, Deque, Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, List, Optional
 
 from .prompt_templates import ProactivePromptManager
 
@@ -25,6 +25,7 @@ class ProactiveChatScheduler:
         prompt_manager: ProactivePromptManager,
         interval_seconds: int = 300,  # デフォルト5分
         max_queue_size: int = 10,
+        worker_factory: Callable[..., Any] = threading.Thread,
     ):
         """
         初期化
@@ -34,12 +35,16 @@ class ProactiveChatScheduler:
             prompt_manager: プロンプトテンプレート管理インスタンス
             interval_seconds: 実行間隔（秒）
             max_queue_size: メッセージキューの最大サイズ
+            worker_factory: バックグラウンドワーカーの生成関数
+                （target, daemonを受け取りstart/join/is_aliveを持つオブジェクトを返す。
+                テストではスレッドを生成しないダミーを注入できる）
         """
         self.secretary = secretary
         self.prompt_manager = prompt_manager
         self.interval_seconds = interval_seconds
         self.max_queue_size = max_queue_size
         self.logger = logging.getLogger(__name__)
+        self._worker_factory = worker_factory
 
         # 状態管理
         self._enabled = False
@@ -49,8 +54,9 @@ class ProactiveChatScheduler:
         # メッセージキュー
         self._message_queue: Deque[Dict[str, Any]] = deque(maxlen=max_queue_size)
 
-        # スレッド
-        self._thread: Optional[threading.Thread] = None
+        # スレッド（待機中のループはstop()で_stop_eventをセットすると即座に抜ける）
+        self._thread: Optional[Any] = None
+        self._stop_event = threading.Event()
 
     def start(self) -> None:
         """スケジューラーを開始（バックグラウンドスレッド起動）"""
@@ -60,7 +66,8 @@ class ProactiveChatScheduler:
                 return
 
             self._running = True
-            self._thread = threading.Thread(target=self._run_loop, daemon=True)
+            self._stop_event.clear()
+            self._thread = self._worker_factory(target=self._run_loop, daemon=True)
             self._thread.start()
             self.logger.info("Proactive chat scheduler started")
 
@@ -72,6 +79,7 @@ class ProactiveChatScheduler:
                 return
 
             self._running = False
+            self._stop_event.set()
             self.logger.info("Stopping proactive chat scheduler...")
 
         # スレッドの終了を待機
@@ -132,17 +140,14 @@ class ProactiveChatScheduler:
         self.logger.info("Scheduler loop started")
 
         while True:
+            # 次の実行まで待機（stop()が呼ばれたら待機途中でも即座に抜ける）
+            if self._stop_event.wait(self.interval_seconds):
+                break
+
             with self._lock:
                 if not self._running:
                     break
 
-            # 次の実行までスリープ（1秒ごとに停止確認）
-            for _ in range(self.interval_seconds):
-                with self._lock:
-                    if not self._running:
-                        return
-                time.sleep(1)
-
             # タスク実行
             self._run_task()
 
@@ -8,22 +8,18 @@ AI秘書のメインモジュール
   - ollama_client.OllamaClient: Ollama API通信
 """
 
+import importlib
 import json
 import logging
+import sys
 import uuid
 from datetime import date, datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from .config import Config
 from .mixins import BashWorkflowMixin, VoiceMixin
 from .ollama_client import OllamaClient
-from ..coeiroink_client import COEIROINKClient  # type: ignore
-
-try:
-    from ..audio_player import AudioPlayer  # type: ignore
-except Exception:  # pragma: no cover - AudioPlayerを利用できない環境向け
-    AudioPlayer = None  # type: ignore[assignment]
 
 try:
     from ..bash_executor import CommandExecutor  # type: ignore
@@ -35,6 +31,37 @@ try:
 except Exception:  # pragma: no cover - ChatHistoryを利用できない環境向け
     ChatHistoryRepository = None  # type: ignore[assignment]
 
+if TYPE_CHECKING:
+    from ..audio_player import AudioPlayer  # type: ignore
+    from ..coeiroink_client import COEIROINKClient  # type: ignore
+
+# requests / pyaudio を読み込むクライアントは初回使用時にimportする（モジュール属性として
+# 参照できるため、テストからの patch("src.ai_secretary.secretary.COEIROINKClient") も有効）
+_LAZY_CLASSES = {
+    "COEIROINKClient": ("..coeiroink_client", "COEIROINKClient"),
+    "AudioPlayer": ("..audio_player", "AudioPlayer"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """_LAZY_CLASSES のクラスを読み込んでモジュール属性にキャッシュする"""
+    if name not in _LAZY_CLASSES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attr = _LAZY_CLASSES[name]
+    try:
+        value = getattr(importlib.import_module(module_name, __package__), attr)
+    except Exception:  # pragma: no cover - AudioPlayerを利用できない環境向け
+        if name != "AudioPlayer":
+            raise
+        value = None
+    globals()[name] = value
+    return value
+
+
+def _lazy_class(name: str) -> Any:
+    """遅延読み込み対象のクラスを返す（patch済みならそのモックを返す）"""
+    return getattr(sys.modules[__name__], name)
+
 
 class AISecretary(VoiceMixin, BashWorkflowMixin):
     """AI秘書のメインクラス"""
@@ -43,7 +70,7 @@ class AISecretary(VoiceMixin, BashWorkflowMixin):
         self,
         config: Optional[Config] = None,
         ollama_client: Optional[OllamaClient] = None,
-        coeiroink_client: Optional[COEIROINKClient] = None,
+        coeiroink_client: Optional["COEIROINKClient"] = None,
         audio_player: Optional["AudioPlayer"] = None,
         bash_executor: Optional["CommandExecutor"] = None,
         chat_history_repo: Optional["ChatHistoryRepository"] = None,
@@ -71,12 +98,12 @@ class AISecretary(VoiceMixin, BashWorkflowMixin):
         )
 
         # COEIROINKクライアントとAudioPlayer
-        self.coeiro_client: Optional[COEIROINKClient]
+        self.coeiro_client: Optional["COEIROINKClient"]
         if coeiroink_client is not None:
             self.coeiro_client = coeiroink_client
         else:
             try:
-                self.coeiro_client = COEIROINKClient(
+                self.coeiro_client = _lazy_class("COEIROINKClient")(
                     api_url=self.config.coeiroink_api_url
                 )
             except Exception as e:  # pragma: no cover - 実行環境依存
@@ -84,9 +111,10 @@ class AISecretary(VoiceMixin, BashWorkflowMixin):
                 self.coeiro_client = None
 
         self.audio_player: Optional["AudioPlayer"] = audio_player
-        if self.audio_player is None and AudioPlayer is not None:
+        audio_player_class = _lazy_class("AudioPlayer") if audio_player is None else None
+        if self.audio_player is None and audio_player_class is not None:
             try:
-                self.audio_player = AudioPlayer()
+                self.audio_player = audio_player_class()
             except Exception as e:  # pragma: no cover - 実行環境依存
                 self.logger.error(f"AudioPlayer初期化失敗: {e}")
                 self.audio_player = None
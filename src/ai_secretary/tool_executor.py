@@ -20,7 +20,7 @@ from typing import Any, Dict, List, Optional
 
 import yaml
 
-from src.bash_executor.bash_script_executor import BashScriptExecutor
+from src.bash_executor import BashScriptExecutor
 
 
 class ToolRegistry:
@@ -12,6 +12,8 @@ Example:
     >>> print(result['stdout'])
 """
 
+from typing import Optional
+
 from .exceptions import (
     BashExecutorError,
     SecurityError,
@@ -44,12 +46,18 @@ __all__ = [
 ]
 
 
-def create_executor(config_path: str = "config/bash_executor/config.yaml") -> CommandExecutor:
+def create_executor(
+    config_path: str = "config/bash_executor/config.yaml",
+    root_dir: Optional[str] = None,
+    timeout: Optional[float] = None,
+) -> CommandExecutor:
     """
     デフォルト設定でCommandExecutorを作成するファクトリー関数
 
     Args:
         config_path: 設定ファイルのパス
+        root_dir: ルートディレクトリ（Noneの場合は設定ファイルの値を使用）
+        timeout: タイムアウト秒数（Noneの場合は設定ファイルの値を使用）
 
     Returns:
         設定済みのCommandExecutorインスタンス
@@ -77,9 +85,11 @@ def create_executor(config_path: str = "config/bash_executor/config.yaml") -> Co
         validator = CommandValidator(allowed_commands, block_patterns)
 
         # Executor作成
-        root_dir = config.get("executor.root_dir", ".")
+        if root_dir is None:
+            root_dir = config.get("executor.root_dir", ".")
         shell = config.get("executor.shell", "/bin/bash")
-        timeout = config.get("executor.timeout", 30)
+        if timeout is None:
+            timeout = config.get("executor.timeout", 30)
 
         executor = CommandExecutor(
             root_dir=root_dir, validator=validator, shell=shell, timeout=timeout
@@ -18,6 +18,8 @@ from pathlib import Path
 from typing import Optional, Dict, Any, List
 from dataclasses import dataclass
 
+from src.utils import jsonio
+
 logger = logging.getLogger(__name__)
 
 
@@ -35,8 +37,8 @@ class BashResult:
 class BashScriptExecutor:
     """安全なBASHスクリプト実行器"""
 
-    # ホワイトリスト: 実行許可するスクリプト
-    ALLOWED_SCRIPTS = {
+    # ホワイトリスト: 実行許可するスクリプト（実行時に書き換えられないようfrozenset）
+    ALLOWED_SCRIPTS = frozenset({
         "journal/init_db.sh",
         "journal/migrate_todos.sh",
         "journal/log_entry.sh",
@@ -46,15 +48,15 @@ class BashScriptExecutor:
         "journal/delete_entry.sh",
         "journal/link_todo.sh",
         "journal/generate_summary.sh",
-    }
+    })
 
     def __init__(self, scripts_dir: Path = Path("scripts"), timeout: int = 30):
         """
         Args:
-            scripts_dir: スクリプトディレクトリ
+            scripts_dir: スクリプトディレクトリ（生成時のカレントディレクトリ基準で絶対パス化）
             timeout: タイムアウト（秒）
         """
-        self.scripts_dir = scripts_dir
+        self.scripts_dir = Path(scripts_dir).resolve()
         self.timeout = timeout
 
     def execute(
@@ -107,7 +109,7 @@ class BashScriptExecutor:
 
             if parse_json and success and result.stdout.strip():
                 try:
-                    parsed_json = json.loads(result.stdout)
+                    parsed_json = jsonio.loads(result.stdout)
                 except json.JSONDecodeError as e:
                     logger.warning(f"Failed to parse JSON: {e}")
 
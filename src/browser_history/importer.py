@@ -2,14 +2,11 @@
 
 from __future__ import annotations
 
-import shutil
-import sqlite3
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Optional
 
-from .models import BrowserHistoryEntry
-from .repository import BrowserHistoryRepository
+from .repository import CHROMIUM_EPOCH_OFFSET, BrowserHistoryRepository
 
 
 class BraveHistoryImporter:
@@ -21,7 +18,7 @@ class BraveHistoryImporter:
     """
 
     # Chromiumエポック（1601年1月1日）からUnixエポック（1970年1月1日）までの秒数
-    UNIX_EPOCH_OFFSET = 11_644_473_600
+    UNIX_EPOCH_OFFSET = CHROMIUM_EPOCH_OFFSET
 
     def __init__(self, repository: Optional[BrowserHistoryRepository] = None):
         """
@@ -30,8 +27,8 @@ class BraveHistoryImporter:
         """
         self.repository = repository or BrowserHistoryRepository()
 
-    @staticmethod
-    def chromium_to_datetime(chromium_timestamp: int) -> datetime:
+    @classmethod
+    def chromium_to_datetime(cls, chromium_timestamp: int) -> datetime:
         """
         Chromiumタイムスタンプ（マイクロ秒）をdatetimeに変換
 
@@ -41,9 +38,10 @@ class BraveHistoryImporter:
         Returns:
             Pythonのdatetimeオブジェクト
         """
-        # マイクロ秒を秒に変換し、Unixエポックからのオフセットを引く
-        unix_timestamp = (chromium_timestamp / 1_000_000) - BraveHistoryImporter.UNIX_EPOCH_OFFSET
-        return datetime.fromtimestamp(unix_timestamp)
+        # 整数のまま秒とマイクロ秒に分ける（浮動小数点の丸め誤差を避ける）
+        seconds, micros = divmod(chromium_timestamp, 1_000_000)
+        seconds -= cls.UNIX_EPOCH_OFFSET
+        return datetime.fromtimestamp(seconds).replace(microsecond=micros)
 
     def find_brave_history_path(self) -> Optional[Path]:
         """
@@ -106,109 +104,22 @@ class BraveHistoryImporter:
             if brave_history_path is None:
                 raise FileNotFoundError("Brave History file not found")
 
-        # 一時コピー作成（ブラウザ起動中のロック回避）
-        temp_copy = Path("/tmp/brave_history_temp.db")
-        try:
-            shutil.copy(brave_history_path, temp_copy)
-        except Exception as e:
-            raise IOError(f"Failed to copy History file: {e}") from e
-
-        try:
-            entries = self._read_brave_history(temp_copy, limit, since)
-            imported_count = 0
-            last_visit_time = None
-
-            for entry in entries:
-                added_entry = self.repository.add_entry(entry)
-
-                # 重複でない場合のみカウント
-                if added_entry is not None:
-                    imported_count += 1
-
-                    # 最新の訪問時刻を記録
-                    if last_visit_time is None or entry.visit_time > last_visit_time:
-                        last_visit_time = entry.visit_time
-
-            # インポートログを記録
-            if imported_count > 0:
-                self.repository.log_import(
-                    str(brave_history_path),
-                    imported_count,
-                    last_visit_time.isoformat() if last_visit_time else None,
-                )
-
-            return imported_count
-
-        finally:
-            # 一時ファイル削除
-            temp_copy.unlink(missing_ok=True)
-
-    def _read_brave_history(
-        self,
-        db_path: Path,
-        limit: Optional[int] = None,
-        since: Optional[datetime] = None,
-    ) -> List[BrowserHistoryEntry]:
-        """
-        Brave履歴データベースから履歴を読み取る
-
-        Args:
-            db_path: 履歴データベースのパス
-            limit: 取得件数上限
-            since: この日時以降のみ取得
-
-        Returns:
-            履歴エントリのリスト
-        """
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-
-        # クエリ構築
-        query = """
-            SELECT
-                v.id as visit_id,
-                u.id as url_id,
-                u.url,
-                u.title,
-                v.visit_time,
-                v.transition,
-                u.visit_count
-            FROM visits v
-            JOIN urls u ON v.url = u.id
-            ORDER BY v.visit_time DESC
-        """
-
-        if limit:
-            query += f" LIMIT {limit}"
-
-        try:
-            cursor.execute(query)
-            rows = cursor.fetchall()
-        finally:
-            conn.close()
-
-        # データ変換
-        entries = []
-        for row in rows:
-            visit_id, url_id, url, title, visit_time, transition, visit_count = row
-
-            # タイムスタンプ変換
-            dt = self.chromium_to_datetime(visit_time)
-
-            # since フィルタ
-            if since and dt < since:
-                continue
-
-            entry = BrowserHistoryEntry(
-                url=url,
-                title=title,
-                visit_time=dt,
-                visit_count=visit_count,
-                transition_type=transition,
-                brave_url_id=url_id,
-                brave_visit_id=visit_id,
+        brave_history_path = Path(brave_history_path)
+        if not brave_history_path.is_file():
+            raise FileNotFoundError(f"Brave History file not found: {brave_history_path}")
+
+        # コピーせず読み取り専用URIで直接開く。immutable=1でロックを取らないため
+        # ブラウザ起動中でもロック待ちにならない（-wal側の未チェックポイント分は読まない）
+        brave_uri = f"{brave_history_path.resolve().as_uri()}?mode=ro&immutable=1"
+        visit_times = self.repository.import_from_chromium_db(brave_uri, since, limit)
+        imported_count = len(visit_times)
+
+        # インポートログを記録
+        if imported_count > 0:
+            self.repository.log_import(
+                str(brave_history_path),
+                imported_count,
+                max(visit_times),
             )
 
-            entries.append(entry)
-
-        return entries
+        return imported_count
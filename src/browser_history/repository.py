@@ -6,10 +6,15 @@ import os
 import sqlite3
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, List, Optional, Union
+
+from src.utils.sqlite_schema import fts5_phrase
 
 from .models import BrowserHistoryEntry
 
+# Chromiumエポック（1601年1月1日）からUnixエポック（1970年1月1日）までの秒数
+CHROMIUM_EPOCH_OFFSET = 11_644_473_600
+
 
 class BrowserHistoryRepository:
     """
@@ -18,10 +23,12 @@ class BrowserHistoryRepository:
     統合DB（data/ai_secretary.db）のbrowser_historyテーブルを操作します。
     """
 
-    def __init__(self, db_path: Optional[Path] = None):
+    def __init__(self, db_path: Optional[Path] = None, fast_mode: bool = False):
         """
         Args:
-            db_path: データベースファイルパス（Noneの場合はデフォルト）
+            db_path: データベースファイルパス（Noneの場合はデフォルト）。
+                "file:" で始まる場合はSQLiteのURIとして扱う
+            fast_mode: TrueのときWAL + synchronous=NORMALで書き込みのfsyncを減らす
         """
         root = Path(__file__).resolve().parents[2]
         default_path = root / "data" / "ai_secretary.db"
@@ -34,18 +41,31 @@ class BrowserHistoryRepository:
         else:
             self.db_path = default_path
 
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.fast_mode = fast_mode
+        # "file:...?mode=memory&cache=shared" のようなURI指定はそのままSQLiteへ渡す
+        self._is_uri = str(self.db_path).startswith("file:")
+        if not self._is_uri:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._ensure_tables()
 
     def _connect(self) -> sqlite3.Connection:
-        """データベース接続を作成"""
-        conn = sqlite3.connect(self.db_path)
+        """データベース接続を作成
+
+        URI解釈は常に有効にする（通常のパスはそのままファイル名として扱われ、
+        ATTACH DATABASE に file: URI を渡せるようになる）。
+        """
+        conn = sqlite3.connect(str(self.db_path), uri=True)
         conn.row_factory = sqlite3.Row
+        if self.fast_mode:
+            conn.execute("PRAGMA synchronous=NORMAL")
         return conn
 
     def _ensure_tables(self) -> None:
         """テーブルを作成（存在しない場合）"""
         with self._connect() as conn:
+            if self.fast_mode:
+                conn.execute("PRAGMA journal_mode=WAL")
+
             # browser_historyテーブル
             conn.execute(
                 """
@@ -93,6 +113,56 @@ class BrowserHistoryRepository:
                 """
             )
 
+            # URL/タイトルの全文検索インデックス（trigramで部分一致検索に対応）
+            fts_exists = conn.execute(
+                """
+                SELECT 1 FROM sqlite_master
+                WHERE type = 'table' AND name = 'browser_history_fts'
+                """
+            ).fetchone()
+            conn.execute(
+                """
+                CREATE VIRTUAL TABLE IF NOT EXISTS browser_history_fts USING fts5(
+                    url, title,
+                    content='browser_history', content_rowid='id', tokenize='trigram'
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE TRIGGER IF NOT EXISTS browser_history_fts_ai
+                AFTER INSERT ON browser_history BEGIN
+                    INSERT INTO browser_history_fts(rowid, url, title)
+                    VALUES (new.id, new.url, new.title);
+                END
+                """
+            )
+            conn.execute(
+                """
+                CREATE TRIGGER IF NOT EXISTS browser_history_fts_ad
+                AFTER DELETE ON browser_history BEGIN
+                    INSERT INTO browser_history_fts(browser_history_fts, rowid, url, title)
+                    VALUES ('delete', old.id, old.url, old.title);
+                END
+                """
+            )
+            conn.execute(
+                """
+                CREATE TRIGGER IF NOT EXISTS browser_history_fts_au
+                AFTER UPDATE ON browser_history BEGIN
+                    INSERT INTO browser_history_fts(browser_history_fts, rowid, url, title)
+                    VALUES ('delete', old.id, old.url, old.title);
+                    INSERT INTO browser_history_fts(rowid, url, title)
+                    VALUES (new.id, new.url, new.title);
+                END
+                """
+            )
+            if not fts_exists:
+                # 既存DBに後から追加した場合は既存行から索引を構築
+                conn.execute(
+                    "INSERT INTO browser_history_fts(browser_history_fts) VALUES ('rebuild')"
+                )
+
             # browser_import_logテーブル
             conn.execute(
                 """
@@ -128,35 +198,157 @@ class BrowserHistoryRepository:
         now = datetime.now(timezone.utc).isoformat()
 
         with self._connect() as conn:
-            try:
-                cursor = conn.execute(
-                    """
-                    INSERT INTO browser_history (
-                        url, title, visit_time, visit_count,
-                        transition_type, source_browser, imported_at,
-                        brave_url_id, brave_visit_id
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        entry.url,
-                        entry.title,
-                        entry.visit_time.isoformat(),
-                        entry.visit_count,
-                        entry.transition_type,
-                        entry.source_browser,
-                        now,
-                        entry.brave_url_id,
-                        entry.brave_visit_id,
-                    ),
+            # 重複（同一ブラウザの同一visit）はON CONFLICTで無視し、挿入時のみidが返る
+            row = conn.execute(
+                """
+                INSERT INTO browser_history (
+                    url, title, visit_time, visit_count,
+                    transition_type, source_browser, imported_at,
+                    brave_url_id, brave_visit_id
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (source_browser, brave_visit_id)
+                    WHERE brave_visit_id IS NOT NULL DO NOTHING
+                RETURNING id
+                """,
+                (
+                    entry.url,
+                    entry.title,
+                    entry.visit_time.isoformat(),
+                    entry.visit_count,
+                    entry.transition_type,
+                    entry.source_browser,
+                    now,
+                    entry.brave_url_id,
+                    entry.brave_visit_id,
+                ),
+            ).fetchone()
+            conn.commit()
+
+        if row is None:
+            return None
+
+        entry.id = row["id"]
+        entry.imported_at = datetime.fromisoformat(now)
+        return entry
+
+    def add_entries(self, entries: Iterable[BrowserHistoryEntry]) -> int:
+        """
+        履歴エントリをまとめて追加（1トランザクション、重複は無視）
+
+        Args:
+            entries: 追加するエントリ
+
+        Returns:
+            実際に追加された件数
+        """
+        now = datetime.now(timezone.utc).isoformat()
+        rows = [
+            (
+                entry.url,
+                entry.title,
+                entry.visit_time.isoformat(),
+                entry.visit_count,
+                entry.transition_type,
+                entry.source_browser,
+                now,
+                entry.brave_url_id,
+                entry.brave_visit_id,
+            )
+            for entry in entries
+        ]
+        if not rows:
+            return 0
+
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            cursor = conn.executemany(
+                """
+                INSERT INTO browser_history (
+                    url, title, visit_time, visit_count,
+                    transition_type, source_browser, imported_at,
+                    brave_url_id, brave_visit_id
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (source_browser, brave_visit_id)
+                    WHERE brave_visit_id IS NOT NULL DO NOTHING
+                """,
+                rows,
+            )
+            return cursor.rowcount
+
+    def import_from_chromium_db(
+        self,
+        db_path: Union[Path, str],
+        since: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        source_browser: str = "brave",
+    ) -> List[str]:
+        """
+        Chromium系ブラウザの履歴DBをATTACHし、INSERT ... SELECTでSQLite内だけで取り込む
+
+        タイムスタンプ変換もSQL内で行い、行ごとにPythonを経由しない。
+        visit_timeはBraveHistoryImporter.chromium_to_datetime(...).isoformat()と
+        同じ形式で保存する。既に取り込んだ訪問（brave_visit_id）は無視する。
+
+        Args:
+            db_path: 履歴データベースのパスまたは file: URI
+            since: この日時以降のみ取得
+            limit: 取得件数上限（新しい順）
+            source_browser: 保存するブラウザ種別
+
+        Returns:
+            実際に追加された行のvisit_time（ISO形式）のリスト
+        """
+        since_chromium = 0
+        if since:
+            since_chromium = int((since.timestamp() + CHROMIUM_EPOCH_OFFSET) * 1_000_000)
+        now = datetime.now(timezone.utc).isoformat()
+
+        conn = self._connect()
+        try:
+            conn.execute("ATTACH DATABASE ? AS brave", (str(db_path),))
+            rows = conn.execute(
+                """
+                INSERT INTO browser_history (
+                    url, title, visit_time, visit_count,
+                    transition_type, source_browser, imported_at,
+                    brave_url_id, brave_visit_id
+                )
+                SELECT url, title, visit_time, visit_count, transition, ?, ?,
+                       url_id, visit_id
+                FROM (
+                    SELECT
+                        u.url,
+                        u.title,
+                        strftime(
+                            '%Y-%m-%dT%H:%M:%S',
+                            v.visit_time / 1000000 - ?, 'unixepoch', 'localtime'
+                        ) || CASE
+                            WHEN v.visit_time % 1000000 = 0 THEN ''
+                            ELSE printf('.%06d', v.visit_time % 1000000)
+                        END AS visit_time,
+                        u.visit_count,
+                        v.transition,
+                        u.id AS url_id,
+                        v.id AS visit_id
+                    FROM brave.visits v
+                    JOIN brave.urls u ON v.url = u.id
+                    WHERE v.visit_time >= ?
+                    ORDER BY v.visit_time DESC
+                    LIMIT ?
                 )
-                entry.id = cursor.lastrowid
-                entry.imported_at = datetime.fromisoformat(now)
-                conn.commit()
-                return entry
-            except sqlite3.IntegrityError:
-                # 重複エントリは無視
-                conn.rollback()
-                return None
+                WHERE true
+                ON CONFLICT (source_browser, brave_visit_id)
+                    WHERE brave_visit_id IS NOT NULL DO NOTHING
+                RETURNING visit_time
+                """,
+                (source_browser, now, CHROMIUM_EPOCH_OFFSET, since_chromium, limit or -1),
+            ).fetchall()
+            conn.commit()
+            conn.execute("DETACH DATABASE brave")
+        finally:
+            conn.close()
+
+        return [row["visit_time"] for row in rows]
 
     def get_entry(self, entry_id: int) -> Optional[BrowserHistoryEntry]:
         """
@@ -232,15 +424,30 @@ class BrowserHistoryRepository:
             マッチした履歴エントリのリスト
         """
         with self._connect() as conn:
-            rows = conn.execute(
-                """
-                SELECT * FROM browser_history
-                WHERE url LIKE ? OR title LIKE ?
-                ORDER BY visit_time DESC
-                LIMIT ?
-                """,
-                (f"%{query}%", f"%{query}%", limit),
-            ).fetchall()
+            if len(query) < 3:
+                # trigramは3文字未満を索引で引けないためLIKEで走査する
+                rows = conn.execute(
+                    """
+                    SELECT * FROM browser_history
+                    WHERE url LIKE ? OR title LIKE ?
+                    ORDER BY visit_time DESC
+                    LIMIT ?
+                    """,
+                    (f"%{query}%", f"%{query}%", limit),
+                ).fetchall()
+            else:
+                rows = conn.execute(
+                    """
+                    SELECT * FROM browser_history
+                    WHERE id IN (
+                        SELECT rowid FROM browser_history_fts
+                        WHERE browser_history_fts MATCH ?
+                    )
+                    ORDER BY visit_time DESC
+                    LIMIT ?
+                    """,
+                    (fts5_phrase(query), limit),
+                ).fetchall()
 
         return [self._row_to_entry(row) for row in rows]
 
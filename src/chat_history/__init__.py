@@ -5,10 +5,11 @@
 Design Reference: plan/P3_CHAT_HISTORY_PLAN_v2.md
 """
 
-from .models import ChatSession
+from .models import ChatSession, ChatSessionSummary
 from .repository import ChatHistoryRepository
 
 __all__ = [
     "ChatSession",
+    "ChatSessionSummary",
     "ChatHistoryRepository",
 ]
@@ -8,9 +8,10 @@ Related Classes: ChatHistoryRepository (repository.py)
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import List, Dict, Any
-import json
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional
+
+from src.utils import jsonio
 
 
 @dataclass(slots=True)
@@ -27,18 +28,32 @@ class ChatSession:
     messages_json: str  # JSON文字列（[{"role": "user", "content": "..."}, ...]）
     created_at: str  # ISO8601形式
     updated_at: str  # ISO8601形式
+    # messagesのパース結果キャッシュ（slots=Trueのためcached_propertyは使えない）
+    _messages_cache: Optional[List[Dict[str, Any]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def _parsed_messages(self) -> List[Dict[str, Any]]:
+        """パース済みのメッセージ配列（初回アクセス時のみJSONをデコード）"""
+        if self._messages_cache is None:
+            self._messages_cache = jsonio.loads(self.messages_json)
+        return self._messages_cache
 
     @property
     def messages(self) -> List[Dict[str, Any]]:
         """メッセージ履歴をパースして返す
 
+        キャッシュのリスト自体は渡さずコピーを返すため、呼び出し側で
+        append などをしても messages_json との整合は崩れない。
+        変更を保存する場合は set_messages を使う。
+
         Returns:
             メッセージ配列 [{"role": "user", "content": "..."}, ...]
 
         Raises:
             json.JSONDecodeError: 不正なJSON形式の場合
         """
-        return json.loads(self.messages_json)
+        return list(self._parsed_messages())
 
     def set_messages(self, messages: List[Dict[str, Any]]) -> None:
         """メッセージ履歴をJSON文字列に変換して設定
@@ -46,4 +61,26 @@ class ChatSession:
         Args:
             messages: メッセージ配列
         """
-        self.messages_json = json.dumps(messages, ensure_ascii=False)
+        self.messages_json = jsonio.dumps(messages)
+        self._messages_cache = None
+
+    @property
+    def message_count(self) -> int:
+        """メッセージ件数"""
+        return len(self._parsed_messages())
+
+
+@dataclass(slots=True)
+class ChatSessionSummary:
+    """一覧表示用のチャットセッション要約（messages_jsonを持たない）
+
+    list_sessions() の既定の戻り値。件数はSQL側で数えるため、
+    会話本文をページキャッシュから読み出さずに済む。
+    """
+
+    id: int
+    session_id: str
+    title: str
+    created_at: str  # ISO8601形式
+    updated_at: str  # ISO8601形式
+    message_count: int
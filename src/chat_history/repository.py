@@ -11,18 +11,31 @@ from __future__ import annotations
 
 import sqlite3
 import os
-import json
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable, Tuple, Union
 
-from .models import ChatSession
+from src.utils import jsonio
+from src.utils.sqlite_schema import fts5_phrase, schema_objects_exist
+
+from .models import ChatSession, ChatSessionSummary
 
 
 class ChatHistoryRepository:
     """SQLiteベースのチャット履歴管理。統合スキーマ対応版。"""
 
-    def __init__(self, db_path: Optional[Path] = None):
+    # create_session / create_sessions で同一のSQL文字列を使い、文キャッシュを共有する
+    _INSERT_SQL = (
+        "INSERT INTO chat_history (session_id, title, messages_json, created_at, updated_at)"
+        " VALUES (?, ?, ?, ?, ?)"
+    )
+
+    def __init__(self, db_path: Optional[Path] = None, fast_mode: bool = False):
+        """
+        Args:
+            db_path: データベースファイルパス（Noneの場合は環境変数/デフォルト）
+            fast_mode: TrueのときWAL + synchronous=NORMALで書き込みのfsyncを減らす
+        """
         root = Path(__file__).resolve().parents[2]
         default_path = root / "data" / "ai_secretary.db"  # 統合DBパス
         env_path = os.getenv("AI_SECRETARY_DB_PATH")
@@ -32,17 +45,39 @@ class ChatHistoryRepository:
             self.db_path = Path(env_path)
         else:
             self.db_path = default_path
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.fast_mode = fast_mode
+        # "file:...?mode=memory&cache=shared" のようなURI指定はそのままSQLiteへ渡す
+        self._is_uri = str(self.db_path).startswith("file:")
+        if not self._is_uri:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._initialize()
 
     def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
+        conn = sqlite3.connect(str(self.db_path), uri=self._is_uri)
         conn.row_factory = sqlite3.Row
+        if self.fast_mode:
+            conn.execute("PRAGMA synchronous=NORMAL")
         return conn
 
     def _initialize(self) -> None:
-        """統合スキーマでの初期化（chat_historyテーブル使用）"""
+        """統合スキーマでの初期化（chat_historyテーブル使用）
+
+        必要なテーブルが既にあればDDLを実行しない。
+        """
+        with self._connect() as conn:
+            if self.fast_mode:
+                conn.execute("PRAGMA journal_mode=WAL")
+            if schema_objects_exist(
+                conn, "chat_history", "chat_history_fts", "idx_chat_updated_session"
+            ):
+                return
+        self._ensure_schema()
+
+    def _ensure_schema(self) -> None:
+        """chat_historyテーブル・索引・全文検索を作成（存在しない場合）"""
         with self._connect() as conn:
+            if self.fast_mode:
+                conn.execute("PRAGMA journal_mode=WAL")
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS chat_history (
@@ -55,14 +90,64 @@ class ChatHistoryRepository:
                 )
                 """
             )
+            # session_idはUNIQUE制約の自動インデックスで引けるため、重複する索引は削除
+            conn.execute("DROP INDEX IF EXISTS idx_chat_session")
+            # 一覧のキーセットページングは (updated_at, session_id) で並べるため複合索引に置き換える
+            conn.execute("DROP INDEX IF EXISTS idx_chat_updated")
             conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_chat_session ON chat_history(session_id)"
-            )
-            conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_chat_updated ON chat_history(updated_at DESC)"
+                "CREATE INDEX IF NOT EXISTS idx_chat_updated_session"
+                " ON chat_history(updated_at DESC, session_id DESC)"
             )
+            self._ensure_fts(conn)
             conn.commit()
 
+    @staticmethod
+    def _ensure_fts(conn: sqlite3.Connection) -> None:
+        """title/messages_jsonの全文検索インデックス（FTS5, trigram）を作成
+
+        chat_historyを外部コンテンツとし、トリガーで同期する。
+        既存DBに後から作成した場合は既存行から索引を再構築する。
+        """
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'chat_history_fts'"
+        ).fetchone()
+        conn.execute(
+            """
+            CREATE VIRTUAL TABLE IF NOT EXISTS chat_history_fts USING fts5(
+                title, messages_json,
+                content='chat_history', content_rowid='id', tokenize='trigram'
+            )
+            """
+        )
+        conn.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS chat_history_fts_ai AFTER INSERT ON chat_history BEGIN
+                INSERT INTO chat_history_fts(rowid, title, messages_json)
+                VALUES (new.id, new.title, new.messages_json);
+            END
+            """
+        )
+        conn.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS chat_history_fts_ad AFTER DELETE ON chat_history BEGIN
+                INSERT INTO chat_history_fts(chat_history_fts, rowid, title, messages_json)
+                VALUES ('delete', old.id, old.title, old.messages_json);
+            END
+            """
+        )
+        conn.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS chat_history_fts_au AFTER UPDATE ON chat_history BEGIN
+                INSERT INTO chat_history_fts(chat_history_fts, rowid, title, messages_json)
+                VALUES ('delete', old.id, old.title, old.messages_json);
+                INSERT INTO chat_history_fts(rowid, title, messages_json)
+                VALUES (new.id, new.title, new.messages_json);
+            END
+            """
+        )
+        if not exists:
+            conn.execute("INSERT INTO chat_history_fts(chat_history_fts) VALUES ('rebuild')")
+
     @staticmethod
     def _now() -> str:
         return datetime.now(timezone.utc).isoformat()
@@ -79,7 +164,11 @@ class ChatHistoryRepository:
         )
 
     def create_session(
-        self, session_id: str, title: str, messages: List[Dict[str, Any]]
+        self,
+        session_id: str,
+        title: str,
+        messages: List[Dict[str, Any]],
+        created_at: Optional[datetime] = None,
     ) -> ChatSession:
         """新規チャットセッションを作成
 
@@ -87,6 +176,7 @@ class ChatHistoryRepository:
             session_id: セッションID（UUID推奨）
             title: セッションのタイトル
             messages: メッセージ配列 [{"role": "user", "content": "..."}, ...]
+            created_at: 作成日時（Noneの場合は現在時刻。updated_atにも同じ値を使う）
 
         Returns:
             作成されたChatSessionオブジェクト
@@ -94,15 +184,12 @@ class ChatHistoryRepository:
         Raises:
             sqlite3.IntegrityError: session_idが重複している場合
         """
-        now = self._now()
-        messages_json = json.dumps(messages, ensure_ascii=False)
+        now = created_at.isoformat() if created_at else self._now()
+        messages_json = jsonio.dumps(messages)
 
         with self._connect() as conn:
             cursor = conn.execute(
-                """
-                INSERT INTO chat_history (session_id, title, messages_json, created_at, updated_at)
-                VALUES (?, ?, ?, ?, ?)
-                """,
+                self._INSERT_SQL,
                 (session_id, title, messages_json, now, now),
             )
             conn.commit()
@@ -112,6 +199,36 @@ class ChatHistoryRepository:
             ).fetchone()
         return self._row_to_session(row)
 
+    def create_sessions(
+        self, sessions: Iterable[Tuple[str, str, List[Dict[str, Any]]]]
+    ) -> int:
+        """複数のチャットセッションを1トランザクションでまとめて作成
+
+        Args:
+            sessions: (session_id, title, messages) のイテラブル
+
+        Returns:
+            作成された件数
+
+        Raises:
+            sqlite3.IntegrityError: session_idが重複している場合（全件ロールバック）
+        """
+        now = self._now()
+        rows = [
+            (session_id, title, jsonio.dumps(messages), now, now)
+            for session_id, title, messages in sessions
+        ]
+        if not rows:
+            return 0
+
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            cursor = conn.executemany(
+                self._INSERT_SQL,
+                rows,
+            )
+            return cursor.rowcount
+
     def update_session(
         self, session_id: str, messages: List[Dict[str, Any]], title: Optional[str] = None
     ) -> Optional[ChatSession]:
@@ -125,7 +242,7 @@ class ChatHistoryRepository:
         Returns:
             更新後のChatSessionオブジェクト、存在しない場合はNone
         """
-        messages_json = json.dumps(messages, ensure_ascii=False)
+        messages_json = jsonio.dumps(messages)
         now = self._now()
 
         with self._connect() as conn:
@@ -188,25 +305,86 @@ class ChatHistoryRepository:
             ).fetchone()
         return self._row_to_session(row) if row else None
 
-    def list_sessions(self, limit: int = 20) -> List[ChatSession]:
-        """セッション一覧を取得（新しい順）
+    def count_messages_by_role(self, session_id: str, role: str) -> int:
+        """セッション内の指定ロールのメッセージ数を数える（JSONのデコードはSQLite側で行う）
+
+        Args:
+            session_id: セッションID
+            role: メッセージのロール（"user", "assistant" など）
+
+        Returns:
+            メッセージ数（セッションが存在しない場合は0）
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                """
+                SELECT COUNT(*) FROM json_each(
+                    (SELECT messages_json FROM chat_history WHERE session_id = ?)
+                )
+                WHERE json_extract(value, '$.role') = ?
+                """,
+                (session_id, role),
+            ).fetchone()
+        return row[0]
+
+    def list_sessions(
+        self,
+        limit: int = 20,
+        include_messages: bool = False,
+        before_updated_at: Optional[Union[datetime, str]] = None,
+        before_session_id: Optional[str] = None,
+    ) -> Union[List[ChatSessionSummary], List[ChatSession]]:
+        """セッション一覧を取得（新しい順。同時刻はsession_idの降順）
+
+        OFFSETは使わず、前ページ最後の updated_at / session_id を
+        before_updated_at / before_session_id に渡して次ページを取得する
+        （キーセット方式。idx_chat_updated_session を範囲走査する）。
+        create_sessions のように同じupdated_atの行がページ境界をまたいでも
+        取りこぼさないよう、両方を渡すこと。
 
         Args:
             limit: 取得する最大件数
+            include_messages: Trueの場合はmessages_jsonを含むChatSessionを返す
+            before_updated_at: 指定時はこれより古いセッションのみ返す
+            before_session_id: before_updated_atと同時刻の行のうち、
+                これより小さいsession_idのセッションのみ返す
 
         Returns:
-            ChatSessionオブジェクトのリスト
+            ChatSessionSummaryのリスト（include_messages=TrueならChatSessionのリスト）
         """
+        # messages_jsonは件数だけSQL側で数え、本文はPythonへ持ち出さない
+        columns = (
+            "*"
+            if include_messages
+            else "id, session_id, title, created_at, updated_at, "
+            "json_array_length(messages_json) AS message_count"
+        )
+        where = ""
+        params: List[Any] = []
+        if before_updated_at is not None:
+            if isinstance(before_updated_at, datetime):
+                before_updated_at = before_updated_at.isoformat()
+            if before_session_id is not None:
+                where = "WHERE (updated_at, session_id) < (?, ?)"
+                params.extend((before_updated_at, before_session_id))
+            else:
+                where = "WHERE updated_at < ?"
+                params.append(before_updated_at)
+        params.append(limit)
+
         with self._connect() as conn:
             rows = conn.execute(
-                """
-                SELECT * FROM chat_history
-                ORDER BY updated_at DESC
+                f"""
+                SELECT {columns} FROM chat_history
+                {where}
+                ORDER BY updated_at DESC, session_id DESC
                 LIMIT ?
                 """,
-                (limit,),
+                params,
             ).fetchall()
-        return [self._row_to_session(row) for row in rows]
+        if include_messages:
+            return [self._row_to_session(row) for row in rows]
+        return [ChatSessionSummary(**dict(row)) for row in rows]
 
     def search_sessions(self, query: str, limit: int = 20) -> List[ChatSession]:
         """タイトルまたはメッセージ内容で検索
@@ -218,17 +396,31 @@ class ChatHistoryRepository:
         Returns:
             ChatSessionオブジェクトのリスト
         """
-        search_pattern = f"%{query}%"
         with self._connect() as conn:
-            rows = conn.execute(
-                """
-                SELECT * FROM chat_history
-                WHERE title LIKE ? OR messages_json LIKE ?
-                ORDER BY updated_at DESC
-                LIMIT ?
-                """,
-                (search_pattern, search_pattern, limit),
-            ).fetchall()
+            if len(query) < 3:
+                # trigramは3文字未満を索引で引けないためLIKEで走査する
+                search_pattern = f"%{query}%"
+                rows = conn.execute(
+                    """
+                    SELECT * FROM chat_history
+                    WHERE title LIKE ? OR messages_json LIKE ?
+                    ORDER BY updated_at DESC
+                    LIMIT ?
+                    """,
+                    (search_pattern, search_pattern, limit),
+                ).fetchall()
+            else:
+                rows = conn.execute(
+                    """
+                    SELECT * FROM chat_history
+                    WHERE id IN (
+                        SELECT rowid FROM chat_history_fts WHERE chat_history_fts MATCH ?
+                    )
+                    ORDER BY updated_at DESC
+                    LIMIT ?
+                    """,
+                    (fts5_phrase(query), limit),
+                ).fetchall()
         return [self._row_to_session(row) for row in rows]
 
     def delete_session(self, session_id: str) -> bool:
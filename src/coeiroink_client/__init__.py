@@ -3,9 +3,13 @@
 詳細な使い方は ``doc/COEIROINK_CLIENT_OVERVIEW.md`` を参照してください。
 """
 
-from .client import COEIROINKClient
+from typing import TYPE_CHECKING, Any
+
 from .models import ProsodyMora, Speaker, SynthesisRequest, VoiceParameters
 
+if TYPE_CHECKING:
+    from .client import COEIROINKClient
+
 __all__ = [
     "COEIROINKClient",
     "ProsodyMora",
@@ -13,3 +17,12 @@ __all__ = [
     "SynthesisRequest",
     "VoiceParameters",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """COEIROINKClient は requests を読み込むため、初回参照時にimportする"""
+    if name == "COEIROINKClient":
+        from .client import COEIROINKClient
+
+        return COEIROINKClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
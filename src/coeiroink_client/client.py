@@ -4,8 +4,9 @@ from __future__ import annotations
 
 import json
 import logging
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import requests
 
@@ -14,6 +15,19 @@ from .models import Speaker, VoiceParameters, SynthesisRequest
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=8)
+def _fetch_speakers(api_url: str) -> Tuple[Dict[str, Any], ...]:
+    """/v1/speakers の応答をAPI URLごとにキャッシュして返す
+
+    スピーカー一覧はほぼ変わらないため、クライアントを作り直しても再取得しない。
+    取得失敗（例外）はキャッシュされない。スピーカーの追加・削除を反映するには
+    ``COEIROINKClient.refresh_speakers()`` を呼ぶ。
+    """
+    response = requests.get(f"{api_url}/v1/speakers", timeout=5)
+    response.raise_for_status()
+    return tuple(response.json())
+
+
 class COEIROINKClient:
     """
     COEIROINKのAPIクライアント
@@ -32,24 +46,31 @@ class COEIROINKClient:
 
     def _load_speakers(self) -> None:
         """利用可能なスピーカー情報をAPIから取得"""
+        speakers: Dict[str, Speaker] = {}
         try:
-            response = requests.get(f"{self.api_url}/v1/speakers", timeout=5)
-            response.raise_for_status()
-
-            for item in response.json():
+            for item in _fetch_speakers(self.api_url):
                 speaker = Speaker(
                     speaker_name=item['speakerName'],
                     speaker_uuid=item['speakerUuid'],
                     styles=item['styles'],
                     version=item['version']
                 )
-                self.speakers[speaker.speaker_name] = speaker
+                speakers[speaker.speaker_name] = speaker
 
+            self.speakers = speakers
             logger.info(f"スピーカー {len(self.speakers)} 個を読み込みました")
         except requests.exceptions.RequestException as e:
             logger.error(f"スピーカー情報の取得に失敗: {e}")
             raise
 
+    def refresh_speakers(self) -> None:
+        """スピーカー一覧のキャッシュを破棄してAPIから取得し直す
+
+        取得に失敗した場合は例外を送出し、現在のスピーカー一覧はそのまま残る。
+        """
+        _fetch_speakers.cache_clear()
+        self._load_speakers()
+
     def list_speakers(self) -> List[str]:
         """利用可能なスピーカー名のリストを返す"""
         return list(self.speakers.keys())
@@ -179,11 +200,13 @@ class COEIROINKClient:
         self,
         text_segments: List[Dict[str, Any]],
         output_path: Optional[Path] = None
-    ) -> List[bytes]:
+    ) -> Iterator[bytes]:
         """
         感情付き音声合成
 
-        テキストセグメントごとに異なるパラメータで合成
+        テキストセグメントごとに異なるパラメータで合成する。
+        合成はイテレート時に1セグメントずつ行うため、全セグメントの音声を
+        同時にメモリへ保持しない（一覧が必要なら list() で受け取る）。
 
         Args:
             text_segments: セグメントリスト
@@ -198,28 +221,26 @@ class COEIROINKClient:
                 ]
             output_path: 結合音声の保存先(Noneの場合は結合しない)
 
-        Returns:
-            各セグメントの音声データリスト
+        Yields:
+            各セグメントの音声データ（セグメント順）
         """
-        audio_segments = []
+        total = len(text_segments)
 
         for i, segment in enumerate(text_segments):
-            logger.info(f"セグメント {i+1}/{len(text_segments)} を合成中...")
+            logger.info(f"セグメント {i+1}/{total} を合成中...")
 
-            audio = self.synthesize(
+            yield self.synthesize(
                 text=segment['text'],
                 speaker_name=segment['speaker_name'],
                 style_name=segment.get('style_name'),
                 parameters=segment.get('parameters'),
                 use_prosody=segment.get('use_prosody', False)
             )
-            audio_segments.append(audio)
 
         # 音声結合が必要な場合はffmpegなどを使用
         # ここでは個別の音声を返すのみ
 
-        logger.info(f"全 {len(audio_segments)} セグメントの合成完了")
-        return audio_segments
+        logger.info(f"全 {total} セグメントの合成完了")
 
     def export_speaker_info(self, output_path: Path) -> None:
         """スピーカー情報をJSONファイルに出力"""
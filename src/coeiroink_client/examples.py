@@ -84,8 +84,10 @@ def example_multi_segment():
         }
     ]
 
-    audio_list = client.synthesize_with_emotions(segments)
-    print(f"{len(audio_list)} セグメントの音声を生成しました")
+    count = 0
+    for count, audio in enumerate(client.synthesize_with_emotions(segments), start=1):
+        print(f"セグメント {count}: {len(audio)} bytes")
+    print(f"{count} セグメントの音声を生成しました")
 
 
 def example_export_speakers():
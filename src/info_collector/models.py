@@ -13,7 +13,10 @@ from pydantic import BaseModel, Field
 
 
 class CollectedInfo(BaseModel):
-    """収集された情報の統合モデル"""
+    """収集された情報の統合モデル
+
+    生成後は変更しない値オブジェクトとして扱う（frozen）。
+    """
 
     id: Optional[int] = None
     source_type: str = Field(..., description="情報ソースタイプ: 'search', 'rss', 'news'")
@@ -32,6 +35,7 @@ class CollectedInfo(BaseModel):
 
     class Config:
         from_attributes = True
+        frozen = True
 
 
 class SearchResult(CollectedInfo):
@@ -10,7 +10,7 @@
 import sqlite3
 import json
 from datetime import datetime, timedelta
-from typing import Optional, List
+from typing import Iterable, Optional, List
 from pathlib import Path
 
 from .models import CollectedInfo, InfoSummary
@@ -19,18 +19,39 @@ from .models import CollectedInfo, InfoSummary
 class InfoCollectorRepository:
     """情報収集データのCRUD操作を提供するリポジトリ"""
 
+    # add_info / add_many で共有するINSERT文
+    _INSERT_INFO_SQL = """
+        INSERT INTO collected_info (
+            source_type, title, url, content, snippet,
+            published_at, fetched_at, source_name, metadata_json
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
     def __init__(self, db_path: str = "data/ai_secretary.db"):
+        """
+        Args:
+            db_path: DBファイルパス（"file:...?mode=memory&cache=shared" 等のURIも可）
+        """
         self.db_path = db_path
+        self._is_uri = str(db_path).startswith("file:")
         self._ensure_db_directory()
         self._init_tables()
 
     def _ensure_db_directory(self) -> None:
-        """DBディレクトリの存在確認・作成"""
+        """DBディレクトリの存在確認・作成（URI指定時は不要）"""
+        if self._is_uri:
+            return
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
 
+    def _connect(self) -> sqlite3.Connection:
+        """データベース接続を作成"""
+        conn = sqlite3.connect(self.db_path, uri=self._is_uri)
+        conn.row_factory = sqlite3.Row
+        return conn
+
     def _init_tables(self) -> None:
         """テーブル初期化（存在しない場合のみ作成）"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS collected_info (
@@ -87,6 +108,21 @@ class InfoCollectorRepository:
                 """
             )
 
+    @staticmethod
+    def _info_to_params(info: CollectedInfo) -> tuple:
+        """CollectedInfoをINSERT用のパラメータに変換"""
+        return (
+            info.source_type,
+            info.title,
+            info.url,
+            info.content,
+            info.snippet,
+            info.published_at.isoformat() if info.published_at else None,
+            info.fetched_at.isoformat(),
+            info.source_name,
+            json.dumps(info.metadata, ensure_ascii=False) if info.metadata else None,
+        )
+
     def add_info(self, info: CollectedInfo) -> Optional[int]:
         """
         情報を追加（重複時はスキップ）
@@ -97,40 +133,39 @@ class InfoCollectorRepository:
         Returns:
             追加されたレコードのID（重複時はNone）
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             try:
-                cursor = conn.execute(
-                    """
-                    INSERT INTO collected_info (
-                        source_type, title, url, content, snippet,
-                        published_at, fetched_at, source_name, metadata_json
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        info.source_type,
-                        info.title,
-                        info.url,
-                        info.content,
-                        info.snippet,
-                        info.published_at.isoformat()
-                        if info.published_at
-                        else None,
-                        info.fetched_at.isoformat(),
-                        info.source_name,
-                        json.dumps(info.metadata, ensure_ascii=False)
-                        if info.metadata
-                        else None,
-                    ),
-                )
+                cursor = conn.execute(self._INSERT_INFO_SQL, self._info_to_params(info))
                 return cursor.lastrowid
             except sqlite3.IntegrityError:
                 # 重複時はスキップ
                 return None
 
+    def add_many(self, infos: Iterable[CollectedInfo]) -> int:
+        """
+        情報をまとめて追加（1トランザクション、重複は無視）
+
+        Args:
+            infos: 追加する情報
+
+        Returns:
+            実際に追加された件数
+        """
+        rows = [self._info_to_params(info) for info in infos]
+        if not rows:
+            return 0
+
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            cursor = conn.executemany(
+                f"{self._INSERT_INFO_SQL} ON CONFLICT (source_type, url) DO NOTHING",
+                rows,
+            )
+            return cursor.rowcount
+
     def get_info_by_id(self, info_id: int) -> Optional[CollectedInfo]:
         """IDで情報を取得"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._connect() as conn:
             cursor = conn.execute(
                 "SELECT * FROM collected_info WHERE id = ?", (info_id,)
             )
@@ -186,23 +221,23 @@ class InfoCollectorRepository:
         """
         params.append(limit)
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._connect() as conn:
             cursor = conn.execute(sql, params)
             return [self._row_to_info(row) for row in cursor.fetchall()]
 
-    def delete_old_info(self, days: int = 30) -> int:
+    def delete_old_info(self, days: int = 30, now: Optional[datetime] = None) -> int:
         """
         古い情報を削除
 
         Args:
             days: 保持期間（日数）
+            now: 基準日時（Noneの場合は現在時刻）
 
         Returns:
             削除件数
         """
-        cutoff_date = datetime.now() - timedelta(days=days)
-        with sqlite3.connect(self.db_path) as conn:
+        cutoff_date = (now or datetime.now()) - timedelta(days=days)
+        with self._connect() as conn:
             cursor = conn.execute(
                 "DELETE FROM collected_info WHERE fetched_at < ?",
                 (cutoff_date.isoformat(),),
@@ -211,7 +246,7 @@ class InfoCollectorRepository:
 
     def add_summary(self, summary: InfoSummary) -> int:
         """要約を追加"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.execute(
                 """
                 INSERT INTO info_summaries (
@@ -232,8 +267,7 @@ class InfoCollectorRepository:
 
     def get_summary_by_id(self, summary_id: int) -> Optional[InfoSummary]:
         """IDで要約を取得"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._connect() as conn:
             cursor = conn.execute(
                 "SELECT * FROM info_summaries WHERE id = ?", (summary_id,)
             )
@@ -260,8 +294,7 @@ class InfoCollectorRepository:
             """
             params = (limit,)
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._connect() as conn:
             cursor = conn.execute(sql, params)
             return [self._row_to_summary(row) for row in cursor.fetchall()]
 
@@ -86,14 +86,13 @@ def serialize_todo(item: TodoItem) -> TodoResponse:
 
 
 def serialize_chat_session_summary(session) -> ChatSessionSummary:
-    """Convert ChatSession dataclass to summary model."""
-    messages = session.messages
+    """Convert ChatSession / chat_history.ChatSessionSummary to summary model."""
     return ChatSessionSummary(
         session_id=session.session_id,
         title=session.title,
         created_at=session.created_at,
         updated_at=session.updated_at,
-        message_count=len(messages),
+        message_count=session.message_count,
     )
 
 
@@ -4,8 +4,9 @@ from __future__ import annotations
 
 import logging
 
-from fastapi import FastAPI, HTTPException
+from fastapi import Depends, FastAPI, HTTPException
 
+from ..approval_queue import BashApprovalQueue
 from ..dependencies import get_bash_approval_queue
 from ..schemas import BashApprovalResponse, BashPendingResponse
 
@@ -16,9 +17,10 @@ def register_bash_routes(app: FastAPI) -> None:
     """Register approval endpoints for bash commands."""
 
     @app.get("/api/bash/pending", response_model=BashPendingResponse)
-    async def get_pending_bash_approvals() -> BashPendingResponse:
+    async def get_pending_bash_approvals(
+        queue: BashApprovalQueue = Depends(get_bash_approval_queue),
+    ) -> BashPendingResponse:
         """Get pending bash command approval requests."""
-        queue = get_bash_approval_queue()
         try:
             requests = queue.get_pending_requests()
             return BashPendingResponse(requests=requests)
@@ -29,9 +31,12 @@ def register_bash_routes(app: FastAPI) -> None:
             ) from exc
 
     @app.post("/api/bash/approve/{request_id}", response_model=BashApprovalResponse)
-    async def approve_bash_command(request_id: str, approved: bool) -> BashApprovalResponse:
+    async def approve_bash_command(
+        request_id: str,
+        approved: bool,
+        queue: BashApprovalQueue = Depends(get_bash_approval_queue),
+    ) -> BashApprovalResponse:
         """Approve or reject a bash command execution request."""
-        queue = get_bash_approval_queue()
         try:
             if approved:
                 success = queue.approve(request_id)
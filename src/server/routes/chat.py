@@ -66,15 +66,27 @@ def register_chat_routes(app: FastAPI) -> None:
 
     @app.get("/api/chat/sessions", response_model=List[ChatSessionSummary])
     async def list_chat_sessions(
-        limit: int = 20, query: Optional[str] = None
+        limit: int = 20,
+        query: Optional[str] = None,
+        before_updated_at: Optional[str] = None,
+        before_session_id: Optional[str] = None,
     ) -> List[ChatSessionSummary]:
-        """List chat sessions ordered by updated timestamp."""
+        """List chat sessions ordered by updated timestamp (ties by session id).
+
+        Pass the last item's ``updated_at`` and ``session_id`` as ``before_updated_at``
+        and ``before_session_id`` to fetch the next page.
+        """
         repo = get_chat_history_repository()
         try:
             if query:
                 sessions = await asyncio.to_thread(repo.search_sessions, query, limit)
             else:
-                sessions = await asyncio.to_thread(repo.list_sessions, limit)
+                sessions = await asyncio.to_thread(
+                    repo.list_sessions,
+                    limit,
+                    before_updated_at=before_updated_at,
+                    before_session_id=before_session_id,
+                )
             return [serialize_chat_session_summary(session) for session in sessions]
         except Exception as exc:
             logger.exception("Failed to list chat sessions: %s", exc)
@@ -6,9 +6,9 @@ import asyncio
 import logging
 from typing import Dict, List
 
-from fastapi import FastAPI, HTTPException
+from fastapi import Depends, FastAPI, HTTPException
 
-from src.todo import UNSET
+from src.todo import UNSET, TodoRepository
 
 from ..dependencies import get_todo_repository, serialize_todo
 from ..schemas import TodoCreateRequest, TodoResponse, TodoUpdateRequest
@@ -20,9 +20,10 @@ def register_todo_routes(app: FastAPI) -> None:
     """Register todo CRUD endpoints."""
 
     @app.get("/api/todos", response_model=List[TodoResponse])
-    async def list_todos() -> List[TodoResponse]:
+    async def list_todos(
+        repo: TodoRepository = Depends(get_todo_repository),
+    ) -> List[TodoResponse]:
         """List todos ordered by status/due date."""
-        repo = get_todo_repository()
         try:
             todos = await asyncio.to_thread(repo.list)
             return [serialize_todo(todo) for todo in todos]
@@ -31,9 +32,11 @@ def register_todo_routes(app: FastAPI) -> None:
             raise HTTPException(status_code=500, detail="Failed to list todos") from exc
 
     @app.post("/api/todos", response_model=TodoResponse)
-    async def create_todo(request: TodoCreateRequest) -> TodoResponse:
+    async def create_todo(
+        request: TodoCreateRequest,
+        repo: TodoRepository = Depends(get_todo_repository),
+    ) -> TodoResponse:
         """Create a new todo."""
-        repo = get_todo_repository()
         try:
             todo = await asyncio.to_thread(
                 repo.create,
@@ -48,9 +51,12 @@ def register_todo_routes(app: FastAPI) -> None:
             raise HTTPException(status_code=500, detail="Failed to create todo") from exc
 
     @app.patch("/api/todos/{todo_id}", response_model=TodoResponse)
-    async def update_todo(todo_id: int, request: TodoUpdateRequest) -> TodoResponse:
+    async def update_todo(
+        todo_id: int,
+        request: TodoUpdateRequest,
+        repo: TodoRepository = Depends(get_todo_repository),
+    ) -> TodoResponse:
         """Update an existing todo."""
-        repo = get_todo_repository()
         try:
             payload = request.model_dump(exclude_unset=True)
             todo = await asyncio.to_thread(
@@ -73,9 +79,11 @@ def register_todo_routes(app: FastAPI) -> None:
             raise HTTPException(status_code=500, detail="Failed to update todo") from exc
 
     @app.delete("/api/todos/{todo_id}")
-    async def delete_todo(todo_id: int) -> Dict[str, bool]:
+    async def delete_todo(
+        todo_id: int,
+        repo: TodoRepository = Depends(get_todo_repository),
+    ) -> Dict[str, bool]:
         """Delete a todo."""
-        repo = get_todo_repository()
         try:
             deleted = await asyncio.to_thread(repo.delete, todo_id)
             if not deleted:
@@ -198,8 +198,12 @@ def cmd_get(repo: TodoRepository, todo_id: int, output_format: str) -> int:
         return 1
 
 
-def main() -> int:
-    """CLIエントリポイント"""
+def main(argv: Optional[List[str]] = None) -> int:
+    """CLIエントリポイント
+
+    Args:
+        argv: コマンドライン引数（省略時はsys.argv[1:]を使用）
+    """
     parser = argparse.ArgumentParser(
         description="TODO管理CLI - AI秘書がsubprocess経由で呼び出すインターフェース",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -288,7 +292,7 @@ def main() -> int:
         help="出力フォーマット（デフォルト: text）",
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # リポジトリ初期化
     repo = TodoRepository(db_path=args.db_path if args.db_path else None)
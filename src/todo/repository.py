@@ -4,7 +4,9 @@ import sqlite3
 import os
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Iterable, Optional, Any
+from typing import Iterable, List, Optional, Any
+
+from src.utils.sqlite_schema import schema_objects_exist
 
 from .models import TodoItem, TodoStatus
 
@@ -14,7 +16,18 @@ UNSET = object()
 class TodoRepository:
     """SQLiteベースのTODO管理。統合スキーマ対応版。"""
 
+    # create / bulk_create で同一のSQL文字列を使い、文キャッシュを共有する
+    _INSERT_SQL = (
+        "INSERT INTO todo_items"
+        " (title, description, status, due_date, created_at, updated_at, priority, tags_json)"
+        " VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+    )
+
     def __init__(self, db_path: Optional[Path] = None):
+        """
+        Args:
+            db_path: データベースファイルパス（Noneの場合は環境変数/デフォルト）
+        """
         root = Path(__file__).resolve().parents[2]
         default_path = root / "data" / "ai_secretary.db"  # 統合DBパスに変更
         env_path = os.getenv("AI_SECRETARY_DB_PATH")  # 環境変数名も変更
@@ -24,16 +37,31 @@ class TodoRepository:
             self.db_path = Path(env_path)
         else:
             self.db_path = default_path
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # "file:...?mode=memory&cache=shared" のようなURI指定はそのままSQLiteへ渡す
+        self._is_uri = str(self.db_path).startswith("file:")
+        if not self._is_uri:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._initialize()
 
     def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
+        conn = sqlite3.connect(str(self.db_path), uri=self._is_uri)
         conn.row_factory = sqlite3.Row
         return conn
 
     def _initialize(self) -> None:
-        """統合スキーマでの初期化（todo_itemsテーブル使用）"""
+        """統合スキーマでの初期化（todo_itemsテーブル使用）
+
+        必要なテーブルが既にあればDDLを実行しない。
+        """
+        with self._connect() as conn:
+            if schema_objects_exist(
+                conn, "todo_items", "idx_todo_status", "idx_todo_priority", "idx_todo_due"
+            ):
+                return
+        self._ensure_schema()
+
+    def _ensure_schema(self) -> None:
+        """todo_itemsテーブルと索引を作成（存在しない場合）"""
         with self._connect() as conn:
             conn.execute(
                 """
@@ -106,10 +134,7 @@ class TodoRepository:
         now = self._now()
         with self._connect() as conn:
             cursor = conn.execute(
-                """
-                INSERT INTO todo_items (title, description, status, due_date, created_at, updated_at, priority, tags_json)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+                self._INSERT_SQL,
                 (title, description, status.value, due_date, now, now, priority, tags_json),
             )
             conn.commit()
@@ -168,18 +193,33 @@ class TodoRepository:
         return self._row_to_item(row) if row else None
 
     def bulk_create(self, items: Iterable[dict]) -> list[TodoItem]:
-        """テスト/初期データ投入用のヘルパー。"""
-        from typing import List
-        created: List[TodoItem] = []
-        for item in items:
-            created.append(
-                self.create(
-                    title=item.get("title", ""),
-                    description=item.get("description", ""),
-                    due_date=item.get("due_date"),
-                    status=TodoStatus(item.get("status", TodoStatus.TODO.value)),
-                    priority=item.get("priority", 3),
-                    tags_json=item.get("tags_json", "[]"),
-                )
+        """テスト/初期データ投入用のヘルパー。
+
+        1トランザクション内でexecutemanyによりまとめて挿入し、作成順のTODOを返す。
+        """
+        now = self._now()
+        rows = [
+            (
+                item.get("title", ""),
+                item.get("description", ""),
+                TodoStatus(item.get("status", TodoStatus.TODO.value)).value,
+                item.get("due_date"),
+                now,
+                now,
+                item.get("priority", 3),
+                item.get("tags_json", "[]"),
             )
-        return created
+            for item in items
+        ]
+        if not rows:
+            return []
+
+        with self._connect() as conn:
+            # 書き込みロックを取ってから挿入するため、新しいIDは直前の最大IDより大きい連番になる
+            conn.execute("BEGIN IMMEDIATE")
+            (last_id,) = conn.execute("SELECT COALESCE(MAX(id), 0) FROM todo_items").fetchone()
+            conn.executemany(self._INSERT_SQL, rows)
+            created: List[sqlite3.Row] = conn.execute(
+                "SELECT * FROM todo_items WHERE id > ? ORDER BY id", (last_id,)
+            ).fetchall()
+        return [self._row_to_item(row) for row in created]
@@ -0,0 +1 @@
+"""複数パッケージで共有する小さなユーティリティ。"""
@@ -0,0 +1,33 @@
+"""JSONのエンコード/デコード（orjsonがあれば使い、無ければ標準jsonにフォールバック）"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson未導入環境では標準jsonを使う
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps(obj: Any) -> str:
+    """JSON文字列に変換（日本語などの非ASCII文字はエスケープしない）
+
+    DBに保存する文字列がorjsonの有無で変わらないよう、標準jsonでも
+    orjsonと同じ区切り文字（空白なしのコンパクト形式）で出力する。
+    """
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """JSON文字列をデコード
+
+    orjson.JSONDecodeError は json.JSONDecodeError のサブクラスのため、
+    呼び出し側はどちらの場合も json.JSONDecodeError で捕捉できる。
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -0,0 +1,24 @@
+"""複数のリポジトリで共有するSQLiteヘルパー"""
+
+from __future__ import annotations
+
+import sqlite3
+
+
+def schema_objects_exist(conn: sqlite3.Connection, *names: str) -> bool:
+    """指定したテーブル・索引などがすべて存在するかをsqlite_masterから確認する
+
+    DDLを毎回流す代わりに使う軽量チェック。インメモリDBの破棄や
+    ファイルの差し替えがあっても、実際のDBの状態を見て判定できる。
+    """
+    placeholders = ", ".join("?" for _ in names)
+    (count,) = conn.execute(
+        f"SELECT COUNT(*) FROM sqlite_master WHERE name IN ({placeholders})",
+        names,
+    ).fetchone()
+    return count == len(set(names))
+
+
+def fts5_phrase(query: str) -> str:
+    """検索語をFTS5のフレーズとしてクォート（部分一致、構文文字は無効化）"""
+    return '"' + query.replace('"', '""') + '"'
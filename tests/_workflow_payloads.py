@@ -0,0 +1,25 @@
+"""Ollamaワークフローテストで共有するBASH実行結果のペイロード"""
+
+from types import MappingProxyType
+
+# _process_bash_actions() の戻り値の要素（読み取り専用）
+PWD_RESULT = MappingProxyType(
+    {
+        "command": "pwd",
+        "reason": "ディレクトリ確認",
+        "result": MappingProxyType(
+            {"stdout": "/home/test\n", "stderr": "", "exit_code": "0", "cwd": "/home/test"}
+        ),
+        "error": None,
+    }
+)
+LS_RESULT = MappingProxyType(
+    {
+        "command": "ls",
+        "reason": "ファイル一覧",
+        "result": MappingProxyType(
+            {"stdout": "file1.py\nfile2.py\n", "stderr": "", "exit_code": "0", "cwd": "/home/test"}
+        ),
+        "error": None,
+    }
+)
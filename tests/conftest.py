@@ -0,0 +1,404 @@
+"""
+テスト共通フィクスチャ
+
+重い依存（ollama_client, coeiroink_client, audio_player, journal等）を引き込む
+AISecretaryはここで一度だけimportし、各テストモジュールへはフィクスチャ経由で渡す。
+"""
+
+import contextlib
+import functools
+import hashlib
+import json
+import os
+import socket
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Tuple
+from unittest.mock import Mock, patch
+from urllib.parse import urlsplit
+from uuid import uuid4
+
+import pytest
+
+from src.ai_secretary.secretary import AISecretary as _AISecretary
+
+
+@pytest.fixture
+def fresh_speaker_cache() -> Iterator[None]:
+    """COEIROINKのスピーカー一覧キャッシュをテストの前後で破棄する
+
+    requests をモックしてスピーカー一覧を返すテストが、モックの応答を
+    後続テストへ持ち越さないようにする。
+    """
+    from src.coeiroink_client.client import _fetch_speakers
+
+    _fetch_speakers.cache_clear()
+    yield
+    _fetch_speakers.cache_clear()
+
+
+def _write_files(base: Path, mapping: Dict[str, str]) -> None:
+    """base配下にファイル群をまとめて書き出す（1ファイルにつき open/write/close 1回）"""
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+    for name, content in mapping.items():
+        fd = os.open(base / name, flags, 0o644)
+        try:
+            os.write(fd, content.encode("utf-8"))
+        finally:
+            os.close(fd)
+
+
+@pytest.fixture
+def frozen_summarizer_datetime(monkeypatch) -> datetime:
+    """src.journal.summarizer の datetime.now() を 2025-11-14 12:00 に固定する"""
+
+    class _FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return cls(2025, 11, 14, 12, 0, 0)
+
+    monkeypatch.setattr("src.journal.summarizer.datetime", _FrozenDatetime)
+    return _FrozenDatetime.now()
+
+
+@pytest.fixture(scope="session")
+def write_files() -> Callable[[Path, Dict[str, str]], None]:
+    """テスト用ファイルを一括作成するヘルパー"""
+    return _write_files
+
+
+@pytest.fixture(scope="session")
+def _shared_db_factory() -> Callable[[], str]:
+    """共有キャッシュ・インメモリSQLiteの一意なURIを払い出すファクトリ"""
+    prefix = uuid4().hex
+
+    def make_uri() -> str:
+        return f"file:memdb_{prefix}_{uuid4().hex}?mode=memory&cache=shared"
+
+    return make_uri
+
+
+@pytest.fixture
+def memory_db_uri(_shared_db_factory) -> Iterator[str]:
+    """テストごとの共有キャッシュ・インメモリSQLiteのURI
+
+    リポジトリは操作ごとに接続を開閉するため、番兵接続をテスト終了まで保持して
+    DBが途中で破棄されないようにする。
+    """
+    uri = _shared_db_factory()
+    sentinel = sqlite3.connect(uri, uri=True)
+    yield uri
+    sentinel.close()
+
+
+@pytest.fixture(scope="module")
+def module_memory_db_uri(_shared_db_factory) -> Iterator[str]:
+    """モジュール内で共有するインメモリSQLiteのURI（スキーマ作成を1回にまとめる用）"""
+    uri = _shared_db_factory()
+    sentinel = sqlite3.connect(uri, uri=True)
+    yield uri
+    sentinel.close()
+
+
+@pytest.fixture(scope="session")
+def api_app():
+    """FastAPIアプリ（ルーター登録を含む構築はセッション内で1回だけ）
+
+    テストごとの状態は app.dependency_overrides で差し込み、テスト後に取り除くこと。
+    """
+    from src.server.app import create_app
+
+    app = create_app()
+    yield app
+    app.dependency_overrides.clear()
+
+
+# 実Ollama統合テストが前提とするサーバーとモデル
+# モデルは全統合テストで共通にし、Ollama上で複数モデルが常駐・入れ替えされないようにする
+OLLAMA_TEST_HOST = "http://localhost:11434"
+OLLAMA_TEST_MODEL = os.environ.get("AI_SEC_TEST_MODEL", "qwen3:8b")
+
+
+@functools.cache
+def _ollama_reachable() -> bool:
+    """OllamaサーバーのポートにTCP接続できるか（HTTP往復なしの高速プローブ、結果はプロセス内で共有）"""
+    url = urlsplit(OLLAMA_TEST_HOST)
+    try:
+        with socket.create_connection((url.hostname, url.port or 11434), timeout=0.2):
+            return True
+    except OSError:
+        return False
+
+
+def pytest_collection_modifyitems(config, items):
+    """ollama_available を使うテストは、サーバーに到達できなければ収集時点でスキップする
+
+    フィクスチャ内でのスキップと違い、他のフィクスチャ（AISecretary構築など）が一切実行されない。
+    モデルの有無の詳細確認は ollama_available フィクスチャ側で行う。
+    """
+    needs_ollama = [
+        item for item in items if "ollama_available" in getattr(item, "fixturenames", ())
+    ]
+    if not needs_ollama or _ollama_reachable():
+        return
+    skip = pytest.mark.skip(reason=f"Ollamaサーバーに接続できません: {OLLAMA_TEST_HOST}")
+    for item in needs_ollama:
+        item.add_marker(skip)
+
+
+@pytest.fixture(scope="session")
+def ollama_available() -> bool:
+    """実Ollamaサーバーとテスト用モデルが利用可能か確認（セッションで1回だけ問い合わせる）
+
+    利用できない場合はスキップし、その結果は同じセッション内の全利用テストで共有される。
+    """
+    from src.ai_secretary.ollama_client import OllamaClient
+
+    try:
+        models = OllamaClient(host=OLLAMA_TEST_HOST, model=OLLAMA_TEST_MODEL).list_models()
+    except Exception as e:
+        pytest.skip(f"Ollamaサーバーが利用できません: {e}")
+    if not models:
+        pytest.skip("Ollamaサーバーに接続できないか、モデルがありません")
+    if OLLAMA_TEST_MODEL not in models:
+        pytest.skip(
+            f"{OLLAMA_TEST_MODEL}モデルが見つかりません。"
+            f"ollama pull {OLLAMA_TEST_MODEL} を実行してください"
+        )
+    return True
+
+
+# AI_SEC_TEST_CACHE=1 のとき、実LLMの応答を .pytest_cache に保存して次回以降の実行で再利用する
+LLM_CACHE_ENABLED = os.environ.get("AI_SEC_TEST_CACHE") == "1"
+
+
+class LLMResponseCache:
+    """実OllamaClientの chat/generate 応答を完全一致で再利用するテスト用キャッシュ
+
+    キーは (メソッド名, モデル, 温度, 最大トークン数, 引数) をJSON化した blake2b ハッシュ。
+    保存先は pytest 標準のキャッシュ（--cache-clear で破棄できる）。
+    """
+
+    _KEY_PREFIX = "ai_secretary/llm/"
+
+    def __init__(self, store):
+        self._store = store
+        self.bypass = False
+
+    def _key(self, method: str, client, args: tuple, kwargs: Dict[str, Any]) -> str:
+        raw = json.dumps(
+            [method, client.model, client.temperature, client.max_tokens, args, kwargs],
+            ensure_ascii=False,
+            sort_keys=True,
+        )
+        return self._KEY_PREFIX + hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+    def wrap(self, client):
+        """client の chat/generate をキャッシュ経由に差し替える（無効時はそのまま返す）"""
+        if not LLM_CACHE_ENABLED:
+            return client
+        for method in ("chat", "generate"):
+            setattr(client, method, self._memoize(method, client, getattr(client, method)))
+        return client
+
+    def _memoize(self, method: str, client, func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if self.bypass or kwargs.get("stream"):
+                return func(*args, **kwargs)
+            key = self._key(method, client, args, kwargs)
+            cached = self._store.get(key, None)
+            if cached is not None:
+                return cached["value"]
+            value = func(*args, **kwargs)
+            self._store.set(key, {"value": value})
+            return value
+
+        return wrapper
+
+
+@pytest.fixture(scope="session")
+def llm_response_cache(request) -> LLMResponseCache:
+    """実LLM応答キャッシュ（AI_SEC_TEST_CACHE=1 のときのみ有効）"""
+    return LLMResponseCache(request.config.cache)
+
+
+@pytest.fixture(autouse=True)
+def _llm_cache_opt_out(request):
+    """no_llm_cache マーカー付きのテストではキャッシュを使わず毎回LLMへ問い合わせる"""
+    if not LLM_CACHE_ENABLED or request.node.get_closest_marker("no_llm_cache") is None:
+        yield
+        return
+    cache = request.getfixturevalue("llm_response_cache")
+    cache.bypass = True
+    yield
+    cache.bypass = False
+
+
+@pytest.fixture(scope="session")
+def ollama_client(ollama_available, llm_response_cache):
+    """共有テストモデルを使う実OllamaClient（セッションで1回だけ構築）"""
+    from src.ai_secretary.ollama_client import OllamaClient
+
+    client = OllamaClient(
+        host=OLLAMA_TEST_HOST,
+        model=OLLAMA_TEST_MODEL,
+        temperature=0.7,
+        max_tokens=1024,
+    )
+    return llm_response_cache.wrap(client)
+
+
+@pytest.fixture(scope="session")
+def real_secretary_factory(ollama_available, llm_response_cache, tmp_path_factory):
+    """実Ollamaを使うAISecretaryのファクトリ（同じ設定の組み合わせはセッション内で1回だけ構築）
+
+    make(max_tokens=..., system_prompt=..., with_bash=...) の形で呼び出す。
+    BashExecutorは全インスタンスで1つを共有し、会話履歴のリセットは呼び出し側が行う。
+    """
+    from src.ai_secretary.config import Config, OllamaConfig, ProactiveChatConfig
+    from src.bash_executor import create_executor
+
+    secretaries: Dict[tuple, Any] = {}
+    shared: Dict[str, Any] = {}
+
+    def make(max_tokens: int = 1000, system_prompt=None, with_bash: bool = False):
+        key = (max_tokens, system_prompt, with_bash)
+        if key in secretaries:
+            return secretaries[key]
+
+        tmp_path = tmp_path_factory.mktemp("ollama_real")
+        config = Config(
+            ollama=OllamaConfig(host=OLLAMA_TEST_HOST, model=OLLAMA_TEST_MODEL),
+            proactive_chat=ProactiveChatConfig(),
+            log_level="DEBUG",
+            log_file=str(tmp_path / "test.log"),
+            max_tokens=max_tokens,
+            temperature=0.3,  # 再現性を高めるため低めに
+            system_prompt=system_prompt,  # Noneならconfig/system_prompt.txtから読み込まれる
+            coeiroink_api_url="http://localhost:50032",
+            audio_output_dir=str(tmp_path / "audio"),
+        )
+
+        bash_executor = None
+        if with_bash:
+            if "bash_executor" not in shared:
+                shared["bash_executor"] = create_executor()
+            bash_executor = shared["bash_executor"]
+
+        # COEIROINKとAudioPlayerは無効化（音声不要）
+        secretary = _AISecretary(
+            config=config,
+            ollama_client=None,  # 自動初期化
+            coeiroink_client=None,
+            audio_player=None,
+            bash_executor=bash_executor,
+        )
+        llm_response_cache.wrap(secretary.ollama_client)
+        secretaries[key] = secretary
+        return secretary
+
+    return make
+
+
+def _make_workflow_config() -> Mock:
+    """Configのspec付きモック（存在しない設定項目の参照・代入はエラーにする）"""
+    from src.ai_secretary.config import Config, OllamaConfig
+
+    config = Mock(spec_set=Config)
+    config.ollama = Mock(spec=OllamaConfig, host="http://localhost:11434", model="qwen3:8b")
+    config.temperature = 0.7
+    config.max_tokens = 2000
+    config.system_prompt = "You are a helpful assistant."
+    config.audio_output_dir = "outputs/audio"
+    config.coeiroink_api_url = "http://localhost:50032"
+    return config
+
+
+def _make_workflow_bash_executor() -> Mock:
+    """CommandExecutorのspec付きモック（root_dir/validatorはインスタンス属性のため個別に設定）"""
+    from src.bash_executor import CommandExecutor, CommandValidator
+
+    executor = Mock(spec=CommandExecutor)
+    executor.root_dir = "/home/test"
+    executor.validator = Mock(spec=CommandValidator)
+    executor.validator.allowed_commands = {"ls", "pwd", "cat", "echo"}
+    executor.execute.return_value = {
+        "stdout": "/home/test\n",
+        "stderr": "",
+        "exit_code": "0",
+        "cwd": "/home/test",
+    }
+    return executor
+
+
+@pytest.fixture(scope="module")
+def _mocked_secretaries() -> Iterator[Dict[str, Tuple[Any, Dict[str, Any]]]]:
+    """外部依存をモックしたAISecretaryをモジュールで1回だけ構築する
+
+    BASHなし（"secretary"）とBASHモック付き（"secretary_with_bash"）の2種類を用意し、
+    構築直後の属性をスナップショットとして一緒に返す。外部クライアントのpatchは
+    __init__ の間だけ有効にする。
+    """
+    with contextlib.ExitStack() as stack:
+        for target in ("OllamaClient", "COEIROINKClient", "AudioPlayer"):
+            stack.enter_context(patch(f"src.ai_secretary.secretary.{target}"))
+        # bash_executor=None のときに実BashExecutorが自動生成されないようにする
+        stack.enter_context(
+            patch("src.bash_executor.create_executor", side_effect=Exception("Disabled"))
+        )
+        secretaries = {
+            "secretary": _AISecretary(
+                config=_make_workflow_config(),
+                ollama_client=Mock(),
+                coeiroink_client=None,
+                audio_player=None,
+                bash_executor=None,
+            ),
+            "secretary_with_bash": _AISecretary(
+                config=_make_workflow_config(),
+                ollama_client=Mock(),
+                coeiroink_client=None,
+                audio_player=None,
+                bash_executor=_make_workflow_bash_executor(),
+            ),
+        }
+    yield {name: (secretary, dict(vars(secretary))) for name, secretary in secretaries.items()}
+
+
+def _restore_mocked_secretary(secretary, snapshot: Dict[str, Any]):
+    """テストが差し替え・蓄積した状態を構築直後に戻す
+
+    属性値を仕込まれやすいConfigとBASHエグゼキュータのモックは作り直す。
+    その他のクライアントのモックは使い回し、呼び出し記録と return_value /
+    side_effect を消す。
+    """
+    vars(secretary).clear()
+    vars(secretary).update(snapshot)
+    secretary.conversation_history = list(snapshot["conversation_history"])
+    secretary.config = _make_workflow_config()
+    if snapshot["bash_executor"] is not None:
+        secretary.bash_executor = _make_workflow_bash_executor()
+    for mock in (secretary.ollama_client, secretary.coeiro_client, secretary.audio_player):
+        if isinstance(mock, Mock):
+            mock.reset_mock(return_value=True, side_effect=True)
+    return secretary
+
+
+@pytest.fixture
+def secretary(_mocked_secretaries):
+    """モックを使ったAISecretary（BASHなし、モジュール共有のインスタンスをテストごとに初期化）"""
+    return _restore_mocked_secretary(*_mocked_secretaries["secretary"])
+
+
+@pytest.fixture
+def secretary_with_bash(_mocked_secretaries):
+    """BASHエグゼキュータのモック付きAISecretary（モジュール共有のインスタンスをテストごとに初期化）"""
+    return _restore_mocked_secretary(*_mocked_secretaries["secretary_with_bash"])
+
+
+@pytest.fixture(scope="session")
+def AISecretary():  # noqa: N802 - クラスと同名にしてテスト本体の記述を変えない
+    """AISecretaryクラス（収集時にimport済みのものを共有）"""
+    return _AISecretary
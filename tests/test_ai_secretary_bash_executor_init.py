@@ -1,9 +1,6 @@
 """BashExecutor初期化テスト."""
 
-import pytest
-from unittest.mock import Mock, patch, MagicMock
-from src.ai_secretary.secretary import AISecretary
-from src.ai_secretary.config import Config
+from unittest.mock import Mock, patch
 
 
 class TestBashExecutorInitialization:
@@ -11,7 +8,9 @@ class TestBashExecutorInitialization:
 
     @patch("src.bash_executor.create_executor")
     @patch("src.ai_secretary.secretary.OllamaClient")
-    def test_bash_executor_auto_initialization(self, mock_ollama, mock_create_executor):
+    def test_bash_executor_auto_initialization(
+        self, mock_ollama, mock_create_executor, AISecretary
+    ):
         """bash_executor未指定時に自動初期化されるか"""
         mock_executor = Mock()
         mock_create_executor.return_value = mock_executor
@@ -31,7 +30,9 @@ class TestBashExecutorInitialization:
 
     @patch("src.bash_executor.create_executor")
     @patch("src.ai_secretary.secretary.OllamaClient")
-    def test_bash_executor_initialization_failure(self, mock_ollama, mock_create_executor):
+    def test_bash_executor_initialization_failure(
+        self, mock_ollama, mock_create_executor, AISecretary
+    ):
         """BashExecutor初期化失敗時はNoneになるか"""
         mock_create_executor.side_effect = Exception("Initialization failed")
 
@@ -2,7 +2,7 @@
 
 import json
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch
 from src.ai_secretary.secretary import AISecretary
 from src.ai_secretary.config import Config
 
@@ -1,9 +1,9 @@
 """3段階BASHワークフローのテスト."""
 
+from types import SimpleNamespace
+from unittest.mock import Mock
+
 import pytest
-from unittest.mock import Mock, patch, MagicMock
-from src.ai_secretary.secretary import AISecretary
-from src.ai_secretary.config import Config
 
 
 class TestThreeStepBashWorkflow:
@@ -14,8 +14,8 @@ class TestThreeStepBashWorkflow:
         """モックBashExecutorを作成"""
         mock = Mock()
         mock.root_dir = "/home/test"
-        mock.validator = Mock()
-        mock.validator.allowed_commands = {"ls", "pwd", "cat"}
+        # validatorは属性を読むだけなのでMockにしない
+        mock.validator = SimpleNamespace(allowed_commands={"ls", "pwd", "cat"})
         mock.execute.return_value = {
             "stdout": "file1.py\\nfile2.py\\n",
             "stderr": "",
@@ -25,27 +25,25 @@ class TestThreeStepBashWorkflow:
         return mock
 
     @pytest.fixture
-    def secretary(self, mock_bash_executor):
+    def secretary(self, AISecretary, mock_bash_executor):
         """AISecretaryインスタンス作成"""
-        config = Mock()
-        config.ollama = Mock(host="http://localhost:11434", model="llama3.1:8b")
-        config.temperature = 0.7
-        config.max_tokens = 2000
-        config.system_prompt = "Test"
-        config.audio_output_dir = "outputs/audio"
-        config.coeiroink_api_url = "http://localhost:50032"
-
-        with patch("src.ai_secretary.secretary.OllamaClient"), patch(
-            "src.ai_secretary.secretary.COEIROINKClient"
-        ), patch("src.ai_secretary.secretary.AudioPlayer"):
-            secretary = AISecretary(
-                config=config,
-                ollama_client=Mock(),
-                coeiroink_client=None,
-                audio_player=None,
-                bash_executor=mock_bash_executor,
-            )
-            return secretary
+        config = SimpleNamespace(
+            ollama=SimpleNamespace(host="http://localhost:11434", model="llama3.1:8b"),
+            temperature=0.7,
+            max_tokens=2000,
+            system_prompt="Test",
+            audio_output_dir="outputs/audio",
+            coeiroink_api_url="http://localhost:50032",
+        )
+
+        # 呼び出しを検証しない依存は記録なしの軽量スタブで十分
+        return AISecretary(
+            config=config,
+            ollama_client=Mock(),
+            coeiroink_client=SimpleNamespace(speakers={}),
+            audio_player=SimpleNamespace(play_wav=lambda *_: None),
+            bash_executor=mock_bash_executor,
+        )
 
     def test_execute_bash_workflow_no_bash_actions(self, secretary):
         """bashActionsがない場合は initial_response をそのまま返すか"""
@@ -104,38 +102,55 @@ class TestThreeStepBashWorkflow:
         assert result == step2_response
         assert secretary.ollama_client.chat.call_count == 2  # ステップ2 + ステップ3
 
-    def test_execute_bash_workflow_verification_failure_and_retry(
-        self, secretary, mock_bash_executor
+    @pytest.mark.parametrize(
+        "chat_seq,expected_substrings,expected_exec_calls",
+        [
+            pytest.param(
+                [
+                    {"text": "ファイルが見つかりません"},  # 1回目ステップ2
+                    {  # 1回目ステップ3（失敗）
+                        "success": False,
+                        "reason": "lsコマンドの結果を反映していない",
+                        "suggestion": "実行結果を確認してください",
+                    },
+                    {  # 再試行ステップ1
+                        "text": "再試行します",
+                        "bashActions": [{"command": "ls -la", "reason": "詳細表示"}],
+                    },
+                    {"text": "ファイルはfile1.pyとfile2.pyです"},  # 再試行ステップ2
+                    {"success": True, "reason": "OK", "suggestion": ""},  # 再試行ステップ3（成功）
+                ],
+                ["ファイルはfile1.pyとfile2.pyです"],
+                2,  # 1回目 + 再試行
+                id="verification_failure_and_retry",
+            ),
+            pytest.param(
+                [
+                    {"text": "結果"},
+                    {"success": False, "reason": "失敗", "suggestion": "別のコマンドを試してください"},
+                    {"text": "再試行", "bashActions": [{"command": "pwd", "reason": "テスト"}]},
+                ]
+                * 2
+                + [
+                    {"text": "結果"},
+                    {"success": False, "reason": "失敗", "suggestion": "別のコマンドを試してください"},
+                ],
+                ["申し訳ございません", "失敗しました"],
+                3,  # 初回 + 再試行2回
+                id="max_retry_exceeded",
+            ),
+        ],
+    )
+    def test_execute_bash_workflow_retry(
+        self, secretary, mock_bash_executor, chat_seq, expected_substrings, expected_exec_calls
     ):
-        """検証失敗時に再試行するか"""
+        """検証失敗時の再試行と最大再試行回数超過時のエラーハンドリング"""
         initial_response = {
             "text": "ファイルを確認します",
             "bashActions": [{"command": "ls", "reason": "ファイル一覧"}]
         }
 
-        # 1回目: 検証失敗
-        step2_response_1 = {"text": "ファイルが見つかりません"}
-        verification_response_1 = {
-            "success": False,
-            "reason": "lsコマンドの結果を反映していない",
-            "suggestion": "実行結果を確認してください"
-        }
-
-        # 2回目（再試行）: 検証成功
-        retry_step1_response = {
-            "text": "再試行します",
-            "bashActions": [{"command": "ls -la", "reason": "詳細表示"}]
-        }
-        step2_response_2 = {"text": "ファイルはfile1.pyとfile2.pyです"}
-        verification_response_2 = {"success": True, "reason": "OK", "suggestion": ""}
-
-        secretary.ollama_client.chat = Mock(side_effect=[
-            step2_response_1,        # 1回目ステップ2
-            verification_response_1,  # 1回目ステップ3（失敗）
-            retry_step1_response,     # 再試行ステップ1
-            step2_response_2,         # 再試行ステップ2
-            verification_response_2   # 再試行ステップ3（成功）
-        ])
+        secretary.ollama_client.chat = Mock(side_effect=chat_seq)
 
         result = secretary._execute_bash_workflow(
             user_message="ファイル一覧を教えて",
@@ -144,46 +159,6 @@ class TestThreeStepBashWorkflow:
             enable_verification=True
         )
 
-        assert result == step2_response_2
-        assert secretary.ollama_client.chat.call_count == 5
-        assert mock_bash_executor.execute.call_count == 2  # 1回目 + 再試行
-
-    def test_execute_bash_workflow_max_retry_exceeded(
-        self, secretary, mock_bash_executor
-    ):
-        """最大再試行回数超過時のエラーハンドリング"""
-        initial_response = {
-            "text": "ファイルを確認します",
-            "bashActions": [{"command": "ls", "reason": "ファイル一覧"}]
-        }
-
-        # すべて検証失敗
-        step2_response = {"text": "結果"}
-        verification_response = {
-            "success": False,
-            "reason": "失敗",
-            "suggestion": "別のコマンドを試してください"
-        }
-        retry_response = {
-            "text": "再試行",
-            "bashActions": [{"command": "pwd", "reason": "テスト"}]
-        }
-
-        secretary.ollama_client.chat = Mock(side_effect=[
-            step2_response, verification_response,  # 1回目失敗
-            retry_response,
-            step2_response, verification_response,  # 2回目失敗
-            retry_response,
-            step2_response, verification_response,  # 3回目失敗
-        ])
-
-        result = secretary._execute_bash_workflow(
-            user_message="テスト",
-            initial_response=initial_response,
-            max_retry=2,
-            enable_verification=True
-        )
-
-        # エラーメッセージが含まれているか
-        assert "申し訳ございません" in result["text"]
-        assert "失敗しました" in result["text"]
+        assert all(s in result["text"] for s in expected_substrings)
+        assert secretary.ollama_client.chat.call_count == len(chat_seq)
+        assert mock_bash_executor.execute.call_count == expected_exec_calls
@@ -1,13 +1,14 @@
 """AISecretaryのCOEIROINK連携に関するテスト"""
 
+import json
 from pathlib import Path
 from typing import Any, Dict, List
 
 import pytest
+import requests
 
 from src.ai_secretary.config import Config
-from src.ai_secretary.secretary import AISecretary
-from src.coeiroink_client import Speaker, VoiceParameters
+from src.coeiroink_client import COEIROINKClient
 
 
 class FakeOllamaClient:
@@ -23,46 +24,24 @@ class FakeOllamaClient:
         return self.response
 
 
-class FakeCoeiroClient:
-    """AISecretaryが利用するインターフェースを最小限で再現"""
-
-    def __init__(self, speaker: Speaker):
-        self.speakers = {speaker.speaker_name: speaker}
-        self.calls: List[Dict[str, Any]] = []
-
-    def synthesize(
-        self,
-        text: str,
-        speaker_name: str,
-        style_name: str = None,
-        parameters: VoiceParameters = None,
-        use_prosody: bool = False,
-        prosody_detail=None,
-        output_path: Path = None,
-    ):
-        self.calls.append(
-            {
-                "text": text,
-                "speaker_name": speaker_name,
-                "style_name": style_name,
-                "parameters": parameters,
-                "use_prosody": use_prosody,
-                "prosody_detail": prosody_detail,
-                "output_path": output_path,
-            }
-        )
-
-        if output_path:
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            # シンプルなWAVヘッダ(44byte) + 無音データ
-            silent_wav = (
-                b"RIFF$\x00\x00\x00WAVEfmt "
-                b"\x10\x00\x00\x00\x01\x00\x01\x00\x80>\x00\x00\x00}\x00\x00"
-                b"\x02\x00\x10\x00data\x00\x00\x00\x00"
-            )
-            output_path.write_bytes(silent_wav)
-
-        return b"fake-audio-bytes"
+# シンプルなWAVヘッダ(44byte) + 無音データ
+_SILENT_WAV_BYTES = (
+    b"RIFF$\x00\x00\x00WAVEfmt "
+    b"\x10\x00\x00\x00\x01\x00\x01\x00\x80>\x00\x00\x00}\x00\x00"
+    b"\x02\x00\x10\x00data\x00\x00\x00\x00"
+)
+
+_COEIROINK_URL = "http://coeiroink.test"
+
+
+def _http_response(status_code: int = 200, *, json_body: Any = None, content: bytes = b""):
+    """requests.Responseを直接組み立てる（ネットワークには出ない）"""
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = (
+        json.dumps(json_body).encode("utf-8") if json_body is not None else content
+    )
+    return response
 
 
 class FakeAudioPlayer:
@@ -92,13 +71,30 @@ def voice_plan():
     }
 
 
-def test_chat_generates_voice_and_audio(tmp_path, voice_plan):
-    speaker = Speaker(
-        speaker_name="テストスピーカー",
-        speaker_uuid="test-uuid",
-        styles=[{"styleName": "ノーマル", "styleId": 1}],
-        version="1.0",
-    )
+@pytest.mark.usefixtures("fresh_speaker_cache")
+def test_chat_generates_voice_and_audio(AISecretary, tmp_path, voice_plan, monkeypatch):
+    speakers_payload = [
+        {
+            "speakerName": "テストスピーカー",
+            "speakerUuid": "test-uuid",
+            "styles": [{"styleName": "ノーマル", "styleId": 1}],
+            "version": "1.0",
+        }
+    ]
+    synthesis_calls: List[Dict[str, Any]] = []
+
+    def fake_get(url, **kwargs):
+        assert url == f"{_COEIROINK_URL}/v1/speakers"
+        return _http_response(json_body=speakers_payload)
+
+    def fake_post(url, json=None, **kwargs):
+        assert url == f"{_COEIROINK_URL}/v1/synthesis"
+        synthesis_calls.append(json)
+        return _http_response(content=_SILENT_WAV_BYTES)
+
+    # HTTP層だけ差し替え、COEIROINKClient本体のロジックはそのまま通す
+    monkeypatch.setattr("src.coeiroink_client.client.requests.get", fake_get)
+    monkeypatch.setattr("src.coeiroink_client.client.requests.post", fake_post)
 
     config = Config(
         audio_output_dir=str(tmp_path / "audio"),
@@ -106,13 +102,12 @@ def test_chat_generates_voice_and_audio(tmp_path, voice_plan):
     )
 
     fake_ollama = FakeOllamaClient(response=voice_plan)
-    fake_coeiro = FakeCoeiroClient(speaker=speaker)
     fake_player = FakeAudioPlayer()
 
     secretary = AISecretary(
         config=config,
         ollama_client=fake_ollama,
-        coeiroink_client=fake_coeiro,
+        coeiroink_client=COEIROINKClient(api_url=_COEIROINK_URL),
         audio_player=fake_player,
     )
 
@@ -122,12 +117,13 @@ def test_chat_generates_voice_and_audio(tmp_path, voice_plan):
     assert result["audio_path"] is not None
 
     audio_path = Path(result["audio_path"])
-    assert audio_path.exists()
+    assert audio_path.read_bytes() == _SILENT_WAV_BYTES
     assert fake_player.played == [str(audio_path)]
 
-    assert len(fake_coeiro.calls) == 1
-    call = fake_coeiro.calls[0]
-    assert call["text"] == voice_plan["text"]
-    assert call["prosody_detail"] == voice_plan["prosodyDetail"]
-    assert call["parameters"].output_sampling_rate == voice_plan["outputSamplingRate"]
+    assert len(synthesis_calls) == 1
+    payload = synthesis_calls[0]
+    assert payload["text"] == voice_plan["text"]
+    assert payload["speakerUuid"] == voice_plan["speakerUuid"]
+    assert payload["prosodyDetail"] == voice_plan["prosodyDetail"]
+    assert payload["outputSamplingRate"] == voice_plan["outputSamplingRate"]
     assert result["played_audio"] is True
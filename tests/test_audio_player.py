@@ -3,12 +3,21 @@
 
 import pytest
 import wave
-import tempfile
-import os
-from unittest.mock import Mock, patch, MagicMock
+from pathlib import Path
+from unittest.mock import patch, MagicMock
 from src.audio_player import AudioPlayer
 
 
+def _write_silent_wav(path: Path) -> str:
+    """無音のWAVファイルを書き出してパス文字列を返す"""
+    with wave.open(str(path), 'wb') as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(44100)
+        wf.writeframes(b'\x00\x00' * 1000)  # 無音データ
+    return str(path)
+
+
 class TestAudioPlayer:
     """AudioPlayerクラスのテスト"""
 
@@ -80,66 +89,39 @@ class TestAudioPlayer:
             assert "利用可能な音声出力デバイス" in captured.out
             assert "Test Device" in captured.out
 
-    def test_play_wav_with_valid_file(self) -> None:
+    def test_play_wav_with_valid_file(self, tmp_path: Path) -> None:
         """正常なWAVファイル再生のテスト"""
-        # テンポラリWAVファイルを作成
-        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp_file:
-            tmp_path = tmp_file.name
-
-        try:
-            # シンプルなWAVファイルを作成
-            with wave.open(tmp_path, 'wb') as wf:
-                wf.setnchannels(1)
-                wf.setsampwidth(2)
-                wf.setframerate(44100)
-                wf.writeframes(b'\x00\x00' * 1000)  # 無音データ
-
-            with patch('src.audio_player.pyaudio.PyAudio') as mock_pyaudio:
-                mock_instance = mock_pyaudio.return_value
-                mock_stream = MagicMock()
-                mock_instance.open.return_value = mock_stream
+        wav_path = _write_silent_wav(tmp_path / "silent.wav")
 
-                player = AudioPlayer()
-                player.play_wav(tmp_path, device_index=None)
+        with patch('src.audio_player.pyaudio.PyAudio') as mock_pyaudio:
+            mock_instance = mock_pyaudio.return_value
+            mock_stream = MagicMock()
+            mock_instance.open.return_value = mock_stream
 
-                # ストリームが開かれたことを確認
-                mock_instance.open.assert_called_once()
-                # ストリームが適切にクローズされたことを確認
-                mock_stream.stop_stream.assert_called_once()
-                mock_stream.close.assert_called_once()
+            player = AudioPlayer()
+            player.play_wav(wav_path, device_index=None)
 
-        finally:
-            # テンポラリファイルを削除
-            if os.path.exists(tmp_path):
-                os.unlink(tmp_path)
+            # ストリームが開かれたことを確認
+            mock_instance.open.assert_called_once()
+            # ストリームが適切にクローズされたことを確認
+            mock_stream.stop_stream.assert_called_once()
+            mock_stream.close.assert_called_once()
 
-    def test_play_wav_with_device_index(self) -> None:
+    def test_play_wav_with_device_index(self, tmp_path: Path) -> None:
         """デバイス指定でのWAV再生テスト"""
-        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp_file:
-            tmp_path = tmp_file.name
-
-        try:
-            with wave.open(tmp_path, 'wb') as wf:
-                wf.setnchannels(1)
-                wf.setsampwidth(2)
-                wf.setframerate(44100)
-                wf.writeframes(b'\x00\x00' * 1000)
+        wav_path = _write_silent_wav(tmp_path / "silent.wav")
 
-            with patch('src.audio_player.pyaudio.PyAudio') as mock_pyaudio:
-                mock_instance = mock_pyaudio.return_value
-                mock_stream = MagicMock()
-                mock_instance.open.return_value = mock_stream
-
-                player = AudioPlayer()
-                player.play_wav(tmp_path, device_index=2)
+        with patch('src.audio_player.pyaudio.PyAudio') as mock_pyaudio:
+            mock_instance = mock_pyaudio.return_value
+            mock_stream = MagicMock()
+            mock_instance.open.return_value = mock_stream
 
-                # device_indexが渡されたことを確認
-                call_kwargs = mock_instance.open.call_args[1]
-                assert call_kwargs['output_device_index'] == 2
+            player = AudioPlayer()
+            player.play_wav(wav_path, device_index=2)
 
-        finally:
-            if os.path.exists(tmp_path):
-                os.unlink(tmp_path)
+            # device_indexが渡されたことを確認
+            call_kwargs = mock_instance.open.call_args[1]
+            assert call_kwargs['output_device_index'] == 2
 
     def test_play_wav_file_not_found(self) -> None:
         """存在しないファイルのテスト"""
@@ -148,37 +130,25 @@ class TestAudioPlayer:
             with pytest.raises(FileNotFoundError):
                 player.play_wav('/path/to/nonexistent/file.wav')
 
-    def test_select_and_play_with_default_device(self) -> None:
+    def test_select_and_play_with_default_device(self, tmp_path: Path) -> None:
         """デフォルトデバイスでの再生テスト"""
-        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp_file:
-            tmp_path = tmp_file.name
-
-        try:
-            with wave.open(tmp_path, 'wb') as wf:
-                wf.setnchannels(1)
-                wf.setsampwidth(2)
-                wf.setframerate(44100)
-                wf.writeframes(b'\x00\x00' * 1000)
-
-            with patch('src.audio_player.pyaudio.PyAudio') as mock_pyaudio:
-                mock_instance = mock_pyaudio.return_value
-                mock_instance.get_device_count.return_value = 1
-                mock_instance.get_device_info_by_index.return_value = {
-                    'index': 0,
-                    'name': 'Test Device',
-                    'maxOutputChannels': 2,
-                    'defaultSampleRate': 44100.0
-                }
-                mock_stream = MagicMock()
-                mock_instance.open.return_value = mock_stream
-
-                with patch('builtins.input', return_value=''):  # Enterキー
-                    player = AudioPlayer()
-                    player.select_and_play(tmp_path)
-
-                # play_wavが呼ばれたことを確認
-                mock_instance.open.assert_called_once()
-
-        finally:
-            if os.path.exists(tmp_path):
-                os.unlink(tmp_path)
+        wav_path = _write_silent_wav(tmp_path / "silent.wav")
+
+        with patch('src.audio_player.pyaudio.PyAudio') as mock_pyaudio:
+            mock_instance = mock_pyaudio.return_value
+            mock_instance.get_device_count.return_value = 1
+            mock_instance.get_device_info_by_index.return_value = {
+                'index': 0,
+                'name': 'Test Device',
+                'maxOutputChannels': 2,
+                'defaultSampleRate': 44100.0
+            }
+            mock_stream = MagicMock()
+            mock_instance.open.return_value = mock_stream
+
+            with patch('builtins.input', return_value=''):  # Enterキー
+                player = AudioPlayer()
+                player.select_and_play(wav_path)
+
+            # play_wavが呼ばれたことを確認
+            mock_instance.open.assert_called_once()
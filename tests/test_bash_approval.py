@@ -8,9 +8,10 @@ BASH承認システム（Phase 2）のテスト
 - AISecretary承認フローのテスト
 """
 
+import subprocess
 import threading
 import time
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -19,39 +20,55 @@ from src.bash_executor.exceptions import CommandNotAllowedError
 from src.server.approval_queue import BashApprovalQueue
 
 
+@pytest.fixture
+def no_subprocess(monkeypatch):
+    """承認/キューのロジック層テストからOSプロセスを起動させない
+
+    実コマンドを実行するのは tests/test_bash_real_commands.py 側に限定する。
+    """
+    popen = Mock(spec=subprocess.Popen)
+    run = Mock(spec=subprocess.run)
+    monkeypatch.setattr(subprocess, "Popen", popen)
+    monkeypatch.setattr(subprocess, "run", run)
+    yield
+    popen.assert_not_called()
+    run.assert_not_called()
+
+
+@pytest.mark.usefixtures("no_subprocess")
 class TestCommandValidatorApproval:
     """CommandValidatorの承認コールバック機能テスト"""
 
-    def test_whitelist_command_no_callback_needed(self):
-        """ホワイトリスト内のコマンドは承認不要で実行可能"""
-        validator = CommandValidator(
+    @pytest.fixture(scope="class")
+    @classmethod
+    def base_validator(cls):
+        """クラス内で共有するバリデーター（承認コールバックのみテストごとに差し替える）"""
+        return CommandValidator(
             allowed_commands=["ls", "pwd"],
             block_patterns=[],
             approval_callback=None,
         )
 
+    @pytest.fixture
+    def validator(self, base_validator):
+        """共有バリデーター（テスト後に承認コールバックを未設定へ戻す）"""
+        yield base_validator
+        base_validator.approval_callback = None
+
+    def test_whitelist_command_no_callback_needed(self, validator):
+        """ホワイトリスト内のコマンドは承認不要で実行可能"""
         # ホワイトリスト内のコマンドは例外を投げない
         validator.validate("ls -la", reason="list files")
 
-    def test_non_whitelist_command_no_callback_raises_error(self):
+    def test_non_whitelist_command_no_callback_raises_error(self, validator):
         """承認コールバックがない場合、ホワイトリスト外コマンドは拒否される"""
-        validator = CommandValidator(
-            allowed_commands=["ls"],
-            block_patterns=[],
-            approval_callback=None,
-        )
-
         with pytest.raises(CommandNotAllowedError, match="許可されていないコマンドです: rm"):
             validator.validate("rm -rf /", reason="dangerous command")
 
-    def test_approval_callback_approves_command(self):
+    def test_approval_callback_approves_command(self, validator):
         """承認コールバックがTrueを返すとコマンドが承認される"""
         approval_callback = Mock(return_value=True)
-        validator = CommandValidator(
-            allowed_commands=["ls"],
-            block_patterns=[],
-            approval_callback=approval_callback,
-        )
+        validator.approval_callback = approval_callback
 
         # 承認コールバックがTrueを返すので例外を投げない
         validator.validate("npm install", reason="install dependencies")
@@ -59,14 +76,10 @@ class TestCommandValidatorApproval:
         # コールバックが呼ばれたことを確認
         approval_callback.assert_called_once_with("npm install", "install dependencies")
 
-    def test_approval_callback_rejects_command(self):
+    def test_approval_callback_rejects_command(self, validator):
         """承認コールバックがFalseを返すとコマンドが拒否される"""
         approval_callback = Mock(return_value=False)
-        validator = CommandValidator(
-            allowed_commands=["ls"],
-            block_patterns=[],
-            approval_callback=approval_callback,
-        )
+        validator.approval_callback = approval_callback
 
         with pytest.raises(CommandNotAllowedError, match="コマンドが拒否されました: npm"):
             validator.validate("npm install", reason="install dependencies")
@@ -74,6 +87,7 @@ class TestCommandValidatorApproval:
         approval_callback.assert_called_once()
 
 
+@pytest.mark.usefixtures("no_subprocess")
 class TestBashApprovalQueue:
     """BashApprovalQueueのテスト"""
 
@@ -95,15 +109,18 @@ class TestBashApprovalQueue:
         queue = BashApprovalQueue()
         request_id = queue.add_request("npm install", "install deps")
 
+        barrier = threading.Barrier(2)
+
         # 別スレッドで承認を実行
         def approve_later():
-            time.sleep(0.1)
+            barrier.wait()
             queue.approve(request_id)
 
         thread = threading.Thread(target=approve_later)
         thread.start()
 
-        # 承認待機
+        # 承認待機（sleepではなくバリアで承認スレッドと同期する）
+        barrier.wait()
         approved = queue.wait_for_approval(request_id, timeout=1.0)
         thread.join()
 
@@ -114,20 +131,46 @@ class TestBashApprovalQueue:
         queue = BashApprovalQueue()
         request_id = queue.add_request("rm -rf /", "dangerous")
 
+        barrier = threading.Barrier(2)
+
         # 別スレッドで拒否を実行
         def reject_later():
-            time.sleep(0.1)
+            barrier.wait()
             queue.reject(request_id)
 
         thread = threading.Thread(target=reject_later)
         thread.start()
 
-        # 拒否待機
+        # 拒否待機（sleepではなくバリアで拒否スレッドと同期する）
+        barrier.wait()
         approved = queue.wait_for_approval(request_id, timeout=1.0)
         thread.join()
 
         assert approved is False
 
+    def test_approval_wakes_without_polling_latency(self):
+        """approveで待機者が即座に起床する（ポーリング間隔に依存しない）"""
+        queue = BashApprovalQueue()
+        request_id = queue.add_request("npm install", "install deps")
+        barrier = threading.Barrier(2)
+
+        def approve_later():
+            barrier.wait()
+            queue.approve(request_id)
+
+        thread = threading.Thread(target=approve_later)
+        thread.start()
+
+        barrier.wait()
+        started = time.perf_counter()
+        approved = queue.wait_for_approval(request_id, timeout=1.0)
+        elapsed = time.perf_counter() - started
+        thread.join()
+
+        assert approved is True
+        # Event.setで起床するならスレッド切り替え程度の時間で戻る（スケジューラの揺らぎ分の余裕を持たせる）
+        assert elapsed < 0.05
+
     def test_timeout_returns_false(self):
         """タイムアウト時はFalseを返す"""
         queue = BashApprovalQueue()
@@ -161,41 +204,45 @@ class TestBashApprovalQueue:
 class TestBashApprovalAPI:
     """承認API（/api/bash/pending, /api/bash/approve）のテスト"""
 
-    @pytest.fixture
-    def client(self):
-        """TestClientを作成"""
+    @pytest.fixture(scope="module")
+    def client(self, api_app):
+        """TestClientを作成（アプリはconftestのセッション共有インスタンス）"""
         from fastapi.testclient import TestClient
-        from src.server.app import create_app
 
-        app = create_app()
-        return TestClient(app)
+        return TestClient(api_app)
 
-    def test_get_pending_requests_empty(self, client):
+    @pytest.fixture
+    def approval_queue(self, client):
+        """テストごとに新しいキューを依存性オーバーライドで差し込む"""
+        from src.server.dependencies import get_bash_approval_queue
+
+        fresh_queue = BashApprovalQueue()
+        client.app.dependency_overrides[get_bash_approval_queue] = lambda: fresh_queue
+        yield fresh_queue
+        client.app.dependency_overrides.pop(get_bash_approval_queue, None)
+
+    def test_get_pending_requests_empty(self, client, approval_queue):
         """承認待ちリクエストがない場合"""
         response = client.get("/api/bash/pending")
         assert response.status_code == 200
         data = response.json()
-        assert "requests" in data
-        # 初期状態では空かもしれないが、存在する必要がある
-        assert isinstance(data["requests"], list)
+        assert data["requests"] == []
 
-    def test_approve_nonexistent_request(self, client):
+    def test_approve_nonexistent_request(self, client, approval_queue):
         """存在しないリクエストIDの承認は404エラー"""
         response = client.post("/api/bash/approve/nonexistent-id?approved=true")
         assert response.status_code == 404
 
-    def test_approve_request_workflow(self, client):
+    def test_approve_request_workflow(self, client, approval_queue):
         """承認リクエスト→承認のワークフロー"""
-        from src.server.dependencies import get_bash_approval_queue
-
-        queue = get_bash_approval_queue()
-        request_id = queue.add_request("echo hello", "test command")
+        request_id = approval_queue.add_request("echo hello", "test command")
 
         # 承認待ちリクエストを取得
         response = client.get("/api/bash/pending")
         assert response.status_code == 200
         data = response.json()
-        assert len(data["requests"]) >= 1
+        assert len(data["requests"]) == 1
+        assert data["requests"][0]["request_id"] == request_id
 
         # 承認を実行
         response = client.post(f"/api/bash/approve/{request_id}?approved=true")
@@ -1,11 +1,8 @@
 """Tests for browser history functionality."""
 
-import os
 import sqlite3
-import tempfile
 from datetime import datetime, timedelta
 from pathlib import Path
-from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -16,20 +13,21 @@ from src.browser_history import (
 )
 
 
+@pytest.fixture(scope="module")
+def shared_repository(module_memory_db_uri):
+    """モジュール内で共有するリポジトリ（スキーマ作成は1回だけ）"""
+    return BrowserHistoryRepository(db_path=module_memory_db_uri, fast_mode=True)
+
+
 class TestBrowserHistoryRepository:
     """BrowserHistoryRepositoryのテスト"""
 
     @pytest.fixture
-    def temp_db(self):
-        """一時データベースを作成"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            db_path = Path(tmpdir) / "test_browser.db"
-            yield db_path
-
-    @pytest.fixture
-    def repository(self, temp_db):
-        """テスト用リポジトリ"""
-        return BrowserHistoryRepository(db_path=temp_db)
+    def repository(self, shared_repository):
+        """テスト用リポジトリ（テスト後に全行を削除）"""
+        yield shared_repository
+        with shared_repository._connect() as conn:
+            conn.execute("DELETE FROM browser_history")
 
     def test_add_and_get_entry(self, repository):
         """エントリの追加と取得"""
@@ -64,8 +62,7 @@ class TestBrowserHistoryRepository:
             for i in range(5)
         ]
 
-        for entry in entries:
-            repository.add_entry(entry)
+        assert repository.add_entries(entries) == 5
 
         # 全件取得
         all_entries = repository.list_history(limit=10)
@@ -75,6 +72,20 @@ class TestBrowserHistoryRepository:
         assert all_entries[0].url == "https://example.com/0"
         assert all_entries[-1].url == "https://example.com/4"
 
+    def test_list_history_uses_visit_time_index(self, repository):
+        """新しい順の一覧はvisit_time索引で返す（全件ソートしない）"""
+        with repository._connect() as conn:
+            plan = " ".join(
+                row["detail"]
+                for row in conn.execute(
+                    "EXPLAIN QUERY PLAN SELECT * FROM browser_history"
+                    " ORDER BY visit_time DESC LIMIT 10"
+                )
+            )
+
+        assert "idx_browser_history_visit_time" in plan
+        assert "TEMP B-TREE" not in plan
+
     def test_search_history(self, repository):
         """履歴の検索"""
         entries = [
@@ -95,14 +106,17 @@ class TestBrowserHistoryRepository:
             ),
         ]
 
-        for entry in entries:
-            repository.add_entry(entry)
+        assert repository.add_entries(entries) == 3
 
         # GitHub検索
         results = repository.search_history("github")
         assert len(results) == 2
         assert all("github" in r.url.lower() for r in results)
 
+        # 3文字未満の検索語（索引を使わない部分一致）
+        results = repository.search_history("o2")
+        assert [r.title for r in results] == ["GitHub Repo 2"]
+
     def test_delete_old_entries(self, repository):
         """古いエントリの削除"""
         now = datetime.now()
@@ -129,6 +143,20 @@ class TestBrowserHistoryRepository:
         assert len(remaining) == 1
         assert remaining[0].url == "https://new.example.com"
 
+    def test_delete_old_entries_uses_visit_time_index(self, repository):
+        """古いエントリの削除はvisit_time索引の範囲検索で行う（全件走査しない）"""
+        with repository._connect() as conn:
+            plan = " ".join(
+                row["detail"]
+                for row in conn.execute(
+                    "EXPLAIN QUERY PLAN DELETE FROM browser_history WHERE visit_time < ?",
+                    ("2024-01-01",),
+                )
+            )
+
+        assert "SEARCH" in plan
+        assert "idx_browser_history_visit_time" in plan
+
     def test_duplicate_entry_prevention(self, repository):
         """重複エントリの防止"""
         entry = BrowserHistoryEntry(
@@ -151,6 +179,91 @@ class TestBrowserHistoryRepository:
         entries = repository.list_history(limit=10)
         assert len(entries) == 1
 
+    def test_entries_without_visit_id_are_not_deduplicated(self, repository):
+        """brave_visit_idのないエントリは重複判定の対象外"""
+        now = datetime.now()
+        first = repository.add_entry(
+            BrowserHistoryEntry(url="https://example.com", title="Example", visit_time=now)
+        )
+        second = repository.add_entry(
+            BrowserHistoryEntry(url="https://example.com", title="Example", visit_time=now)
+        )
+
+        assert first is not None and second is not None
+        assert first.id != second.id
+
+    def test_add_entries_skips_duplicates(self, repository):
+        """一括追加でも重複エントリは無視される"""
+        now = datetime.now()
+        entries = [
+            BrowserHistoryEntry(
+                url="https://example.com", title="Example", visit_time=now, brave_visit_id=1
+            ),
+            BrowserHistoryEntry(
+                url="https://example.com", title="Example", visit_time=now, brave_visit_id=1
+            ),
+            BrowserHistoryEntry(
+                url="https://example.org", title="Other", visit_time=now, brave_visit_id=2
+            ),
+        ]
+
+        assert repository.add_entries(entries) == 2
+        assert len(repository.list_history(limit=10)) == 2
+
+
+def _create_brave_history_db(db_path, visits):
+    """Brave(Chromium)形式の履歴DBを作成
+
+    Args:
+        db_path: 作成先パス
+        visits: (visit_id, url, title, chromium_visit_time) のリスト（urls.idはvisit_idと同じ）
+    """
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        """
+        CREATE TABLE urls (
+            id INTEGER PRIMARY KEY,
+            url TEXT,
+            title TEXT,
+            visit_count INTEGER
+        )
+        """
+    )
+    conn.execute(
+        """
+        CREATE TABLE visits (
+            id INTEGER PRIMARY KEY,
+            url INTEGER,
+            visit_time INTEGER,
+            transition INTEGER
+        )
+        """
+    )
+    conn.executemany(
+        "INSERT INTO urls (id, url, title, visit_count) VALUES (?, ?, ?, 1)",
+        [(visit_id, url, title) for visit_id, url, title, _ in visits],
+    )
+    conn.executemany(
+        "INSERT INTO visits (id, url, visit_time, transition) VALUES (?, ?, ?, 0)",
+        [(visit_id, visit_id, visit_time) for visit_id, _, _, visit_time in visits],
+    )
+    conn.commit()
+    conn.close()
+
+
+@pytest.fixture(scope="module")
+def mock_brave_db(tmp_path_factory):
+    """モックBrave履歴データベースを作成
+
+    インポーターは読み取り専用で開くだけで元ファイルを変更しないため、モジュール内で共有する。
+    """
+    db_path = tmp_path_factory.mktemp("brave") / "History"
+    # Chromiumタイムスタンプ（2020-01-01 00:00:00 UTC）
+    _create_brave_history_db(
+        db_path, [(1, "https://test.example.com", "Test Page", 13222278000000000)]
+    )
+    return db_path
+
 
 class TestBraveHistoryImporter:
     """BraveHistoryImporterのテスト"""
@@ -166,6 +279,17 @@ class TestBraveHistoryImporter:
         assert dt.month == 1
         assert dt.day == 1
 
+    def test_chromium_to_datetime_keeps_microseconds(self):
+        """マイクロ秒が丸め誤差なく保持される"""
+        chromium_ts = 13222278000000000 + 123_456
+
+        dt = BraveHistoryImporter.chromium_to_datetime(chromium_ts)
+
+        assert dt.microsecond == 123_456
+        assert dt.replace(microsecond=0) == BraveHistoryImporter.chromium_to_datetime(
+            13222278000000000
+        )
+
     def test_find_brave_history_path(self):
         """Brave履歴パスの検出（環境依存）"""
         importer = BraveHistoryImporter()
@@ -175,103 +299,95 @@ class TestBraveHistoryImporter:
         if path is not None:
             assert path.name == "History"
 
-    @pytest.fixture
-    def mock_brave_db(self):
-        """モックBrave履歴データベースを作成"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            db_path = Path(tmpdir) / "History"
-
-            # モックデータベース作成
-            conn = sqlite3.connect(db_path)
-            conn.execute(
-                """
-                CREATE TABLE urls (
-                    id INTEGER PRIMARY KEY,
-                    url TEXT,
-                    title TEXT,
-                    visit_count INTEGER
-                )
-                """
-            )
-            conn.execute(
-                """
-                CREATE TABLE visits (
-                    id INTEGER PRIMARY KEY,
-                    url INTEGER,
-                    visit_time INTEGER,
-                    transition INTEGER
-                )
-                """
-            )
-
-            # テストデータ挿入
-            # Chromiumタイムスタンプ（2020-01-01 00:00:00 UTC）
-            chromium_ts = 13222278000000000
-
-            conn.execute(
-                "INSERT INTO urls (id, url, title, visit_count) VALUES (1, ?, ?, ?)",
-                ("https://test.example.com", "Test Page", 1),
-            )
-            conn.execute(
-                "INSERT INTO visits (id, url, visit_time, transition) VALUES (1, 1, ?, 0)",
-                (chromium_ts,),
-            )
+    def test_import_history(self, mock_brave_db, memory_db_uri):
+        """履歴のインポート"""
+        repository = BrowserHistoryRepository(db_path=memory_db_uri, fast_mode=True)
+        importer = BraveHistoryImporter(repository=repository)
 
-            conn.commit()
-            conn.close()
+        # インポート実行
+        count = importer.import_history(brave_history_path=mock_brave_db, limit=10)
 
-            yield db_path
+        assert count == 1
 
-    def test_import_history(self, mock_brave_db):
-        """履歴のインポート"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            repo_db = Path(tmpdir) / "repo.db"
-            repository = BrowserHistoryRepository(db_path=repo_db)
-            importer = BraveHistoryImporter(repository=repository)
+        # インポートされたデータを確認
+        entries = repository.list_history(limit=10)
+        assert len(entries) == 1
+        assert entries[0].url == "https://test.example.com"
+        assert entries[0].title == "Test Page"
+        assert entries[0].visit_count == 1
+        assert entries[0].visit_time == BraveHistoryImporter.chromium_to_datetime(
+            13222278000000000
+        )
 
-            # インポート実行
-            count = importer.import_history(brave_history_path=mock_brave_db, limit=10)
+    def test_import_history_limit_and_since(self, tmp_path, memory_db_uri):
+        """limitは新しい順に適用され、since以前の訪問は取り込まれない"""
+        base_ts = 13222278000000000  # 2020-01-01 00:00:00 UTC
+        hour_us = 3_600 * 1_000_000
+        brave_db = tmp_path / "History"
+        _create_brave_history_db(
+            brave_db,
+            [
+                (1, "https://a.example.com", "A", base_ts),
+                (2, "https://b.example.com", "B", base_ts + hour_us + 123_456),
+                (3, "https://c.example.com", "C", base_ts + 2 * hour_us),
+            ],
+        )
+        repository = BrowserHistoryRepository(db_path=memory_db_uri, fast_mode=True)
+        importer = BraveHistoryImporter(repository=repository)
 
-            assert count == 1
+        since = BraveHistoryImporter.chromium_to_datetime(base_ts + hour_us)
+        count = importer.import_history(brave_history_path=brave_db, limit=2, since=since)
 
-            # インポートされたデータを確認
-            entries = repository.list_history(limit=10)
-            assert len(entries) == 1
-            assert entries[0].url == "https://test.example.com"
-            assert entries[0].title == "Test Page"
-            assert entries[0].visit_count == 1
+        assert count == 2
+        entries = repository.list_history(limit=10)
+        assert [e.url for e in entries] == ["https://c.example.com", "https://b.example.com"]
+        # マイクロ秒まで保持される
+        assert entries[1].visit_time == since + timedelta(microseconds=123_456)
 
-    def test_import_history_file_not_found(self):
+    def test_import_history_file_not_found(self, memory_db_uri):
         """存在しないファイルのインポート"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            repo_db = Path(tmpdir) / "repo.db"
-            repository = BrowserHistoryRepository(db_path=repo_db)
-            importer = BraveHistoryImporter(repository=repository)
-
-            # shutil.copyがIOErrorを発生させる
-            with pytest.raises((FileNotFoundError, IOError, OSError)):
-                importer.import_history(
-                    brave_history_path=Path("/nonexistent/History"), limit=10
-                )
+        repository = BrowserHistoryRepository(db_path=memory_db_uri, fast_mode=True)
+        importer = BraveHistoryImporter(repository=repository)
+
+        # 読み取り専用で開けない場合はFileNotFoundError（またはsqlite3.OperationalError）
+        with pytest.raises((FileNotFoundError, sqlite3.OperationalError)):
+            importer.import_history(
+                brave_history_path=Path("/nonexistent/History"), limit=10
+            )
 
-    def test_import_history_duplicate_prevention(self, mock_brave_db):
+    def test_import_history_duplicate_prevention(self, mock_brave_db, memory_db_uri):
         """重複インポートの防止"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            repo_db = Path(tmpdir) / "repo.db"
-            repository = BrowserHistoryRepository(db_path=repo_db)
-            importer = BraveHistoryImporter(repository=repository)
-
-            # 1回目のインポート
-            count1 = importer.import_history(brave_history_path=mock_brave_db, limit=10)
-            assert count1 == 1
-
-            # 2回目のインポート（同じデータ）
-            count2 = importer.import_history(brave_history_path=mock_brave_db, limit=10)
-            assert count2 == 0  # 重複なので0件
-
-            # データベース内の件数を確認
-            entries = repository.list_history(limit=10)
-            assert len(entries) == 1  # 重複排除により1件のみ
+        repository = BrowserHistoryRepository(db_path=memory_db_uri, fast_mode=True)
+        importer = BraveHistoryImporter(repository=repository)
+
+        # 1回目のインポート
+        count1 = importer.import_history(brave_history_path=mock_brave_db, limit=10)
+        assert count1 == 1
+
+        # 2回目のインポート（同じデータ）
+        count2 = importer.import_history(brave_history_path=mock_brave_db, limit=10)
+        assert count2 == 0  # 重複なので0件
+
+        # データベース内の件数を確認
+        entries = repository.list_history(limit=10)
+        assert len(entries) == 1  # 重複排除により1件のみ
+
+    def test_import_history_path_with_spaces(self, tmp_path, memory_db_uri):
+        """空白を含むパス（User Data等）もURIエンコードして読み取り専用で開ける"""
+        brave_dir = tmp_path / "User Data" / "Default"
+        brave_dir.mkdir(parents=True)
+        history_path = brave_dir / "History"
+        _create_brave_history_db(
+            history_path, [(1, "https://space.example.com", "Space", 13222278000000000)]
+        )
+        before = history_path.read_bytes()
+
+        repository = BrowserHistoryRepository(db_path=memory_db_uri, fast_mode=True)
+        importer = BraveHistoryImporter(repository=repository)
+
+        assert importer.import_history(brave_history_path=history_path) == 1
+        assert history_path.read_bytes() == before
+        assert sorted(p.name for p in brave_dir.iterdir()) == ["History"]
 
 
 class TestBrowserHistoryEntry:
@@ -3,29 +3,60 @@
 ChatHistoryRepositoryの単体テスト
 """
 
+import gc
+import sqlite3
+
 import pytest
-import json
-from pathlib import Path
+from datetime import datetime, timedelta, timezone
 from src.chat_history.repository import ChatHistoryRepository
-from src.chat_history.models import ChatSession
+from src.chat_history.models import ChatSession, ChatSessionSummary
+from src.utils import jsonio
 
 
-@pytest.fixture
-def test_db_path(tmp_path):
-    """テスト用の一時DBパス"""
-    import os
-    db_path = tmp_path / "test_chat_history.db"
-    os.environ["AI_SECRETARY_DB_PATH"] = str(db_path)
-    yield db_path
-    # クリーンアップ
-    if "AI_SECRETARY_DB_PATH" in os.environ:
-        del os.environ["AI_SECRETARY_DB_PATH"]
+@pytest.fixture(scope="module")
+def shared_repo(module_memory_db_uri):
+    """モジュール内で共有するChatHistoryRepository（スキーマ作成は1回だけ）"""
+    return ChatHistoryRepository(db_path=module_memory_db_uri, fast_mode=True)
 
 
 @pytest.fixture
-def repo(test_db_path):
-    """ChatHistoryRepositoryのインスタンス"""
-    return ChatHistoryRepository(db_path=test_db_path)
+def repo(shared_repo):
+    """ChatHistoryRepositoryのインスタンス（テスト後に全行を削除）"""
+    yield shared_repo
+    with shared_repo._connect() as conn:
+        conn.execute("DELETE FROM chat_history")
+
+
+def test_fast_mode_enables_wal(tmp_path):
+    """fast_modeでWALとsynchronous=NORMALが設定されることを確認"""
+    repo = ChatHistoryRepository(db_path=tmp_path / "fast.db", fast_mode=True)
+
+    with repo._connect() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+
+
+def test_schema_recreated_after_db_file_removed(tmp_path):
+    """同じパスのDBファイルが削除されていてもスキーマを作り直す"""
+    db_path = tmp_path / "recreate.db"
+    ChatHistoryRepository(db_path=db_path)
+    db_path.unlink()
+
+    repo = ChatHistoryRepository(db_path=db_path)
+
+    assert repo.list_sessions() == []
+
+
+def test_schema_recreated_after_memory_db_discarded(_shared_db_factory):
+    """共有キャッシュのインメモリDBが最後の接続で破棄された後も、同じURIで作り直す"""
+    uri = _shared_db_factory()
+    ChatHistoryRepository(db_path=uri).create_session("before", "破棄前", [])
+    gc.collect()  # 開いたままの接続を確実に閉じ、インメモリDBを破棄させる
+
+    repo = ChatHistoryRepository(db_path=uri)
+    repo.create_session("after", "破棄後", [])
+
+    assert [s.session_id for s in repo.list_sessions()] == ["after"]
 
 
 def test_create_session(repo):
@@ -156,48 +187,154 @@ def test_save_or_update_update(repo):
 
 def test_list_sessions(repo):
     """セッション一覧取得のテスト"""
-    import time
+    base_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
 
-    # 複数のセッションを作成（時間差をつける）
+    # 複数のセッションを作成（作成日時を1秒ずつずらして明示指定）
     for i in range(3):
         repo.create_session(
             session_id=f"list-test-{i}",
             title=f"セッション{i}",
-            messages=[{"role": "user", "content": f"メッセージ{i}"}]
+            messages=[{"role": "user", "content": f"メッセージ{i}"}],
+            created_at=base_time + timedelta(seconds=i),
         )
-        time.sleep(0.01)  # わずかに時間差をつける
 
     sessions = repo.list_sessions(limit=10)
 
     assert len(sessions) == 3
+    assert all(isinstance(s, ChatSessionSummary) for s in sessions)
     # 新しい順に並んでいることを確認
     assert sessions[0].session_id == "list-test-2"
+    assert sessions[0].created_at == (base_time + timedelta(seconds=2)).isoformat()
+    assert sessions[0].message_count == 1
 
 
-def test_list_sessions_with_limit(repo):
-    """セッション一覧取得（件数制限）のテスト"""
+def test_list_sessions_keyset_pagination(repo):
+    """before_updated_atに前ページ最後のupdated_atを渡して次ページを取得できる"""
+    base_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
     for i in range(5):
         repo.create_session(
-            session_id=f"limit-test-{i}",
-            title=f"セッション{i}",
-            messages=[{"role": "user", "content": f"メッセージ{i}"}]
+            session_id=f"page-{i}",
+            title=f"ページ{i}",
+            messages=[{"role": "user", "content": str(i)}],
+            created_at=base_time + timedelta(seconds=i),
+        )
+
+    first = repo.list_sessions(limit=2)
+    second = repo.list_sessions(limit=2, before_updated_at=first[-1].updated_at)
+    last = repo.list_sessions(
+        limit=2, before_updated_at=base_time + timedelta(seconds=1)
+    )
+
+    assert [s.session_id for s in first] == ["page-4", "page-3"]
+    assert [s.session_id for s in second] == ["page-2", "page-1"]
+    assert [s.session_id for s in last] == ["page-0"]
+
+    with repo._connect() as conn:
+        plan = " ".join(
+            row["detail"]
+            for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT id FROM chat_history "
+                "WHERE (updated_at, session_id) < (?, ?) "
+                "ORDER BY updated_at DESC, session_id DESC LIMIT 2",
+                (first[-1].updated_at, first[-1].session_id),
+            )
+        )
+    assert "idx_chat_updated_session" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_list_sessions_keyset_pagination_with_equal_timestamps(repo):
+    """同じupdated_atの行がページ境界をまたいでも、複合カーソルで取りこぼさない"""
+    repo.create_sessions((f"s{i}", f"一括{i}", []) for i in range(4))
+
+    pages = []
+    cursor = {}
+    while True:
+        page = repo.list_sessions(limit=2, **cursor)
+        if not page:
+            break
+        pages.append([s.session_id for s in page])
+        cursor = {
+            "before_updated_at": page[-1].updated_at,
+            "before_session_id": page[-1].session_id,
+        }
+
+    assert pages == [["s3", "s2"], ["s1", "s0"]]
+
+
+def test_list_sessions_include_messages(repo):
+    """include_messages=Trueの場合はmessagesを含むChatSessionを返す"""
+    repo.create_session(
+        session_id="list-full",
+        title="本文付き",
+        messages=[
+            {"role": "user", "content": "質問"},
+            {"role": "assistant", "content": "回答"},
+        ],
+    )
+
+    summary = repo.list_sessions(limit=10)[0]
+    full = repo.list_sessions(limit=10, include_messages=True)[0]
+
+    assert not hasattr(summary, "messages_json")
+    assert isinstance(full, ChatSession)
+    assert full.messages[1]["content"] == "回答"
+    assert full.message_count == summary.message_count == 2
+
+
+def test_list_and_lookup_use_indexes(repo):
+    """一覧はupdated_at索引、session_id検索はUNIQUE索引を使う（全件ソートしない）"""
+    with repo._connect() as conn:
+        list_plan = " ".join(
+            row["detail"]
+            for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM chat_history ORDER BY updated_at DESC LIMIT 10"
+            )
+        )
+        lookup_plan = " ".join(
+            row["detail"]
+            for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM chat_history WHERE session_id = 'x'"
+            )
         )
 
+    assert "idx_chat_updated" in list_plan
+    assert "TEMP B-TREE" not in list_plan
+    assert "USING INDEX" in lookup_plan
+
+
+def test_list_sessions_with_limit(repo):
+    """セッション一覧取得（件数制限）のテスト"""
+    created = repo.create_sessions(
+        (f"limit-test-{i}", f"セッション{i}", [{"role": "user", "content": f"メッセージ{i}"}])
+        for i in range(5)
+    )
+    assert created == 5
+
     sessions = repo.list_sessions(limit=3)
     assert len(sessions) == 3
 
 
+def test_create_sessions_duplicate_rolls_back(repo):
+    """一括作成でsession_idが重複した場合は全件ロールバックされる"""
+    with pytest.raises(sqlite3.IntegrityError):
+        repo.create_sessions(
+            [
+                ("bulk-dup", "1件目", [{"role": "user", "content": "a"}]),
+                ("bulk-dup", "2件目", [{"role": "user", "content": "b"}]),
+            ]
+        )
+
+    assert repo.list_sessions(limit=10) == []
+
+
 def test_search_sessions_by_title(repo):
     """タイトル検索のテスト"""
-    repo.create_session(
-        session_id="search-1",
-        title="Pythonの質問",
-        messages=[{"role": "user", "content": "Pythonについて"}]
-    )
-    repo.create_session(
-        session_id="search-2",
-        title="Javaの質問",
-        messages=[{"role": "user", "content": "Javaについて"}]
+    repo.create_sessions(
+        [
+            ("search-1", "Pythonの質問", [{"role": "user", "content": "Pythonについて"}]),
+            ("search-2", "Javaの質問", [{"role": "user", "content": "Javaについて"}]),
+        ]
     )
 
     results = repo.search_sessions("Python")
@@ -208,21 +345,72 @@ def test_search_sessions_by_title(repo):
 
 def test_search_sessions_by_message_content(repo):
     """メッセージ内容検索のテスト"""
+    repo.create_sessions(
+        [
+            ("content-search-1", "セッション1", [{"role": "user", "content": "Dockerの使い方"}]),
+            ("content-search-2", "セッション2", [{"role": "user", "content": "uvのインストール"}]),
+        ]
+    )
+
+    results = repo.search_sessions("Docker")
+
+    assert len(results) == 1
+    assert results[0].session_id == "content-search-1"
+
+
+def test_search_sessions_reflects_updates(repo):
+    """更新後の内容で検索でき、古い内容ではヒットしない（FTS索引の同期）"""
     repo.create_session(
-        session_id="content-search-1",
-        title="セッション1",
-        messages=[{"role": "user", "content": "Dockerの使い方"}]
+        session_id="fts-update",
+        title="セッション",
+        messages=[{"role": "user", "content": "Kubernetesの設定"}]
+    )
+    repo.update_session(
+        session_id="fts-update",
+        messages=[{"role": "user", "content": "Terraformの設定"}]
     )
+
+    assert repo.search_sessions("Kubernetes") == []
+    assert [s.session_id for s in repo.search_sessions("Terraform")] == ["fts-update"]
+
+
+def test_search_sessions_short_query(repo):
+    """3文字未満の検索語でも部分一致で検索できる"""
     repo.create_session(
-        session_id="content-search-2",
-        title="セッション2",
+        session_id="short-1",
+        title="セッション",
         messages=[{"role": "user", "content": "uvのインストール"}]
     )
 
-    results = repo.search_sessions("Docker")
+    results = repo.search_sessions("uv")
+
+    assert [s.session_id for s in results] == ["short-1"]
+
+
+def test_search_index_built_for_existing_db(tmp_path):
+    """FTS導入前に作られた既存DBでも、既存行が検索対象になる"""
+    db_path = tmp_path / "legacy.db"
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            """
+            CREATE TABLE chat_history (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                session_id TEXT NOT NULL UNIQUE,
+                title TEXT NOT NULL,
+                messages_json TEXT NOT NULL,
+                created_at TEXT NOT NULL,
+                updated_at TEXT NOT NULL
+            )
+            """
+        )
+        conn.execute(
+            "INSERT INTO chat_history (session_id, title, messages_json, created_at, updated_at)"
+            " VALUES ('legacy-1', '既存セッション', '[]', '2024-01-01', '2024-01-01')"
+        )
 
-    assert len(results) == 1
-    assert results[0].session_id == "content-search-1"
+    repo = ChatHistoryRepository(db_path=db_path)
+
+    assert [s.session_id for s in repo.search_sessions("既存セッ")] == ["legacy-1"]
 
 
 def test_delete_session(repo):
@@ -248,6 +436,24 @@ def test_delete_nonexistent_session(repo):
     assert deleted is False
 
 
+def test_count_messages_by_role(repo):
+    """ロール別のメッセージ数をSQLで数える"""
+    repo.create_session(
+        session_id="count-test",
+        title="カウント",
+        messages=[
+            {"role": "system", "content": "プロンプト"},
+            {"role": "user", "content": "1"},
+            {"role": "assistant", "content": "2"},
+            {"role": "user", "content": "3"},
+        ]
+    )
+
+    assert repo.count_messages_by_role("count-test", "user") == 2
+    assert repo.count_messages_by_role("count-test", "assistant") == 1
+    assert repo.count_messages_by_role("nonexistent", "user") == 0
+
+
 def test_chat_session_messages_property(repo):
     """ChatSession.messagesプロパティのテスト"""
     messages = [
@@ -267,3 +473,43 @@ def test_chat_session_messages_property(repo):
     assert isinstance(parsed_messages, list)
     assert len(parsed_messages) == 2
     assert parsed_messages == messages
+
+
+def test_chat_session_messages_returns_copy(monkeypatch):
+    """messagesはコピーを返し、呼び出し側の変更でキャッシュとJSONがずれない"""
+    session = ChatSession(
+        id=1,
+        session_id="copy-test",
+        title="コピー",
+        messages_json='[{"role": "user", "content": "元"}]',
+        created_at="2024-01-01T00:00:00",
+        updated_at="2024-01-01T00:00:00",
+    )
+    calls = []
+    original_loads = jsonio.loads
+
+    def counting_loads(text):
+        calls.append(text)
+        return original_loads(text)
+
+    monkeypatch.setattr(jsonio, "loads", counting_loads)
+
+    session.messages.append({"role": "user", "content": "追加"})
+
+    assert session.messages == [{"role": "user", "content": "元"}]
+    assert session.message_count == 1
+    assert len(calls) == 1  # JSONのデコードは初回のみ
+
+
+def test_chat_session_set_messages_invalidates_cache(repo):
+    """set_messages後はmessagesが新しい内容を返す"""
+    session = repo.create_session(
+        session_id="cache-test",
+        title="キャッシュ",
+        messages=[{"role": "user", "content": "旧"}]
+    )
+    assert session.messages == [{"role": "user", "content": "旧"}]
+
+    session.set_messages([{"role": "user", "content": "新"}])
+
+    assert session.messages == [{"role": "user", "content": "新"}]
@@ -3,24 +3,27 @@
 AISecretaryとChatHistoryRepositoryの統合テスト
 """
 
+import sqlite3
+
 import pytest
-import os
-from pathlib import Path
-from unittest.mock import Mock, MagicMock
+from unittest.mock import Mock
 from src.ai_secretary.secretary import AISecretary
 from src.ai_secretary.config import Config, OllamaConfig
 from src.chat_history.repository import ChatHistoryRepository
 
 
 @pytest.fixture
-def test_db_path(tmp_path):
-    """テスト用の一時DBパス"""
-    db_path = tmp_path / "test_integration.db"
-    os.environ["AI_SECRETARY_DB_PATH"] = str(db_path)
-    yield db_path
-    # クリーンアップ
-    if "AI_SECRETARY_DB_PATH" in os.environ:
-        del os.environ["AI_SECRETARY_DB_PATH"]
+def test_db_path(module_memory_db_uri):
+    """テスト用のインメモリDB（モジュール内で共有し、テスト後に全行を削除）
+
+    同じDBを使い回すため、2回目以降のChatHistoryRepository構築ではスキーマ作成が省略される。
+    接続先はリポジトリへ明示的に渡し、環境変数は使わない（pytest -n auto でも互いに干渉しない）。
+    """
+    yield module_memory_db_uri
+    conn = sqlite3.connect(module_memory_db_uri, uri=True)
+    with conn:
+        conn.execute("DELETE FROM chat_history")
+    conn.close()
 
 
 @pytest.fixture
@@ -60,7 +63,7 @@ def secretary(test_db_path, mock_ollama_client):
     )
 
     # ChatHistoryRepositoryを明示的に初期化
-    chat_repo = ChatHistoryRepository(db_path=test_db_path)
+    chat_repo = ChatHistoryRepository(db_path=test_db_path, fast_mode=True)
 
     secretary_instance = AISecretary(
         config=config,
@@ -74,13 +77,13 @@ def secretary(test_db_path, mock_ollama_client):
     return secretary_instance
 
 
-def test_chat_saves_history_automatically(secretary, test_db_path):
+def test_chat_saves_history_automatically(secretary):
     """会話が自動的に履歴に保存されることを確認"""
     # 最初の会話
     secretary.chat("こんにちは", return_json=True, play_audio=False)
 
-    # 履歴が保存されているか確認
-    repo = ChatHistoryRepository(db_path=test_db_path)
+    # 履歴が保存されているか確認（secretaryが保持する接続先をそのまま使う）
+    repo = secretary.chat_history_repo
     session = repo.get_session(secretary.session_id)
 
     assert session is not None
@@ -89,7 +92,7 @@ def test_chat_saves_history_automatically(secretary, test_db_path):
     assert len(session.messages) >= 2  # user + assistant（+ system prompts）
 
 
-def test_multiple_chats_append_to_session(secretary, test_db_path):
+def test_multiple_chats_append_to_session(secretary):
     """複数回の会話が同じセッションに追記されることを確認"""
     # 複数回会話
     secretary.chat("最初の質問", return_json=True, play_audio=False)
@@ -97,43 +100,40 @@ def test_multiple_chats_append_to_session(secretary, test_db_path):
     secretary.chat("3回目の質問", return_json=True, play_audio=False)
 
     # 履歴確認
-    repo = ChatHistoryRepository(db_path=test_db_path)
-    session = repo.get_session(secretary.session_id)
+    repo = secretary.chat_history_repo
+    session_id = secretary.session_id
 
-    assert session is not None
+    assert repo.get_session(session_id) is not None
     # user + assistant のペアが3組 + system prompts
-    user_messages = [m for m in session.messages if m.get("role") == "user"]
-    assistant_messages = [m for m in session.messages if m.get("role") == "assistant"]
-
-    assert len(user_messages) == 3
-    assert len(assistant_messages) == 3
+    assert repo.count_messages_by_role(session_id, "user") == 3
+    assert repo.count_messages_by_role(session_id, "assistant") == 3
 
 
-def test_session_title_generated_from_first_message(secretary, test_db_path):
+def test_session_title_generated_from_first_message(secretary):
     """セッションタイトルが最初のメッセージから生成されることを確認"""
     first_message = "これは最初のメッセージです"
     secretary.chat(first_message, return_json=True, play_audio=False)
 
-    repo = ChatHistoryRepository(db_path=test_db_path)
+    repo = secretary.chat_history_repo
     session = repo.get_session(secretary.session_id)
 
     assert session is not None
     assert session.title == first_message
 
 
-def test_long_message_truncated_in_title(secretary, test_db_path):
+def test_long_message_truncated_in_title(secretary):
     """長いメッセージがタイトルで切り詰められることを確認"""
     long_message = "これは非常に長いメッセージです。" * 10  # 30文字を超える
     secretary.chat(long_message, return_json=True, play_audio=False)
 
-    repo = ChatHistoryRepository(db_path=test_db_path)
+    repo = secretary.chat_history_repo
     session = repo.get_session(secretary.session_id)
 
     assert session is not None
     assert len(session.title) <= 33  # 30文字 + "..."
 
 
-def test_reset_conversation_creates_new_session(secretary, test_db_path):
+def test_reset_conversation_creates_new_session(secretary):
     """会話リセット時に新しいセッションが作成されることを確認"""
     # 最初のセッション
     secretary.chat("最初のセッション", return_json=True, play_audio=False)
@@ -150,7 +150,7 @@ def test_reset_conversation_creates_new_session(secretary, test_db_path):
     assert first_session_id != second_session_id
 
     # 両方のセッションがDBに保存されている
-    repo = ChatHistoryRepository(db_path=test_db_path)
+    repo = secretary.chat_history_repo
     session1 = repo.get_session(first_session_id)
     session2 = repo.get_session(second_session_id)
 
@@ -160,7 +160,7 @@ def test_reset_conversation_creates_new_session(secretary, test_db_path):
     assert session2.title == "2回目のセッション"
 
 
-def test_load_session_restores_conversation(secretary, test_db_path):
+def test_load_session_restores_conversation(secretary):
     """セッション読み込みで会話が復元されることを確認"""
     # 最初のセッションで会話
     secretary.chat("過去の会話1", return_json=True, play_audio=False)
@@ -191,7 +191,7 @@ def test_load_nonexistent_session_fails(secretary):
     assert loaded is False
 
 
-def test_continue_conversation_after_load(secretary, test_db_path):
+def test_continue_conversation_after_load(secretary):
     """読み込んだセッションで会話を継続できることを確認"""
     # 最初のセッション
     secretary.chat("最初の質問", return_json=True, play_audio=False)
@@ -205,7 +205,7 @@ def test_continue_conversation_after_load(secretary, test_db_path):
     secretary.chat("続きの質問", return_json=True, play_audio=False)
 
     # DBから確認
-    repo = ChatHistoryRepository(db_path=test_db_path)
+    repo = secretary.chat_history_repo
     session = repo.get_session(old_session_id)
 
     user_messages = [m for m in session.messages if m.get("role") == "user"]
@@ -214,7 +214,7 @@ def test_continue_conversation_after_load(secretary, test_db_path):
     assert user_messages[1]["content"] == "続きの質問"
 
 
-def test_session_list_shows_all_conversations(secretary, test_db_path):
+def test_session_list_shows_all_conversations(secretary):
     """複数セッションが一覧で取得できることを確認"""
     # 3つのセッションを作成
     for i in range(3):
@@ -222,7 +222,7 @@ def test_session_list_shows_all_conversations(secretary, test_db_path):
         secretary.chat(f"セッション{i+1}", return_json=True, play_audio=False)
 
     # 一覧取得
-    repo = ChatHistoryRepository(db_path=test_db_path)
+    repo = secretary.chat_history_repo
     sessions = repo.list_sessions(limit=10)
 
     assert len(sessions) == 3
@@ -232,7 +232,7 @@ def test_session_list_shows_all_conversations(secretary, test_db_path):
     assert sessions[2].title == "セッション1"
 
 
-def test_search_sessions_by_keyword(secretary, test_db_path):
+def test_search_sessions_by_keyword(secretary):
     """キーワードでセッション検索できることを確認"""
     # 異なる内容のセッションを作成
     secretary.chat("Pythonについて教えて", return_json=True, play_audio=False)
@@ -240,7 +240,7 @@ def test_search_sessions_by_keyword(secretary, test_db_path):
     secretary.chat("Javaについて教えて", return_json=True, play_audio=False)
 
     # 検索
-    repo = ChatHistoryRepository(db_path=test_db_path)
+    repo = secretary.chat_history_repo
     results = repo.search_sessions("Python")
 
     assert len(results) == 1
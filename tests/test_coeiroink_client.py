@@ -2,11 +2,13 @@
 """coeiroink_clientモジュールのテスト"""
 
 import pytest
+import functools
+import hashlib
 import json
-from unittest.mock import Mock, patch, MagicMock, mock_open
+import re
+import requests
+from unittest.mock import Mock, patch
 from pathlib import Path
-import tempfile
-import os
 
 from src.coeiroink_client import (
     Speaker,
@@ -16,6 +18,54 @@ from src.coeiroink_client import (
     COEIROINKClient
 )
 
+_SPEAKER_NOT_FOUND_RE = re.compile(r"スピーカー .* が見つかりません")
+
+
+def _file_digest(path: Path) -> bytes:
+    """ファイルをチャンク単位で読みながらBLAKE2bダイジェストを計算"""
+    with open(path, 'rb') as f:
+        return hashlib.file_digest(f, "blake2b").digest()
+
+
+@functools.cache
+def _default_speakers_payload():
+    """既定の /v1/speakers レスポンス本文（初回のみ構築し、以降は同じオブジェクトを返す）
+
+    テスト間で共有されるため、呼び出し側で変更しないこと。
+    """
+    return [
+        {
+            "speakerName": "TestSpeaker",
+            "speakerUuid": "uuid-test",
+            "styles": [{"styleName": "style1", "styleId": 0}],
+            "version": "1.0.0"
+        }
+    ]
+
+
+def _resp(json_data=None, content=b""):
+    """requests.Response のモックを1回の生成で作成（spec_setで存在しない属性の設定を防ぐ）"""
+    return Mock(
+        spec_set=requests.Response,
+        **{
+            "json.return_value": json_data,
+            "raise_for_status.return_value": None,
+            "content": content,
+        },
+    )
+
+
+@pytest.fixture(scope="module")
+def coeiroink_client():
+    """スピーカー読み込み済みのクライアントとrequests.getモック（モジュール内で共有）
+
+    クライアントは読み取り専用で使う。別のスピーカー一覧が必要なテストは
+    モックの json.return_value を差し替えてから COEIROINKClient() を作り直す。
+    """
+    with patch('src.coeiroink_client.client.requests.get') as mock_get:
+        mock_get.return_value = _resp(_default_speakers_payload())
+        yield COEIROINKClient(), mock_get
+
 
 class TestSpeaker:
     """Speakerクラスのテスト"""
@@ -84,34 +134,18 @@ class TestVoiceParameters:
         assert params.post_phoneme_length == 0.5
         assert params.output_sampling_rate == 24000
 
-    def test_validate_valid_parameters(self) -> None:
-        """正常なパラメータの検証テスト"""
-        params = VoiceParameters(
-            speed_scale=1.0,
-            volume_scale=1.0,
-            pitch_scale=0.0,
-            intonation_scale=1.0,
-            pre_phoneme_length=0.1,
-            post_phoneme_length=0.5,
-            output_sampling_rate=24000
-        )
-
-        assert params.validate() is True
-
-    def test_validate_invalid_speed(self) -> None:
-        """無効な速度パラメータの検証テスト"""
-        params = VoiceParameters(speed_scale=3.0)  # 範囲外
-        assert params.validate() is False
-
-    def test_validate_invalid_pitch(self) -> None:
-        """無効なピッチパラメータの検証テスト"""
-        params = VoiceParameters(pitch_scale=0.5)  # 範囲外
-        assert params.validate() is False
-
-    def test_validate_invalid_sampling_rate(self) -> None:
-        """無効なサンプリングレートの検証テスト"""
-        params = VoiceParameters(output_sampling_rate=32000)  # 未対応
-        assert params.validate() is False
+    @pytest.mark.parametrize(
+        "kwargs, expected",
+        [
+            pytest.param({}, True, id="valid"),
+            pytest.param({"speed_scale": 3.0}, False, id="invalid_speed"),
+            pytest.param({"pitch_scale": 0.5}, False, id="invalid_pitch"),
+            pytest.param({"output_sampling_rate": 32000}, False, id="invalid_sampling_rate"),
+        ],
+    )
+    def test_validate(self, kwargs, expected) -> None:
+        """パラメータ検証のテスト（範囲外・未対応の値はFalse）"""
+        assert VoiceParameters(**kwargs).validate() is expected
 
 
 class TestProsodyMora:
@@ -161,15 +195,15 @@ class TestSynthesisRequest:
         assert api_format["intonationScale"] == 1.3
 
 
+@pytest.mark.usefixtures("fresh_speaker_cache")
 class TestCOEIROINKClient:
     """COEIROINKClientクラスのテスト"""
 
-    @patch('src.coeiroink_client.requests.get')
+    @patch('src.coeiroink_client.client.requests.get')
     def test_init_and_load_speakers(self, mock_get: Mock) -> None:
         """初期化とスピーカー読み込みのテスト"""
         # モックレスポンス
-        mock_response = Mock()
-        mock_response.json.return_value = [
+        mock_get.return_value = _resp([
             {
                 "speakerName": "つくよみちゃん",
                 "speakerUuid": "uuid-1",
@@ -182,9 +216,7 @@ class TestCOEIROINKClient:
                 "styles": [{"styleName": "ノーマル", "styleId": 0}],
                 "version": "1.0.0"
             }
-        ]
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
+        ])
 
         client = COEIROINKClient()
 
@@ -193,42 +225,63 @@ class TestCOEIROINKClient:
         assert "MANA" in client.speakers
         mock_get.assert_called_once_with("http://localhost:50032/v1/speakers", timeout=5)
 
-    @patch('src.coeiroink_client.requests.get')
-    def test_list_speakers(self, mock_get: Mock) -> None:
-        """スピーカーリスト取得のテスト"""
-        mock_response = Mock()
-        mock_response.json.return_value = [
-            {
-                "speakerName": "Speaker1",
-                "speakerUuid": "uuid-1",
-                "styles": [{"styleName": "style1", "styleId": 0}],
-                "version": "1.0.0"
-            }
-        ]
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
+    @patch('src.coeiroink_client.client.requests.get')
+    def test_speaker_list_cached_across_instances(self, mock_get: Mock) -> None:
+        """同じAPI URLのクライアントを作り直してもスピーカー一覧は1回しか取得しない"""
+        mock_get.return_value = _resp(_default_speakers_payload())
 
-        client = COEIROINKClient()
-        speakers = client.list_speakers()
+        first = COEIROINKClient()
+        second = COEIROINKClient()
+        COEIROINKClient(api_url="http://other-host:50032")
 
-        assert speakers == ["Speaker1"]
+        assert mock_get.call_count == 2
+        assert second.list_speakers() == first.list_speakers() == ["TestSpeaker"]
+        # Speakerはクライアントごとに作られ、共有されない
+        assert second.get_speaker("TestSpeaker") is not first.get_speaker("TestSpeaker")
 
-    @patch('src.coeiroink_client.requests.get')
-    def test_get_speaker(self, mock_get: Mock) -> None:
-        """スピーカー取得のテスト"""
-        mock_response = Mock()
-        mock_response.json.return_value = [
+    @patch('src.coeiroink_client.client.requests.get')
+    def test_refresh_speakers_refetches(self, mock_get: Mock) -> None:
+        """refresh_speakersはキャッシュを破棄し、追加・削除されたスピーカーを反映する"""
+        mock_get.return_value = _resp(_default_speakers_payload())
+        client = COEIROINKClient()
+
+        mock_get.return_value = _resp([
             {
-                "speakerName": "TestSpeaker",
-                "speakerUuid": "uuid-test",
-                "styles": [{"styleName": "style1", "styleId": 0}],
+                "speakerName": "MANA",
+                "speakerUuid": "uuid-2",
+                "styles": [{"styleName": "ノーマル", "styleId": 0}],
                 "version": "1.0.0"
             }
-        ]
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
-
+        ])
+        client.refresh_speakers()
+
+        assert mock_get.call_count == 2
+        assert client.list_speakers() == ["MANA"]
+        # 新しく作ったクライアントも更新後の一覧を使う
+        assert COEIROINKClient().list_speakers() == ["MANA"]
+        assert mock_get.call_count == 2
+
+    @patch('src.coeiroink_client.client.requests.get')
+    def test_refresh_speakers_failure_keeps_speakers(self, mock_get: Mock) -> None:
+        """再取得に失敗しても既存のスピーカー一覧は残る"""
+        mock_get.return_value = _resp(_default_speakers_payload())
         client = COEIROINKClient()
+
+        mock_get.side_effect = requests.exceptions.ConnectionError("down")
+        with pytest.raises(requests.exceptions.RequestException):
+            client.refresh_speakers()
+
+        assert client.list_speakers() == ["TestSpeaker"]
+
+    def test_list_speakers(self, coeiroink_client) -> None:
+        """スピーカーリスト取得のテスト"""
+        client, _ = coeiroink_client
+
+        assert client.list_speakers() == ["TestSpeaker"]
+
+    def test_get_speaker(self, coeiroink_client) -> None:
+        """スピーカー取得のテスト"""
+        client, _ = coeiroink_client
         speaker = client.get_speaker("TestSpeaker")
 
         assert speaker is not None
@@ -238,53 +291,42 @@ class TestCOEIROINKClient:
         # 存在しないスピーカー
         assert client.get_speaker("NonExistent") is None
 
-    @patch('src.coeiroink_client.requests.post')
-    @patch('src.coeiroink_client.requests.get')
-    def test_estimate_prosody(self, mock_get: Mock, mock_post: Mock) -> None:
+    def test_get_speaker_is_dict_lookup(self, coeiroink_client) -> None:
+        """get_speakerは読み込み時に作った名前→Speakerの辞書を引くだけ（線形探索しない）"""
+        client, _ = coeiroink_client
+
+        assert isinstance(client.speakers, dict)
+        assert all(
+            client.get_speaker(name) is speaker
+            for name, speaker in client.speakers.items()
+        )
+
+    @patch('src.coeiroink_client.client.requests')
+    def test_estimate_prosody(self, mock_requests: Mock) -> None:
         """韻律推定のテスト"""
-        # スピーカー読み込みのモック
-        mock_get_response = Mock()
-        mock_get_response.json.return_value = []
-        mock_get_response.raise_for_status = Mock()
-        mock_get.return_value = mock_get_response
-
-        # 韻律推定のモック
-        mock_post_response = Mock()
-        mock_post_response.json.return_value = {
-            "detail": [[{"phoneme": "ko", "hira": "こ", "accent": 1}]]
-        }
-        mock_post_response.raise_for_status = Mock()
-        mock_post.return_value = mock_post_response
+        # スピーカー読み込み・韻律推定のモック（requestsモジュールごと1回で差し替え）
+        mock_requests.get.return_value = _resp([])
+        mock_requests.post.return_value = _resp(
+            {"detail": [[{"phoneme": "ko", "hira": "こ", "accent": 1}]]}
+        )
 
         client = COEIROINKClient()
         prosody = client.estimate_prosody("こんにちは")
 
         assert len(prosody) == 1
         assert prosody[0][0]["phoneme"] == "ko"
-        mock_post.assert_called_once()
+        mock_requests.post.assert_called_once()
+        assert mock_requests.post.call_args.args[0] == "http://localhost:50032/v1/estimate_prosody"
 
-    @patch('src.coeiroink_client.requests.post')
-    @patch('src.coeiroink_client.requests.get')
+    @patch('src.coeiroink_client.client.requests.post')
+    @patch('src.coeiroink_client.client.requests.get')
     def test_synthesize(self, mock_get: Mock, mock_post: Mock) -> None:
         """音声合成のテスト"""
         # スピーカー読み込みのモック
-        mock_get_response = Mock()
-        mock_get_response.json.return_value = [
-            {
-                "speakerName": "TestSpeaker",
-                "speakerUuid": "uuid-123",
-                "styles": [{"styleName": "style1", "styleId": 0}],
-                "version": "1.0.0"
-            }
-        ]
-        mock_get_response.raise_for_status = Mock()
-        mock_get.return_value = mock_get_response
+        mock_get.return_value = _resp(_default_speakers_payload())
 
         # 音声合成のモック
-        mock_post_response = Mock()
-        mock_post_response.content = b'RIFF....WAV'  # ダミーWAVデータ
-        mock_post_response.raise_for_status = Mock()
-        mock_post.return_value = mock_post_response
+        mock_post.return_value = _resp(content=b'RIFF....WAV')  # ダミーWAVデータ
 
         client = COEIROINKClient()
         audio = client.synthesize(
@@ -296,87 +338,69 @@ class TestCOEIROINKClient:
         assert audio == b'RIFF....WAV'
         mock_post.assert_called_once()
 
-    @patch('src.coeiroink_client.requests.post')
-    @patch('src.coeiroink_client.requests.get')
-    def test_synthesize_with_output_path(self, mock_get: Mock, mock_post: Mock) -> None:
+    @patch('src.coeiroink_client.client.requests.post')
+    @patch('src.coeiroink_client.client.requests.get')
+    def test_synthesize_with_output_path(
+        self, mock_get: Mock, mock_post: Mock, tmp_path: Path
+    ) -> None:
         """ファイル保存付き音声合成のテスト"""
         # スピーカー読み込みのモック
-        mock_get_response = Mock()
-        mock_get_response.json.return_value = [
-            {
-                "speakerName": "TestSpeaker",
-                "speakerUuid": "uuid-123",
-                "styles": [{"styleName": "style1", "styleId": 0}],
-                "version": "1.0.0"
-            }
-        ]
-        mock_get_response.raise_for_status = Mock()
-        mock_get.return_value = mock_get_response
+        mock_get.return_value = _resp(_default_speakers_payload())
 
         # 音声合成のモック
-        mock_post_response = Mock()
-        mock_post_response.content = b'WAVDATA'
-        mock_post_response.raise_for_status = Mock()
-        mock_post.return_value = mock_post_response
-
-        # 一時ファイルを使用
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.wav') as tmp:
-            tmp_path = tmp.name
-
-        try:
-            client = COEIROINKClient()
-            audio = client.synthesize(
-                text="テスト",
-                speaker_name="TestSpeaker",
-                output_path=Path(tmp_path)
-            )
+        mock_post.return_value = _resp(content=b'WAVDATA')
 
-            # ファイルが作成されたことを確認
-            assert os.path.exists(tmp_path)
-            with open(tmp_path, 'rb') as f:
-                assert f.read() == b'WAVDATA'
-        finally:
-            if os.path.exists(tmp_path):
-                os.unlink(tmp_path)
-
-    @patch('src.coeiroink_client.requests.get')
-    def test_synthesize_speaker_not_found(self, mock_get: Mock) -> None:
-        """存在しないスピーカーでの合成エラーテスト"""
-        mock_response = Mock()
-        mock_response.json.return_value = []
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
+        output_path = tmp_path / "out.wav"
 
         client = COEIROINKClient()
+        client.synthesize(
+            text="テスト",
+            speaker_name="TestSpeaker",
+            output_path=output_path
+        )
 
-        with pytest.raises(ValueError, match="スピーカー .* が見つかりません"):
+        # ファイルが作成されたことを確認
+        assert output_path.read_bytes() == b'WAVDATA'
+
+    @patch('src.coeiroink_client.client.requests.post')
+    @patch('src.coeiroink_client.client.requests.get')
+    def test_synthesize_large_output_file(
+        self, mock_get: Mock, mock_post: Mock, tmp_path: Path
+    ) -> None:
+        """MB級の音声も欠けずに保存される（ファイル全体は読み込まずダイジェストで比較）"""
+        audio = bytes(range(256)) * 8192  # 2 MiB
+        mock_get.return_value = _resp(_default_speakers_payload())
+        mock_post.return_value = _resp(content=audio)
+        output_path = tmp_path / "large.wav"
+
+        COEIROINKClient().synthesize(
+            text="テスト",
+            speaker_name="TestSpeaker",
+            output_path=output_path
+        )
+
+        assert output_path.stat().st_size == len(audio)
+        assert _file_digest(output_path) == hashlib.blake2b(audio).digest()
+
+    def test_synthesize_speaker_not_found(self, coeiroink_client) -> None:
+        """存在しないスピーカーでの合成エラーテスト"""
+        client, _ = coeiroink_client
+
+        with pytest.raises(ValueError, match=_SPEAKER_NOT_FOUND_RE):
             client.synthesize(
                 text="テスト",
                 speaker_name="NonExistentSpeaker"
             )
 
-    @patch('src.coeiroink_client.requests.post')
-    @patch('src.coeiroink_client.requests.get')
+    @patch('src.coeiroink_client.client.requests.post')
+    @patch('src.coeiroink_client.client.requests.get')
     def test_synthesize_with_emotions(self, mock_get: Mock, mock_post: Mock) -> None:
         """感情付き音声合成のテスト"""
         # スピーカー読み込みのモック
-        mock_get_response = Mock()
-        mock_get_response.json.return_value = [
-            {
-                "speakerName": "TestSpeaker",
-                "speakerUuid": "uuid-123",
-                "styles": [{"styleName": "style1", "styleId": 0}],
-                "version": "1.0.0"
-            }
-        ]
-        mock_get_response.raise_for_status = Mock()
-        mock_get.return_value = mock_get_response
+        mock_get.return_value = _resp(_default_speakers_payload())
 
         # 音声合成のモック
-        mock_post_response = Mock()
-        mock_post_response.content = b'WAVDATA'
-        mock_post_response.raise_for_status = Mock()
-        mock_post.return_value = mock_post_response
+        mock_post.return_value = _resp(content=b'WAVDATA')
 
         client = COEIROINKClient()
 
@@ -391,40 +415,52 @@ class TestCOEIROINKClient:
             }
         ]
 
-        audio_list = client.synthesize_with_emotions(segments)
+        audios = client.synthesize_with_emotions(segments)
 
-        assert len(audio_list) == 2
-        assert all(audio == b'WAVDATA' for audio in audio_list)
+        # 1件取り出した時点では1セグメント分しか合成していない（逐次生成）
+        assert next(audios) == b'WAVDATA'
+        assert mock_post.call_count == 1
+        assert list(audios) == [b'WAVDATA']
+        assert mock_post.call_count == 2
 
-    @patch('src.coeiroink_client.requests.get')
-    def test_export_speaker_info(self, mock_get: Mock) -> None:
-        """スピーカー情報エクスポートのテスト"""
-        mock_response = Mock()
-        mock_response.json.return_value = [
-            {
-                "speakerName": "Speaker1",
-                "speakerUuid": "uuid-1",
-                "styles": [{"styleName": "style1", "styleId": 0}],
-                "version": "1.0.0"
-            }
-        ]
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
+    @patch('src.coeiroink_client.client.requests.post')
+    @patch('src.coeiroink_client.client.requests.get')
+    def test_synthesize_with_emotions_request_per_segment(
+        self, mock_get: Mock, mock_post: Mock
+    ) -> None:
+        """感情付き音声合成はセグメントごとに1回だけ、順番どおりにPOSTする
+
+        COEIROINKの /v1/synthesis は1リクエスト1テキストのため、
+        余分な往復（韻律推定など）が増えていないことをここで固定する。
+        """
+        mock_get.return_value = _resp(_default_speakers_payload())
+        mock_post.return_value = _resp(content=b'WAVDATA')
 
         client = COEIROINKClient()
+        list(client.synthesize_with_emotions([
+            {"text": "セグメント1", "speaker_name": "TestSpeaker"},
+            {"text": "セグメント2", "speaker_name": "TestSpeaker"},
+        ]))
+
+        assert mock_post.call_count == 2
+        assert [c.args[0] for c in mock_post.call_args_list] == [
+            "http://localhost:50032/v1/synthesis"
+        ] * 2
+        assert [c.kwargs["json"]["text"] for c in mock_post.call_args_list] == [
+            "セグメント1",
+            "セグメント2",
+        ]
 
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.json') as tmp:
-            tmp_path = tmp.name
+    def test_export_speaker_info(self, coeiroink_client, tmp_path: Path) -> None:
+        """スピーカー情報エクスポートのテスト"""
+        client, _ = coeiroink_client
+        output_path = tmp_path / "speakers.json"
 
-        try:
-            client.export_speaker_info(Path(tmp_path))
+        client.export_speaker_info(output_path)
 
-            # JSONファイルの内容を確認
-            with open(tmp_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+        # JSONファイルの内容を確認
+        with open(output_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
 
-            assert len(data) == 1
-            assert data[0]["speakerName"] == "Speaker1"
-        finally:
-            if os.path.exists(tmp_path):
-                os.unlink(tmp_path)
+        assert len(data) == 1
+        assert data[0]["speakerName"] == "TestSpeaker"
@@ -1,7 +1,8 @@
 """情報収集機能のテスト"""
 
 import pytest
-from datetime import datetime
+from datetime import datetime, timedelta
+from pydantic import ValidationError
 from src.info_collector import (
     InfoCollectorRepository,
     SearchCollector,
@@ -11,12 +12,14 @@ from src.info_collector import (
 )
 from src.info_collector.summarizer import InfoSummarizer
 
+# テスト全体で共有する基準時刻（fetched_atと削除基準を揃えて結果を決定的にする）
+_NOW = datetime.now()
+
 
 @pytest.fixture
-def temp_db(tmp_path):
-    """テスト用の一時DBパス"""
-    db_path = str(tmp_path / "test_info.db")
-    return db_path
+def temp_db(memory_db_uri):
+    """テスト用のインメモリDB（ディスクI/Oなし、テストごとに独立）"""
+    return memory_db_uri
 
 
 @pytest.fixture
@@ -40,7 +43,7 @@ def test_add_and_retrieve_info(repository):
         title="Test Article",
         url="https://example.com/test",
         snippet="This is a test",
-        fetched_at=datetime.now(),
+        fetched_at=_NOW,
     )
 
     # 追加
@@ -54,19 +57,28 @@ def test_add_and_retrieve_info(repository):
     assert retrieved.url == "https://example.com/test"
 
 
+def test_collected_info_is_frozen():
+    """CollectedInfoは生成後に変更できない"""
+    info = CollectedInfo(source_type="search", title="t", url="u", fetched_at=_NOW)
+
+    with pytest.raises(ValidationError):
+        info.title = "changed"
+    assert info.title == "t"
+
+
 def test_duplicate_prevention(repository):
     """重複防止テスト"""
     info1 = CollectedInfo(
         source_type="search",
         title="Duplicate Test",
         url="https://example.com/duplicate",
-        fetched_at=datetime.now(),
+        fetched_at=_NOW,
     )
     info2 = CollectedInfo(
         source_type="search",
         title="Duplicate Test Modified",
         url="https://example.com/duplicate",  # 同じURL
-        fetched_at=datetime.now(),
+        fetched_at=_NOW,
     )
 
     # 1回目は成功
@@ -78,6 +90,30 @@ def test_duplicate_prevention(repository):
     assert id2 is None
 
 
+def test_add_many_skips_duplicates(repository):
+    """一括追加では既存・バッチ内の重複URLを無視し、追加件数を返す"""
+    repository.add_info(
+        CollectedInfo(source_type="search", title="Existing", url="https://example.com/a", fetched_at=_NOW)
+    )
+
+    added = repository.add_many(
+        [
+            CollectedInfo(source_type="search", title="Dup", url="https://example.com/a", fetched_at=_NOW),
+            CollectedInfo(source_type="search", title="New", url="https://example.com/b", fetched_at=_NOW),
+            CollectedInfo(source_type="search", title="New again", url="https://example.com/b", fetched_at=_NOW),
+            CollectedInfo(source_type="rss", title="Other source", url="https://example.com/a", fetched_at=_NOW),
+        ]
+    )
+
+    assert added == 2
+    assert sorted(info.title for info in repository.search_info()) == [
+        "Existing",
+        "New",
+        "Other source",
+    ]
+    assert repository.add_many([]) == 0
+
+
 def test_search_info_by_source_type(repository):
     """ソースタイプでの検索テスト"""
     # 異なるソースタイプで追加
@@ -85,13 +121,13 @@ def test_search_info_by_source_type(repository):
         source_type="search",
         title="Search Result",
         url="https://example.com/search",
-        fetched_at=datetime.now(),
+        fetched_at=_NOW,
     )
     rss_info = CollectedInfo(
         source_type="rss",
         title="RSS Entry",
         url="https://example.com/rss",
-        fetched_at=datetime.now(),
+        fetched_at=_NOW,
     )
 
     repository.add_info(search_info)
@@ -110,14 +146,14 @@ def test_search_info_by_query(repository):
         title="Python Tutorial",
         url="https://example.com/python",
         snippet="Learn Python programming",
-        fetched_at=datetime.now(),
+        fetched_at=_NOW,
     )
     info2 = CollectedInfo(
         source_type="search",
         title="JavaScript Guide",
         url="https://example.com/js",
         snippet="Learn JavaScript",
-        fetched_at=datetime.now(),
+        fetched_at=_NOW,
     )
 
     repository.add_info(info1)
@@ -131,28 +167,26 @@ def test_search_info_by_query(repository):
 
 def test_delete_old_info(repository):
     """古い情報削除テスト"""
-    from datetime import timedelta
-
     # 古い情報
     old_info = CollectedInfo(
         source_type="search",
         title="Old Article",
         url="https://example.com/old",
-        fetched_at=datetime.now() - timedelta(days=40),
+        fetched_at=_NOW - timedelta(days=40),
     )
     # 新しい情報
     new_info = CollectedInfo(
         source_type="search",
         title="New Article",
         url="https://example.com/new",
-        fetched_at=datetime.now(),
+        fetched_at=_NOW,
     )
 
     repository.add_info(old_info)
     repository.add_info(new_info)
 
     # 30日以前を削除
-    deleted = repository.delete_old_info(days=30)
+    deleted = repository.delete_old_info(days=30, now=_NOW)
     assert deleted == 1
 
     # 新しい情報のみ残る
@@ -181,16 +215,18 @@ def test_news_collector():
 
 def test_summarizer_fallback(repository):
     """Summarizerフォールバック要約テスト"""
-    # テストデータ追加
-    for i in range(3):
-        info = CollectedInfo(
+    # テストデータ追加（1トランザクションでまとめて投入）
+    added = repository.add_many(
+        CollectedInfo(
             source_type="search",
             title=f"Article {i+1}",
             url=f"https://example.com/{i+1}",
             snippet=f"This is article {i+1}",
-            fetched_at=datetime.now(),
+            fetched_at=_NOW,
         )
-        repository.add_info(info)
+        for i in range(3)
+    )
+    assert added == 3
 
     # Summarizer（LLMなし）
     summarizer = InfoSummarizer(repository=repository)
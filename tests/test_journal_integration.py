@@ -3,44 +3,95 @@
 P2実装のBASHスクリプトとBashScriptExecutorの統合テスト
 """
 
+import sqlite3
+import subprocess
+from datetime import datetime
+
 import pytest
-import json
-import os
+import re
 from pathlib import Path
-from src.bash_executor.script_executor import BashScriptExecutor, BashResult
+from src.bash_executor.script_executor import BashScriptExecutor
 
 
-@pytest.fixture
-def test_db_path(tmp_path):
-    """テスト用の一時DBパス"""
-    db_path = tmp_path / "test_ai_secretary.db"
-    os.environ["AI_SECRETARY_DB_PATH"] = str(db_path)
-    yield db_path
-    # クリーンアップ
-    if "AI_SECRETARY_DB_PATH" in os.environ:
-        del os.environ["AI_SECRETARY_DB_PATH"]
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "scripts"
 
+_NOT_ALLOWED_RE = re.compile("Script not allowed")
+_DANGEROUS_ARGS_RE = re.compile("dangerous characters")
 
-@pytest.fixture
+# init_db.sh が作成し、各テストが書き込むテーブル（子テーブルから順に削除する）
+_JOURNAL_TABLES = (
+    "journal_todo_links",
+    "journal_entry_tags",
+    "journal_tags",
+    "journal_entries",
+)
+
+
+def _seed_entries(db_path, titles):
+    """journal_entriesへPythonから直接エントリを投入（log_entry.shのプロセス起動を省く）
+
+    occurred_atは log_entry.sh の既定値（date -Iseconds）と同じ形式にする。
+    """
+    occurred_at = datetime.now().astimezone().isoformat(timespec="seconds")
+    conn = sqlite3.connect(db_path)
+    with conn:
+        conn.executemany(
+            """
+            INSERT INTO journal_entries (occurred_at, title, source, meta_json, created_at)
+            VALUES (?, ?, 'manual', '{}', datetime('now'))
+            """,
+            [(occurred_at, title) for title in titles],
+        )
+    conn.close()
+
+
+@pytest.fixture(scope="module")
+def journal_db(tmp_path_factory):
+    """モジュール共有の一時DBパス
+
+    BASHスクリプトは環境変数でDBを受け取るため、モジュール終了時に確実に戻す。
+    （sessionスコープにすると他モジュールの既定DBパスまで書き換わるためmoduleに留める）
+    """
+    db_path = tmp_path_factory.mktemp("journal") / "test_ai_secretary.db"
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("AI_SECRETARY_DB_PATH", str(db_path))
+        yield db_path
+
+
+@pytest.fixture(scope="module")
 def executor():
-    """BashScriptExecutorのインスタンス"""
-    return BashScriptExecutor(scripts_dir=Path("scripts"))
+    """BashScriptExecutorのインスタンス（モジュール内で共有）"""
+    return BashScriptExecutor(scripts_dir=SCRIPTS_DIR)
 
 
-def test_init_db(executor, test_db_path):
-    """DB初期化スクリプトのテスト"""
-    result = executor.execute("journal/init_db.sh", parse_json=False)
+@pytest.fixture(scope="module")
+def init_result(executor, journal_db):
+    """init_db.sh の実行結果（サブプロセス起動はモジュールで1回だけ）"""
+    return executor.execute("journal/init_db.sh", parse_json=False)
 
-    assert result.success
+
+@pytest.fixture
+def test_db_path(journal_db, init_result):
+    """初期化済みの一時DBパス（テスト後に書き込まれた行を削除）"""
+    yield journal_db
+    if not init_result.success:
+        return
+    conn = sqlite3.connect(journal_db)
+    with conn:
+        for table in _JOURNAL_TABLES:
+            conn.execute(f"DELETE FROM {table}")
+    conn.close()
+
+
+def test_init_db(init_result, test_db_path):
+    """DB初期化スクリプトのテスト"""
+    assert init_result.success
     assert test_db_path.exists()
-    assert "Unified database initialized" in result.stdout
+    assert "Unified database initialized" in init_result.stdout
 
 
 def test_log_entry(executor, test_db_path):
     """エントリ記録のテスト"""
-    # DB初期化
-    executor.execute("journal/init_db.sh", parse_json=False)
-
     # エントリ記録
     result = executor.execute(
         "journal/log_entry.sh",
@@ -63,21 +114,8 @@ def test_log_entry(executor, test_db_path):
 
 
 def test_get_entries(executor, test_db_path):
-    """エントリ取得のテスト"""
-    # DB初期化
-    executor.execute("journal/init_db.sh", parse_json=False)
-
-    # エントリ記録
-    executor.execute(
-        "journal/log_entry.sh",
-        args=["--title", "テストエントリ1"],
-        parse_json=True,
-    )
-    executor.execute(
-        "journal/log_entry.sh",
-        args=["--title", "テストエントリ2"],
-        parse_json=True,
-    )
+    """エントリ取得のテスト（log_entry.sh自体はtest_log_entryで検証済み）"""
+    _seed_entries(test_db_path, ["テストエントリ1", "テストエントリ2"])
 
     # エントリ取得
     result = executor.execute("journal/get_entries.sh", parse_json=True)
@@ -93,9 +131,6 @@ def test_get_entries(executor, test_db_path):
 
 def test_generate_summary(executor, test_db_path):
     """サマリー生成のテスト"""
-    # DB初期化
-    executor.execute("journal/init_db.sh", parse_json=False)
-
     # エントリ記録
     executor.execute(
         "journal/log_entry.sh",
@@ -118,17 +153,60 @@ def test_generate_summary(executor, test_db_path):
     assert result.parsed_json["progress"]["entry_count"] == 1
 
 
+def _stub_script_output(monkeypatch, stdout):
+    """subprocess.runを差し替え、スクリプトが指定の標準出力を返したことにする"""
+    from src.bash_executor import script_executor
+
+    monkeypatch.setattr(
+        script_executor.subprocess,
+        "run",
+        lambda cmd, **kwargs: subprocess.CompletedProcess(cmd, 0, stdout=stdout, stderr=""),
+    )
+
+
+def test_parsed_json_decoded_once(executor, monkeypatch):
+    """parse_json=Trueの結果はexecute時に1回だけデコードされ、以降は同じオブジェクトを返す"""
+    from src.bash_executor import script_executor
+
+    calls = []
+    original_loads = script_executor.jsonio.loads
+
+    def counting_loads(text):
+        calls.append(text)
+        return original_loads(text)
+
+    monkeypatch.setattr(script_executor.jsonio, "loads", counting_loads)
+    _stub_script_output(monkeypatch, '[{"title": "a"}]')
+
+    result = executor.execute("journal/get_entries.sh", parse_json=True)
+
+    assert result.parsed_json is result.parsed_json
+    assert result.parsed_json[0]["title"] == "a"
+    assert len(calls) == 1
+
+
+def test_parse_json_invalid_output_is_none(executor, monkeypatch):
+    """JSON出力はデコードされ、不正なJSONはNoneになる"""
+    _stub_script_output(monkeypatch, '{"title": "日本語", "count": 2}')
+    result = executor.execute("journal/get_entries.sh", parse_json=True)
+    assert result.parsed_json == {"title": "日本語", "count": 2}
+
+    _stub_script_output(monkeypatch, "not json")
+    result = executor.execute("journal/get_entries.sh", parse_json=True)
+    assert result.success
+    assert result.parsed_json is None
+
+
 def test_script_not_in_whitelist(executor):
     """ホワイトリスト外のスクリプトは実行できないことを確認"""
-    with pytest.raises(ValueError, match="Script not allowed"):
+    assert isinstance(executor.ALLOWED_SCRIPTS, frozenset)
+    with pytest.raises(ValueError, match=_NOT_ALLOWED_RE):
         executor.execute("evil_script.sh")
 
 
 def test_dangerous_args(executor, test_db_path):
     """危険な引数は拒否されることを確認"""
-    executor.execute("journal/init_db.sh", parse_json=False)
-
-    with pytest.raises(ValueError, match="dangerous characters"):
+    with pytest.raises(ValueError, match=_DANGEROUS_ARGS_RE):
         executor.execute(
             "journal/log_entry.sh",
             args=["--title", "test; rm -rf /"],
@@ -2,34 +2,36 @@
 JournalSummarizerのテスト
 """
 
-import json
 import pytest
-from unittest.mock import MagicMock, patch
-from datetime import datetime
+from unittest.mock import MagicMock, Mock
+from types import MappingProxyType, SimpleNamespace
 
 from src.journal.summarizer import JournalSummarizer
 from src.bash_executor import BashResult
 
 
-class TestJournalSummarizer:
-    """JournalSummarizerのテストクラス"""
+def _ok_result(parsed_json) -> BashResult:
+    """generate_summary.sh の成功結果（summarizerはparsed_jsonのみ参照するためstdoutは空）"""
+    return BashResult(success=True, stdout="", stderr="", exit_code=0, parsed_json=parsed_json)
 
-    @pytest.fixture
-    def mock_bash_executor(self):
-        """BashExecutorのモック"""
-        executor = MagicMock()
-        return executor
 
-    @pytest.fixture
-    def mock_ollama_client(self):
-        """OllamaClientのモック"""
-        client = MagicMock()
-        return client
+# sample_raw_data から生成されるフォールバックサマリーに出現順で含まれるべき文字列
+_FALLBACK_SUMMARY_SECTIONS = (
+    "【2025-11-14の活動サマリー】",
+    "記録された活動: 1件",
+    "TODO関連更新: 1件",
+    "【活動一覧】",
+    "Pythonの勉強",
+    "(120分)",
+    "TODO: #1 Python学習",
+)
 
-    @pytest.fixture
-    def sample_raw_data(self):
-        """サンプルの構造化データ"""
-        return {
+
+@pytest.fixture(scope="module")
+def sample_raw_data():
+    """サンプルの構造化データ（モジュール共有のため読み取り専用ビューで返す）"""
+    return MappingProxyType(
+        {
             "date": "2025-11-14",
             "activities": [
                 {
@@ -52,20 +54,54 @@ class TestJournalSummarizer:
                 }
             ],
         }
+    )
+
+
+@pytest.fixture(scope="module")
+def empty_data():
+    """活動記録が空の構造化データ（読み取り専用）"""
+    return MappingProxyType(
+        {
+            "date": "2025-11-14",
+            "activities": [],
+            "progress": {"entry_count": 0, "linked_todo_updates": 0},
+            "todo_summary": [],
+        }
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_ok_result(sample_raw_data):
+    """sample_raw_dataを返すスクリプト成功結果（モジュールで1回だけ構築）"""
+    return _ok_result(sample_raw_data)
+
+
+@pytest.fixture(scope="module")
+def empty_ok_result(empty_data):
+    """empty_dataを返すスクリプト成功結果（モジュールで1回だけ構築）"""
+    return _ok_result(empty_data)
+
+
+class TestJournalSummarizer:
+    """JournalSummarizerのテストクラス"""
+
+    @pytest.fixture
+    def mock_bash_executor(self):
+        """BashScriptExecutorのスタブ（summarizerが呼ぶexecuteのみ呼び出し記録付きMock）"""
+        return SimpleNamespace(execute=Mock())
+
+    @pytest.fixture
+    def mock_ollama_client(self):
+        """OllamaClientのモック"""
+        client = MagicMock()
+        return client
 
     def test_generate_daily_summary_without_llm(
-        self, mock_bash_executor, sample_raw_data
+        self, mock_bash_executor, sample_raw_data, sample_ok_result
     ):
         """LLMを使用しない日次サマリー生成"""
         # BASHスクリプト実行結果をモック
-        bash_result = BashResult(
-            success=True,
-            stdout=json.dumps(sample_raw_data),
-            stderr="",
-            exit_code=0,
-            parsed_json=sample_raw_data,
-        )
-        mock_bash_executor.execute.return_value = bash_result
+        mock_bash_executor.execute.return_value = sample_ok_result
 
         summarizer = JournalSummarizer(
             bash_executor=mock_bash_executor, ollama_client=None
@@ -83,18 +119,11 @@ class TestJournalSummarizer:
         mock_bash_executor.execute.assert_called_once()
 
     def test_generate_daily_summary_with_llm(
-        self, mock_bash_executor, mock_ollama_client, sample_raw_data
+        self, mock_bash_executor, mock_ollama_client, sample_ok_result
     ):
         """LLMを使用した日次サマリー生成"""
         # BASHスクリプト実行結果をモック
-        bash_result = BashResult(
-            success=True,
-            stdout=json.dumps(sample_raw_data),
-            stderr="",
-            exit_code=0,
-            parsed_json=sample_raw_data,
-        )
-        mock_bash_executor.execute.return_value = bash_result
+        mock_bash_executor.execute.return_value = sample_ok_result
 
         # LLM応答をモック
         llm_response = {
@@ -123,23 +152,9 @@ class TestJournalSummarizer:
         mock_bash_executor.execute.assert_called_once()
         mock_ollama_client.chat.assert_called_once()
 
-    def test_generate_daily_summary_empty_data(self, mock_bash_executor):
+    def test_generate_daily_summary_empty_data(self, mock_bash_executor, empty_ok_result):
         """空のデータの場合のサマリー生成"""
-        empty_data = {
-            "date": "2025-11-14",
-            "activities": [],
-            "progress": {"entry_count": 0, "linked_todo_updates": 0},
-            "todo_summary": [],
-        }
-
-        bash_result = BashResult(
-            success=True,
-            stdout=json.dumps(empty_data),
-            stderr="",
-            exit_code=0,
-            parsed_json=empty_data,
-        )
-        mock_bash_executor.execute.return_value = bash_result
+        mock_bash_executor.execute.return_value = empty_ok_result
 
         summarizer = JournalSummarizer(
             bash_executor=mock_bash_executor, ollama_client=None
@@ -171,17 +186,10 @@ class TestJournalSummarizer:
         assert "Database not found" in result["details"]
 
     def test_generate_daily_summary_llm_failure(
-        self, mock_bash_executor, mock_ollama_client, sample_raw_data
+        self, mock_bash_executor, mock_ollama_client, sample_ok_result
     ):
         """LLM失敗時のフォールバック"""
-        bash_result = BashResult(
-            success=True,
-            stdout=json.dumps(sample_raw_data),
-            stderr="",
-            exit_code=0,
-            parsed_json=sample_raw_data,
-        )
-        mock_bash_executor.execute.return_value = bash_result
+        mock_bash_executor.execute.return_value = sample_ok_result
 
         # LLMが例外を投げる
         mock_ollama_client.chat.side_effect = Exception("LLM connection error")
@@ -205,33 +213,18 @@ class TestJournalSummarizer:
 
         fallback = summarizer._generate_fallback_summary(sample_raw_data)
 
-        # 検証
-        assert "【2025-11-14の活動サマリー】" in fallback
-        assert "記録された活動: 1件" in fallback
-        assert "TODO関連更新: 1件" in fallback
-        assert "【活動一覧】" in fallback
-        assert "Pythonの勉強" in fallback
-        assert "(120分)" in fallback
-        assert "TODO: #1 Python学習" in fallback
-
-    def test_generate_daily_summary_default_date(self, mock_bash_executor):
-        """日付未指定時は今日の日付を使用"""
-        today = datetime.now().strftime("%Y-%m-%d")
-        empty_data = {
-            "date": today,
-            "activities": [],
-            "progress": {"entry_count": 0, "linked_todo_updates": 0},
-            "todo_summary": [],
-        }
-
-        bash_result = BashResult(
-            success=True,
-            stdout=json.dumps(empty_data),
-            stderr="",
-            exit_code=0,
-            parsed_json=empty_data,
-        )
-        mock_bash_executor.execute.return_value = bash_result
+        # 検証（各セクションがテンプレート通りの順序で現れることを1回の走査で確認）
+        pos = 0
+        for expected in _FALLBACK_SUMMARY_SECTIONS:
+            found = fallback.find(expected, pos)
+            assert found >= 0, f"{expected!r} が {pos} 文字目以降に見つかりません:\n{fallback}"
+            pos = found + len(expected)
+
+    @pytest.mark.usefixtures("frozen_summarizer_datetime")
+    def test_generate_daily_summary_default_date(self, mock_bash_executor, empty_ok_result):
+        """日付未指定時は今日の日付を使用（日付跨ぎで結果が揺れないよう時刻を固定）"""
+        today = "2025-11-14"
+        mock_bash_executor.execute.return_value = empty_ok_result
 
         summarizer = JournalSummarizer(
             bash_executor=mock_bash_executor, ollama_client=None
@@ -0,0 +1,56 @@
+"""src.utils.jsonio のテスト"""
+
+import json
+
+import pytest
+
+from src.utils import jsonio
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def json_backend(request, monkeypatch):
+    """orjsonあり/なしの両方で実行する（orjson未導入環境ではorjson側をスキップ）"""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(jsonio, "orjson", None)
+    return request.param
+
+
+def test_roundtrip_keeps_non_ascii(json_backend):
+    """日本語をエスケープせずに往復変換できる"""
+    messages = [{"role": "user", "content": "こんにちは"}]
+
+    encoded = jsonio.dumps(messages)
+
+    assert isinstance(encoded, str)
+    assert "こんにちは" in encoded
+    assert jsonio.loads(encoded) == messages
+
+
+def test_invalid_json_raises_json_decode_error(json_backend):
+    """不正なJSONはどちらの実装でも json.JSONDecodeError で捕捉できる"""
+    with pytest.raises(json.JSONDecodeError):
+        jsonio.loads("not json")
+
+
+def test_orjson_and_stdlib_produce_identical_output(monkeypatch):
+    """orjsonと標準jsonで同じ文字列を出力する（保存形式が環境で混在しない）"""
+    pytest.importorskip("orjson")
+    payload = [
+        {"role": "user", "content": "こんにちは", "meta": {"n": 1, "ok": True, "x": None}},
+        {"role": "assistant", "content": "a\"b\n", "scores": [0.5, 2, -1]},
+    ]
+
+    with_orjson = jsonio.dumps(payload)
+    monkeypatch.setattr(jsonio, "orjson", None)
+    with_stdlib = jsonio.dumps(payload)
+
+    assert with_orjson == with_stdlib
+
+
+def test_stdlib_dumps_is_compact(monkeypatch):
+    """標準jsonでもorjsonと同じく空白なしで出力する"""
+    monkeypatch.setattr(jsonio, "orjson", None)
+
+    assert jsonio.dumps({"role": "user", "items": [1, 2]}) == '{"role":"user","items":[1,2]}'
@@ -7,16 +7,21 @@
 実行方法:
     uv run pytest tests/test_ollama_integration_real.py -v -s
 
+並列実行（3クラスは互いに独立しているため、クラス単位でワーカーに割り当てる）:
+    uv run pytest tests/test_ollama_integration_real.py -n 3 --dist loadscope
+
+各クラスには別々の xdist_group を付けてあるので、--dist loadgroup でも
+クラススコープのフィクスチャがクラスごとに1回だけ構築される。
+
+2回目以降の実行で同一プロンプトのLLM応答を再利用する場合（.pytest_cache に保存）:
+    AI_SEC_TEST_CACHE=1 uv run pytest tests/test_ollama_integration_real.py
+
 スキップする場合:
     pytest -m "not integration"
 """
 
 import pytest
 import logging
-from pathlib import Path
-from src.ai_secretary.secretary import AISecretary
-from src.ai_secretary.config import Config
-from src.ai_secretary.ollama_client import OllamaClient
 
 # 統合テストマーカー
 pytestmark = pytest.mark.integration
@@ -24,54 +29,37 @@ pytestmark = pytest.mark.integration
 logger = logging.getLogger(__name__)
 
 
+def _reset_secretary(secretary) -> None:
+    """セッション共有のAISecretaryをテスト開始時と同じ状態に戻す
+
+    会話履歴をシステムプロンプトのみに戻し、BashExecutor（全インスタンスで共有）を
+    持つ場合はcdで移動した作業ディレクトリもルートに戻す。
+    """
+    secretary.reset_conversation()
+    executor = secretary.bash_executor
+    if executor is not None:
+        executor.cwd = executor.root_dir
+
+
+@pytest.mark.xdist_group(name="ollama_real_chat")
 class TestRealOllamaIntegration:
     """実際のOllamaサーバーを使った統合テスト"""
 
     @pytest.fixture(scope="class")
-    def ollama_available(self):
-        """Ollamaサーバーが利用可能かチェック"""
-        try:
-            client = OllamaClient(host="http://localhost:11434", model="qwen3:8b")
-            models = client.list_models()
-            if not models:
-                pytest.skip("Ollamaサーバーは起動していますが、モデルがありません")
-            if "qwen3:8b" not in models:
-                pytest.skip("qwen3:8bモデルが見つかりません。ollama pull qwen3:8b を実行してください")
-            return True
-        except Exception as e:
-            pytest.skip(f"Ollamaサーバーが利用できません: {e}")
-
-    @pytest.fixture
-    def secretary(self, ollama_available, tmp_path):
-        """実際のOllamaを使うAISecretary"""
-        from src.ai_secretary.config import OllamaConfig, ProactiveChatConfig
-
-        # テスト用の設定
-        config = Config(
-            ollama=OllamaConfig(
-                host="http://localhost:11434",
-                model="qwen3:8b"
-            ),
-            proactive_chat=ProactiveChatConfig(),
-            log_level="DEBUG",
-            log_file=str(tmp_path / "test.log"),
+    @classmethod
+    def secretary(cls, real_secretary_factory):
+        """実際のOllamaを使うAISecretary（BASH無効、テストごとに会話をリセット）"""
+        return real_secretary_factory(
             max_tokens=1000,  # テストは短めに
-            temperature=0.3,  # 再現性を高めるため低めに
             system_prompt="You are a helpful assistant. Always respond in JSON format.",
-            coeiroink_api_url="http://localhost:50032",
-            audio_output_dir=str(tmp_path / "audio"),
-        )
-
-        # COEIROINKとAudioPlayerは無効化（音声不要）
-        secretary = AISecretary(
-            config=config,
-            ollama_client=None,  # 自動初期化
-            coeiroink_client=None,
-            audio_player=None,
-            bash_executor=None,  # BASHも無効化
         )
 
-        return secretary
+    @pytest.fixture(autouse=True)
+    def _reset_conversation(self, secretary):
+        """共有AISecretaryの状態をテストの前後でリセット"""
+        _reset_secretary(secretary)
+        yield
+        _reset_secretary(secretary)
 
     def test_simple_chat(self, secretary):
         """シンプルな会話テスト"""
@@ -81,7 +69,7 @@ class TestRealOllamaIntegration:
             play_audio=False
         )
 
-        logger.info(f"Response: {response}")
+        logger.info("Response: %s", response)
 
         # レスポンスが返ってくることを確認
         assert response is not None
@@ -95,7 +83,7 @@ class TestRealOllamaIntegration:
             play_audio=False
         )
 
-        logger.info(f"Response: {response}")
+        logger.info("Response: %s", response)
 
         # raw_responseが含まれているか
         assert "raw_response" in response
@@ -104,6 +92,7 @@ class TestRealOllamaIntegration:
         raw = response["raw_response"]
         assert isinstance(raw, dict)
 
+    @pytest.mark.no_llm_cache
     def test_conversation_history(self, secretary):
         """会話履歴が保持されるかテスト"""
         # 最初の質問
@@ -113,7 +102,7 @@ class TestRealOllamaIntegration:
             play_audio=False
         )
 
-        logger.info(f"Response 1: {response1}")
+        logger.info("Response 1: %s", response1)
 
         # 2番目の質問（履歴を参照する）
         response2 = secretary.chat(
@@ -122,7 +111,7 @@ class TestRealOllamaIntegration:
             play_audio=False
         )
 
-        logger.info(f"Response 2: {response2}")
+        logger.info("Response 2: %s", response2)
 
         # 会話履歴が保持されていることを確認
         assert len(secretary.conversation_history) >= 4  # system + user1 + assistant1 + user2
@@ -137,7 +126,7 @@ class TestRealOllamaIntegration:
             play_audio=False
         )
 
-        logger.info(f"Response: {response}")
+        logger.info("Response: %s", response)
 
         # raw_responseがdict（JSON）であることを確認
         assert isinstance(response["raw_response"], dict)
@@ -163,7 +152,7 @@ class TestRealOllamaIntegration:
         """モデルの一時切り替えテスト"""
         # デフォルトモデルを確認
         default_model = secretary.ollama_client.model
-        assert default_model == "qwen3:8b"
+        assert default_model == secretary.config.ollama.model
 
         # 別のモデルで会話（存在しない場合はスキップ）
         try:
@@ -180,55 +169,22 @@ class TestRealOllamaIntegration:
             pytest.skip(f"llama3.1:8bモデルが利用できません: {e}")
 
 
+@pytest.mark.xdist_group(name="ollama_real_bash")
 class TestRealBashIntegration:
     """実際のBASH実行との統合テスト"""
 
     @pytest.fixture(scope="class")
-    def ollama_available(self):
-        """Ollamaサーバーが利用可能かチェック"""
-        try:
-            client = OllamaClient(host="http://localhost:11434", model="qwen3:8b")
-            models = client.list_models()
-            if not models or "qwen3:8b" not in models:
-                pytest.skip("Ollamaまたはqwen3:8bモデルが利用できません")
-            return True
-        except Exception as e:
-            pytest.skip(f"Ollamaサーバーが利用できません: {e}")
-
-    @pytest.fixture
-    def secretary_with_bash(self, ollama_available, tmp_path):
-        """BASH実行機能付きのAISecretary"""
-        from src.ai_secretary.config import OllamaConfig, ProactiveChatConfig
-
-        config = Config(
-            ollama=OllamaConfig(
-                host="http://localhost:11434",
-                model="qwen3:8b"
-            ),
-            proactive_chat=ProactiveChatConfig(),
-            log_level="DEBUG",
-            log_file=str(tmp_path / "test.log"),
-            max_tokens=2000,
-            temperature=0.3,
-            system_prompt=None,  # system_promptはconfig/system_prompt.txtから読み込まれる
-            coeiroink_api_url="http://localhost:50032",
-            audio_output_dir=str(tmp_path / "audio"),
-        )
-
-        # 実際のBashExecutorを使用
-        from src.bash_executor import create_executor
-
-        bash_executor = create_executor()
-
-        secretary = AISecretary(
-            config=config,
-            ollama_client=None,
-            coeiroink_client=None,
-            audio_player=None,
-            bash_executor=bash_executor,
-        )
-
-        return secretary
+    @classmethod
+    def secretary_with_bash(cls, real_secretary_factory):
+        """BASH実行機能付きのAISecretary（テストごとに会話をリセット）"""
+        return real_secretary_factory(max_tokens=2000, with_bash=True)
+
+    @pytest.fixture(autouse=True)
+    def _reset_conversation(self, secretary_with_bash):
+        """共有AISecretaryの状態をテストの前後でリセット"""
+        _reset_secretary(secretary_with_bash)
+        yield
+        _reset_secretary(secretary_with_bash)
 
     def test_bash_pwd_command(self, secretary_with_bash):
         """pwdコマンドを実行してLLMが結果を理解するかテスト"""
@@ -239,7 +195,7 @@ class TestRealBashIntegration:
             enable_bash_verification=False  # 検証無効でシンプル化
         )
 
-        logger.info(f"Response: {response}")
+        logger.info("Response: %s", response)
 
         # レスポンスが返ってくることを確認
         assert response is not None
@@ -258,7 +214,7 @@ class TestRealBashIntegration:
             enable_bash_verification=False
         )
 
-        logger.info(f"Response: {response}")
+        logger.info("Response: %s", response)
 
         assert response is not None
         assert isinstance(response, dict)
@@ -272,59 +228,28 @@ class TestRealBashIntegration:
             enable_bash_verification=False
         )
 
-        logger.info(f"Response: {response}")
+        logger.info("Response: %s", response)
 
         # エラーが発生してもレスポンスは返ってくるはず
         assert response is not None
 
 
+@pytest.mark.xdist_group(name="ollama_real_workflow")
 class TestRealThreeStepWorkflow:
     """実際の3段階ワークフロー統合テスト"""
 
     @pytest.fixture(scope="class")
-    def ollama_available(self):
-        """Ollamaサーバーが利用可能かチェック"""
-        try:
-            client = OllamaClient(host="http://localhost:11434", model="qwen3:8b")
-            models = client.list_models()
-            if not models or "qwen3:8b" not in models:
-                pytest.skip("Ollamaまたはqwen3:8bモデルが利用できません")
-            return True
-        except Exception as e:
-            pytest.skip(f"Ollamaサーバーが利用できません: {e}")
-
-    @pytest.fixture
-    def secretary(self, ollama_available, tmp_path):
-        """3段階ワークフロー対応のAISecretary"""
-        from src.ai_secretary.config import OllamaConfig, ProactiveChatConfig
-
-        config = Config(
-            ollama=OllamaConfig(
-                host="http://localhost:11434",
-                model="qwen3:8b"
-            ),
-            proactive_chat=ProactiveChatConfig(),
-            log_level="DEBUG",
-            log_file=str(tmp_path / "test.log"),
-            max_tokens=3000,
-            temperature=0.3,
-            system_prompt=None,
-            coeiroink_api_url="http://localhost:50032",
-            audio_output_dir=str(tmp_path / "audio"),
-        )
-
-        from src.bash_executor import create_executor
-        bash_executor = create_executor()
-
-        secretary = AISecretary(
-            config=config,
-            ollama_client=None,
-            coeiroink_client=None,
-            audio_player=None,
-            bash_executor=bash_executor,
-        )
-
-        return secretary
+    @classmethod
+    def secretary(cls, real_secretary_factory):
+        """3段階ワークフロー対応のAISecretary（テストごとに会話をリセット）"""
+        return real_secretary_factory(max_tokens=3000, with_bash=True)
+
+    @pytest.fixture(autouse=True)
+    def _reset_conversation(self, secretary):
+        """共有AISecretaryの状態をテストの前後でリセット"""
+        _reset_secretary(secretary)
+        yield
+        _reset_secretary(secretary)
 
     @pytest.mark.slow
     def test_full_three_step_workflow(self, secretary):
@@ -337,7 +262,7 @@ class TestRealThreeStepWorkflow:
             enable_bash_verification=True  # 検証有効
         )
 
-        logger.info(f"Response: {response}")
+        logger.info("Response: %s", response)
 
         # レスポンスが返ってくることを確認
         assert response is not None
@@ -354,7 +279,7 @@ class TestRealThreeStepWorkflow:
             enable_bash_verification=True
         )
 
-        logger.info(f"Response: {response}")
+        logger.info("Response: %s", response)
 
         assert response is not None
 
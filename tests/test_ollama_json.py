@@ -2,25 +2,21 @@
 OllamaクライアントのJSON形式レスポンステスト
 
 このテストはOllamaが実際に動作していることを前提とします。
+モデルは他の統合テストと共通（環境変数 AI_SEC_TEST_MODEL、デフォルト: qwen3:8b）で、
+サーバーまたはモデルが利用できない場合はスキップされます。
 """
 
 import json
 import pytest
-from src.ai_secretary.ollama_client import OllamaClient
 
 
 class TestOllamaJSON:
     """OllamaクライアントのJSON形式レスポンステスト"""
 
     @pytest.fixture
-    def client(self):
-        """テスト用のOllamaクライアントを作成"""
-        return OllamaClient(
-            host="http://localhost:11434",
-            model="llama3.1:8b",
-            temperature=0.7,
-            max_tokens=1024,
-        )
+    def client(self, ollama_client):
+        """テスト用のOllamaクライアント（セッション共有）"""
+        return ollama_client
 
     def test_chat_json_response(self, client):
         """
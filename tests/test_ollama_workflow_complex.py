@@ -1,42 +1,15 @@
 """複雑なシナリオのテスト."""
 
 import pytest
-from unittest.mock import Mock, patch
-from src.ai_secretary.secretary import AISecretary
-from src.ai_secretary.config import Config
+
+# モジュールスコープの secretary フィクスチャを1回だけ構築するため、
+# --dist loadgroup ではこのモジュールのテストを同じワーカーで実行する
+pytestmark = pytest.mark.xdist_group(name="ollama_workflow_complex")
 
 
 class TestComplexScenarios:
     """複雑なシナリオのテスト"""
 
-    @pytest.fixture
-    def secretary_with_bash(self):
-        """フル機能のAISecretaryインスタンス"""
-        config = Mock()
-        config.ollama = Mock(host="http://localhost:11434", model="qwen3:8b")
-        config.temperature = 0.7
-        config.max_tokens = 2000
-        config.system_prompt = "You are a helpful assistant."
-        config.audio_output_dir = "outputs/audio"
-        config.coeiroink_api_url = "http://localhost:50032"
-
-        mock_bash_executor = Mock()
-        mock_bash_executor.root_dir = "/home/test"
-        mock_bash_executor.validator = Mock()
-        mock_bash_executor.validator.allowed_commands = {"ls", "pwd", "cat", "echo"}
-
-        with patch("src.ai_secretary.secretary.OllamaClient"), patch(
-            "src.ai_secretary.secretary.COEIROINKClient"
-        ), patch("src.ai_secretary.secretary.AudioPlayer"):
-            secretary = AISecretary(
-                config=config,
-                ollama_client=Mock(),
-                coeiroink_client=None,
-                audio_player=None,
-                bash_executor=mock_bash_executor,
-            )
-            return secretary
-
     def test_multiple_bash_commands_executed_sequentially(self, secretary_with_bash):
         """複数のBASHコマンドが順次実行されるか"""
         initial_response = {
@@ -57,9 +30,7 @@ class TestComplexScenarios:
         step2_response = {"text": "実行完了"}
         verification_response = {"success": True, "reason": "OK", "suggestion": ""}
 
-        secretary_with_bash.ollama_client.chat = Mock(
-            side_effect=[step2_response, verification_response]
-        )
+        secretary_with_bash.ollama_client.chat.side_effect = [step2_response, verification_response]
 
         result = secretary_with_bash._execute_bash_workflow(
             user_message="プロジェクト情報を教えて",
@@ -70,6 +41,7 @@ class TestComplexScenarios:
 
         assert result == step2_response
         assert secretary_with_bash.bash_executor.execute.call_count == 3
+        assert secretary_with_bash.ollama_client.chat.call_count == 2
 
     def test_bash_command_with_error_and_recovery(self, secretary_with_bash):
         """BASHコマンドエラーからの回復"""
@@ -98,15 +70,13 @@ class TestComplexScenarios:
         step2_response_2 = {"text": "READMEを読み込みました"}
         verification_response_2 = {"success": True, "reason": "OK", "suggestion": ""}
 
-        secretary_with_bash.ollama_client.chat = Mock(
-            side_effect=[
-                step2_response_1,
-                verification_response_1,
-                retry_response,
-                step2_response_2,
-                verification_response_2,
-            ]
-        )
+        secretary_with_bash.ollama_client.chat.side_effect = [
+            step2_response_1,
+            verification_response_1,
+            retry_response,
+            step2_response_2,
+            verification_response_2,
+        ]
 
         result = secretary_with_bash._execute_bash_workflow(
             user_message="READMEを読んで",
@@ -116,3 +86,5 @@ class TestComplexScenarios:
         )
 
         assert result == step2_response_2
+        # 用意した応答をちょうど使い切り、余分なLLM呼び出しがないこと
+        assert secretary_with_bash.ollama_client.chat.call_count == 5
@@ -1,87 +1,41 @@
 """Step 2: 実行結果を踏まえた回答生成のテスト."""
 
 import pytest
-from unittest.mock import Mock, patch
-from src.ai_secretary.secretary import AISecretary
-from src.ai_secretary.config import Config
+from unittest.mock import Mock
+
+from tests._workflow_payloads import LS_RESULT, PWD_RESULT
+
+# モジュールスコープの secretary フィクスチャを1回だけ構築するため、
+# --dist loadgroup ではこのモジュールのテストを同じワーカーで実行する
+pytestmark = pytest.mark.xdist_group(name="ollama_workflow_step2")
+
+
+# 生成プロンプトに含まれるべき文字列（欠けているものをまとめて報告する）
+# bashActions は「bashActionsを含めない」指示文として含まれる
+_STEP2_PROMPT_EXPECTED = frozenset({"Step 2", "BASH実行結果", "/home/test", "pwd", "bashActions"})
 
 
 class TestStep2ResponseGeneration:
     """Step 2: BASH実行結果を踏まえた回答生成の独立テスト"""
 
-    @pytest.fixture
-    def secretary_with_bash(self):
-        """BASHエグゼキュータ付きのAISecretaryインスタンス"""
-        config = Mock()
-        config.ollama = Mock(host="http://localhost:11434", model="qwen3:8b")
-        config.temperature = 0.7
-        config.max_tokens = 2000
-        config.system_prompt = "You are a helpful assistant."
-        config.audio_output_dir = "outputs/audio"
-        config.coeiroink_api_url = "http://localhost:50032"
-
-        mock_bash_executor = Mock()
-        mock_bash_executor.root_dir = "/home/test"
-        mock_bash_executor.validator = Mock()
-        mock_bash_executor.validator.allowed_commands = {"ls", "pwd", "cat"}
-
-        with patch("src.ai_secretary.secretary.OllamaClient"), patch(
-            "src.ai_secretary.secretary.COEIROINKClient"
-        ), patch("src.ai_secretary.secretary.AudioPlayer"):
-            secretary = AISecretary(
-                config=config,
-                ollama_client=Mock(),
-                coeiroink_client=None,
-                audio_player=None,
-                bash_executor=mock_bash_executor,
-            )
-            return secretary
-
     def test_step2_prompt_generation(self, secretary_with_bash):
         """Step 2: プロンプトが正しく生成されるか"""
-        bash_results = [
-            {
-                "command": "pwd",
-                "reason": "ディレクトリ確認",
-                "result": {
-                    "stdout": "/home/test\n",
-                    "stderr": "",
-                    "exit_code": "0",
-                    "cwd": "/home/test",
-                },
-                "error": None,
-            }
-        ]
+        bash_results = [PWD_RESULT]
 
         prompt = secretary_with_bash._build_step2_prompt(
             user_message="現在のディレクトリは？", bash_results=bash_results
         )
 
-        assert "Step 2" in prompt
-        assert "BASH実行結果" in prompt
-        assert "/home/test" in prompt
-        assert "pwd" in prompt
-        assert "bashActions" in prompt  # bashActionsを含めないよう指示
+        missing = {token for token in _STEP2_PROMPT_EXPECTED if token not in prompt}
+        assert not missing, f"プロンプトに含まれない: {sorted(missing)}"
 
     def test_step2_response_with_coeiroink_disabled(self, secretary_with_bash):
         """Step 2: COEIROINKが無効な場合のレスポンス"""
-        bash_results = [
-            {
-                "command": "ls",
-                "reason": "ファイル一覧",
-                "result": {
-                    "stdout": "file1.py\nfile2.py\n",
-                    "stderr": "",
-                    "exit_code": "0",
-                    "cwd": "/home/test",
-                },
-                "error": None,
-            }
-        ]
+        bash_results = [LS_RESULT]
 
         # COEIROINKが無効な場合のレスポンス
         step2_response = {"text": "ファイルはfile1.pyとfile2.pyです"}
-        secretary_with_bash.ollama_client.chat = Mock(return_value=step2_response)
+        secretary_with_bash.ollama_client.chat.return_value = step2_response
 
         result = secretary_with_bash._bash_step2_generate_response(
             user_message="ファイル一覧を教えて", bash_results=bash_results
@@ -104,7 +58,7 @@ class TestStep2ResponseGeneration:
         ]
 
         step2_response = {"text": "ファイルが見つかりませんでした"}
-        secretary_with_bash.ollama_client.chat = Mock(return_value=step2_response)
+        secretary_with_bash.ollama_client.chat.return_value = step2_response
 
         result = secretary_with_bash._bash_step2_generate_response(
             user_message="ファイルの内容を教えて", bash_results=bash_results
@@ -1,30 +1,47 @@
 #!/usr/bin/env python3
-"""音声再生テスト用スクリプト"""
+"""samples/ のテスト用WAVを AudioPlayer で再生するテスト
+
+通常はPyAudioをモックして実行する。実デバイスでの再生は hardware マーカー付きで、
+既定では除外される（pytest -m hardware で実行）。
+"""
+
+import wave
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
 
 from src.audio_player import AudioPlayer
 
-def main():
-    player = AudioPlayer()
-
-    # デバイス一覧を表示
-    print("=== 音声出力デバイス一覧 ===")
-    player.print_output_devices()
-
-    # デフォルトデバイスで再生
-    print("\n【テスト1】デフォルトデバイスで440Hz音声を再生")
-    try:
-        player.play_wav("samples/test_440hz.wav")
-        print("✓ 再生完了\n")
-    except Exception as e:
-        print(f"✗ エラー: {e}\n")
-
-    # 2つ目のファイルも再生
-    print("【テスト2】デフォルトデバイスで880Hz音声を再生")
-    try:
-        player.play_wav("samples/test_880hz.wav")
-        print("✓ 再生完了\n")
-    except Exception as e:
-        print(f"✗ エラー: {e}\n")
-
-if __name__ == "__main__":
-    main()
+SAMPLES_DIR = Path(__file__).resolve().parent.parent / "samples"
+
+
+@pytest.mark.parametrize("name", ["test_440hz.wav", "test_880hz.wav"])
+def test_play_wav_calls_backend(name: str) -> None:
+    """サンプルWAVの全フレームが出力ストリームへ書き込まれ、ストリームが閉じられる"""
+    wav_path = SAMPLES_DIR / name
+    with wave.open(str(wav_path), "rb") as wf:
+        expected_bytes = wf.getnframes() * wf.getsampwidth() * wf.getnchannels()
+        channels, rate = wf.getnchannels(), wf.getframerate()
+
+    with patch("src.audio_player.pyaudio.PyAudio") as mock_pyaudio:
+        mock_stream = MagicMock()
+        mock_pyaudio.return_value.open.return_value = mock_stream
+
+        AudioPlayer().play_wav(str(wav_path))
+
+    open_kwargs = mock_pyaudio.return_value.open.call_args.kwargs
+    assert open_kwargs["channels"] == channels
+    assert open_kwargs["rate"] == rate
+    assert open_kwargs["output"] is True
+    written = sum(len(c.args[0]) for c in mock_stream.write.call_args_list)
+    assert written == expected_bytes
+    mock_stream.stop_stream.assert_called_once()
+    mock_stream.close.assert_called_once()
+
+
+@pytest.mark.hardware
+@pytest.mark.parametrize("name", ["test_440hz.wav", "test_880hz.wav"])
+def test_play_wav_on_device(name: str) -> None:
+    """既定の出力デバイスでサンプルWAVを実際に再生する（再生時間分ブロックする）"""
+    AudioPlayer().play_wav(str(SAMPLES_DIR / name))
@@ -1,93 +1,123 @@
 """ProactivePromptManagerのテストコード"""
 
-import tempfile
-from pathlib import Path
+from unittest.mock import Mock
 
-import pytest
+from src.ai_secretary.prompt_templates import ProactivePromptManager, _read_template_lines
 
-from src.ai_secretary.prompt_templates import ProactivePromptManager
 
-
-def test_load_templates_from_file():
+def test_load_templates_from_file(tmp_path):
     """テンプレートファイルから正常に読み込めることを確認"""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        template_dir = Path(tmpdir)
-        template_file = template_dir / "test.txt"
-
-        # テストデータ作成
-        template_file.write_text(
-            "テンプレート1: {current_time}\n"
-            "テンプレート2: {current_time}\n"
-            "# コメント行\n"
-            "\n"  # 空行
-            "テンプレート3: {current_time}\n",
-            encoding="utf-8",
-        )
-
-        manager = ProactivePromptManager(template_dir)
-
-        # 空行とコメントを除いた3つのテンプレートが読み込まれる
-        assert len(manager.templates) == 3
-        assert "テンプレート1: {current_time}" in manager.templates
-        assert "テンプレート2: {current_time}" in manager.templates
-        assert "テンプレート3: {current_time}" in manager.templates
-
-
-def test_generate_prompt_with_variable_substitution():
+    template_dir = tmp_path
+    template_file = template_dir / "test.txt"
+
+    # テストデータ作成
+    template_file.write_text(
+        "テンプレート1: {current_time}\n"
+        "テンプレート2: {current_time}\n"
+        "# コメント行\n"
+        "\n"  # 空行
+        "テンプレート3: {current_time}\n",
+        encoding="utf-8",
+    )
+
+    manager = ProactivePromptManager(template_dir)
+
+    # 空行とコメントを除いた3つのテンプレートが読み込まれる
+    assert len(manager.templates) == 3
+    assert "テンプレート1: {current_time}" in manager.templates
+    assert "テンプレート2: {current_time}" in manager.templates
+    assert "テンプレート3: {current_time}" in manager.templates
+
+
+def test_generate_prompt_with_variable_substitution(tmp_path):
     """変数置換が正常に行われることを確認"""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        template_dir = Path(tmpdir)
-        template_file = template_dir / "test.txt"
-        template_file.write_text(
-            "現在時刻は {current_time} です。\n", encoding="utf-8"
-        )
+    template_dir = tmp_path
+    template_file = template_dir / "test.txt"
+    template_file.write_text(
+        "現在時刻は {current_time} です。\n", encoding="utf-8"
+    )
 
-        manager = ProactivePromptManager(template_dir)
-        prompt = manager.generate_prompt()
+    manager = ProactivePromptManager(template_dir)
+    prompt = manager.generate_prompt()
 
-        # 変数が置換されているか確認
-        assert "{current_time}" not in prompt
-        assert "現在時刻は" in prompt
+    # 変数が置換されているか確認
+    assert "{current_time}" not in prompt
+    assert "現在時刻は" in prompt
 
 
-def test_fallback_template_when_no_files():
+def test_fallback_template_when_no_files(tmp_path):
     """テンプレートファイルがない場合のフォールバック動作"""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        template_dir = Path(tmpdir)
-        manager = ProactivePromptManager(template_dir)
+    template_dir = tmp_path
+    manager = ProactivePromptManager(template_dir)
 
-        # フォールバックテンプレートが使用される
-        assert len(manager.templates) == 1
-        assert "何かお手伝いできることはありますか" in manager.templates[0]
+    # フォールバックテンプレートが使用される
+    assert len(manager.templates) == 1
+    assert "何かお手伝いできることはありますか" in manager.templates[0]
 
 
-def test_add_template_at_runtime():
+def test_add_template_at_runtime(tmp_path):
     """実行時にテンプレートを追加できることを確認"""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        template_dir = Path(tmpdir)
-        manager = ProactivePromptManager(template_dir)
+    template_dir = tmp_path
+    manager = ProactivePromptManager(template_dir)
 
-        initial_count = len(manager.templates)
-        manager.add_template("新しいテンプレート: {current_time}")
+    initial_count = len(manager.templates)
+    manager.add_template("新しいテンプレート: {current_time}")
 
-        assert len(manager.templates) == initial_count + 1
-        assert "新しいテンプレート: {current_time}" in manager.templates
+    assert len(manager.templates) == initial_count + 1
+    assert "新しいテンプレート: {current_time}" in manager.templates
 
 
-def test_reload_templates():
+def test_reload_templates(tmp_path, monkeypatch):
     """テンプレートを再読み込みできることを確認"""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        template_dir = Path(tmpdir)
-        template_file = template_dir / "test.txt"
-        template_file.write_text("初期テンプレート\n", encoding="utf-8")
+    template_dir = tmp_path
+    template_file = template_dir / "test.txt"
+    template_file.write_text("初期テンプレート\n", encoding="utf-8")
+
+    manager = ProactivePromptManager(template_dir)
+    assert len(manager.templates) == 1
+
+    # ファイルを更新
+    template_file.write_text(
+        "初期テンプレート\n更新されたテンプレート\n", encoding="utf-8"
+    )
+
+    manager.reload_templates()
+    assert len(manager.templates) == 2
+
+    # ファイルが変わっていなければ読み込み処理自体を行わない
+    load_templates = Mock(wraps=manager.load_templates)
+    monkeypatch.setattr(manager, "load_templates", load_templates)
+    manager.reload_templates()
+    assert load_templates.call_count == 0
+
+    # 再度更新すると読み込み直す
+    template_file.write_text("更新されたテンプレート\n", encoding="utf-8")
+    manager.reload_templates()
+    assert load_templates.call_count == 1
+    assert manager.templates == ["更新されたテンプレート"]
+
+
+def test_reload_after_add_template_rereads_files(tmp_path):
+    """実行時に追加したテンプレートは再読み込みで破棄される"""
+    (tmp_path / "test.txt").write_text("テンプレート\n", encoding="utf-8")
+    manager = ProactivePromptManager(tmp_path)
+    manager.add_template("追加テンプレート")
+
+    manager.reload_templates()
+
+    assert manager.templates == ["テンプレート"]
+
+
+def test_unchanged_template_file_is_not_reread(tmp_path):
+    """変更のないテンプレートファイルは再読み込み時にキャッシュから返す"""
+    template_file = tmp_path / "test.txt"
+    template_file.write_text("テンプレート\n", encoding="utf-8")
 
-        manager = ProactivePromptManager(template_dir)
-        assert len(manager.templates) == 1
+    manager = ProactivePromptManager(tmp_path)
+    misses = _read_template_lines.cache_info().misses
 
-        # ファイルを更新
-        template_file.write_text(
-            "初期テンプレート\n更新されたテンプレート\n", encoding="utf-8"
-        )
+    manager.reload_templates()
+    ProactivePromptManager(tmp_path)
 
-        manager.reload_templates()
-        assert len(manager.templates) == 2
+    assert _read_template_lines.cache_info().misses == misses
+    assert manager.templates == ["テンプレート"]
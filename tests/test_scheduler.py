@@ -1,12 +1,12 @@
 """ProactiveChatSchedulerのテストコード"""
 
+import threading
 import time
-from pathlib import Path
-from unittest.mock import MagicMock
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock
 
 import pytest
 
-from src.ai_secretary.prompt_templates import ProactivePromptManager
 from src.ai_secretary.scheduler import ProactiveChatScheduler
 
 
@@ -24,10 +24,38 @@ def mock_secretary():
 
 @pytest.fixture
 def mock_prompt_manager():
-    """モックProactivePromptManagerを作成"""
-    manager = MagicMock(spec=ProactivePromptManager)
-    manager.generate_prompt.return_value = "テストプロンプト"
-    return manager
+    """ProactivePromptManagerの代替（スケジューラーが使うgenerate_promptのみ）"""
+    return SimpleNamespace(generate_prompt=Mock(return_value="テストプロンプト"))
+
+
+class _NoopWorker:
+    """スレッドを生成しないダミーワーカー（start/stopの状態遷移だけを検証する）"""
+
+    def __init__(self, target, daemon):
+        self.target = target
+        self.daemon = daemon
+        self.started = False
+
+    def start(self):
+        self.started = True
+
+    def join(self, timeout=None):
+        self.started = False
+
+    def is_alive(self):
+        return self.started
+
+
+@pytest.fixture
+def no_thread_scheduler(mock_secretary, mock_prompt_manager):
+    """バックグラウンドスレッドを起動しないスケジューラーのファクトリ"""
+
+    def make(**kwargs):
+        return ProactiveChatScheduler(
+            mock_secretary, mock_prompt_manager, worker_factory=_NoopWorker, **kwargs
+        )
+
+    return make
 
 
 def test_scheduler_enable_disable(mock_secretary, mock_prompt_manager):
@@ -46,9 +74,9 @@ def test_scheduler_enable_disable(mock_secretary, mock_prompt_manager):
     assert not scheduler.is_enabled()
 
 
-def test_scheduler_start_stop(mock_secretary, mock_prompt_manager):
+def test_scheduler_start_stop(no_thread_scheduler):
     """スケジューラーの開始/停止が正常に動作することを確認"""
-    scheduler = ProactiveChatScheduler(mock_secretary, mock_prompt_manager)
+    scheduler = no_thread_scheduler()
 
     # 開始
     scheduler.start()
@@ -61,11 +89,9 @@ def test_scheduler_start_stop(mock_secretary, mock_prompt_manager):
     assert status["running"] is False
 
 
-def test_get_status(mock_secretary, mock_prompt_manager):
+def test_get_status(no_thread_scheduler):
     """ステータス取得が正常に動作することを確認"""
-    scheduler = ProactiveChatScheduler(
-        mock_secretary, mock_prompt_manager, interval_seconds=60
-    )
+    scheduler = no_thread_scheduler(interval_seconds=60)
     scheduler.enable()
     scheduler.start()
 
@@ -79,9 +105,9 @@ def test_get_status(mock_secretary, mock_prompt_manager):
     scheduler.stop()
 
 
-def test_message_queue_operations(mock_secretary, mock_prompt_manager):
+def test_message_queue_operations(no_thread_scheduler):
     """メッセージキューの操作が正常に動作することを確認"""
-    scheduler = ProactiveChatScheduler(mock_secretary, mock_prompt_manager)
+    scheduler = no_thread_scheduler()
     scheduler.enable()
     scheduler.start()
 
@@ -122,9 +148,9 @@ def test_set_interval(mock_secretary, mock_prompt_manager):
         scheduler.set_interval(5)
 
 
-def test_run_task_only_when_enabled(mock_secretary, mock_prompt_manager):
+def test_run_task_only_when_enabled(no_thread_scheduler, mock_secretary):
     """有効時のみタスクが実行されることを確認"""
-    scheduler = ProactiveChatScheduler(mock_secretary, mock_prompt_manager)
+    scheduler = no_thread_scheduler()
     scheduler.start()
 
     # 無効状態でタスク実行
@@ -139,12 +165,12 @@ def test_run_task_only_when_enabled(mock_secretary, mock_prompt_manager):
     scheduler.stop()
 
 
-def test_error_handling_in_task(mock_secretary, mock_prompt_manager):
+def test_error_handling_in_task(no_thread_scheduler, mock_secretary):
     """タスク実行中のエラーハンドリングを確認"""
     # chatメソッドがエラーを発生させる
     mock_secretary.chat.side_effect = Exception("テストエラー")
 
-    scheduler = ProactiveChatScheduler(mock_secretary, mock_prompt_manager)
+    scheduler = no_thread_scheduler()
     scheduler.enable()
     scheduler.start()
 
@@ -159,11 +185,9 @@ def test_error_handling_in_task(mock_secretary, mock_prompt_manager):
     scheduler.stop()
 
 
-def test_max_queue_size(mock_secretary, mock_prompt_manager):
+def test_max_queue_size(no_thread_scheduler):
     """キューの最大サイズ制限が機能することを確認"""
-    scheduler = ProactiveChatScheduler(
-        mock_secretary, mock_prompt_manager, max_queue_size=3
-    )
+    scheduler = no_thread_scheduler(max_queue_size=3)
     scheduler.enable()
     scheduler.start()
 
@@ -176,3 +200,35 @@ def test_max_queue_size(mock_secretary, mock_prompt_manager):
     assert status["pending_count"] == 3
 
     scheduler.stop()
+
+
+def test_stop_wakes_waiting_loop_immediately(mock_secretary, mock_prompt_manager):
+    """待機中のループはstop()で即座に終了する（次の実行時刻まで待たない）"""
+    scheduler = ProactiveChatScheduler(
+        mock_secretary, mock_prompt_manager, interval_seconds=3600
+    )
+    scheduler.start()
+
+    started = time.monotonic()
+    scheduler.stop()
+
+    assert not scheduler._thread.is_alive()
+    assert time.monotonic() - started < 0.5
+
+
+def test_loop_runs_task_each_interval(mock_secretary, mock_prompt_manager):
+    """待機がタイムアウトするたびにタスクが実行される"""
+    scheduler = ProactiveChatScheduler(
+        mock_secretary, mock_prompt_manager, interval_seconds=0, max_queue_size=1
+    )
+    scheduler.enable()
+    ran = threading.Event()
+    mock_secretary.chat.side_effect = lambda **kwargs: ran.set() or {
+        "voice_plan": {"text": "テスト応答"}
+    }
+
+    scheduler.start()
+    assert ran.wait(timeout=5.0)
+    scheduler.stop()
+
+    assert scheduler.get_pending_messages()[0]["text"] == "テスト応答"
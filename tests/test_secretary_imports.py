@@ -0,0 +1,32 @@
+"""src.ai_secretary.secretary の遅延importのテスト"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+from src.ai_secretary import secretary as secretary_module
+from src.coeiroink_client.client import COEIROINKClient
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def test_import_does_not_load_requests_or_pyaudio():
+    """secretaryモジュールのimportだけでは requests / pyaudio を読み込まない"""
+    code = (
+        "import sys, src.ai_secretary.secretary; "
+        "print(sorted(m for m in ('requests', 'pyaudio', 'src.coeiroink_client.client') "
+        "if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=PROJECT_ROOT,
+        check=True,
+    )
+    assert result.stdout.strip() == "[]"
+
+
+def test_lazy_class_is_resolved_as_module_attribute():
+    """遅延読み込みしたクラスはモジュール属性として参照できる"""
+    assert secretary_module.COEIROINKClient is COEIROINKClient
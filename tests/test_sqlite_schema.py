@@ -0,0 +1,31 @@
+"""src.utils.sqlite_schema のテスト"""
+
+import sqlite3
+
+from src.utils.sqlite_schema import fts5_phrase, schema_objects_exist
+
+
+def test_fts5_phrase_escapes_quotes_and_syntax():
+    """ダブルクォートを二重化し、FTS5の演算子を含む検索語も1つのフレーズとして扱う"""
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE VIRTUAL TABLE docs USING fts5(body, tokenize='trigram')")
+    conn.executemany(
+        "INSERT INTO docs(body) VALUES (?)",
+        [('say "hello" OR bye',), ("hello world",)],
+    )
+
+    assert fts5_phrase('a"b') == '"a""b"'
+    rows = conn.execute(
+        "SELECT body FROM docs WHERE docs MATCH ?", (fts5_phrase('"hello" OR'),)
+    ).fetchall()
+    assert rows == [('say "hello" OR bye',)]
+
+
+def test_schema_objects_exist():
+    """すべての名前がsqlite_masterにあるときだけTrue"""
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE items (id INTEGER)")
+    conn.execute("CREATE INDEX idx_items ON items(id)")
+
+    assert schema_objects_exist(conn, "items", "idx_items")
+    assert not schema_objects_exist(conn, "items", "idx_missing")
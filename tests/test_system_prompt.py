@@ -9,25 +9,87 @@
 
 import os
 import pytest
-import tempfile
+from contextlib import ExitStack, contextmanager
 from pathlib import Path
+from types import SimpleNamespace
+from typing import Iterator
 from unittest.mock import Mock, patch
-from src.ai_secretary.config import Config
+from src.ai_secretary.config import Config, OllamaConfig, _load_text_cached, _load_yaml_cached
 from src.ai_secretary.secretary import AISecretary
 
+# クラススコープのフィクスチャ（設定ファイル群・AISecretary）を1回だけ構築するため、
+# --dist loadgroup ではこのモジュールのテストを同じワーカーで実行する
+pytestmark = pytest.mark.xdist_group(name="system_prompt")
+
+# リポジトリに含まれる実際の設定ファイル
+ACTUAL_CONFIG_PATH = Path(__file__).resolve().parent.parent / "config" / "app_config.yaml"
+
+
+@contextmanager
+def _patch_secretary_deps() -> Iterator[SimpleNamespace]:
+    """AISecretaryが内部で生成する外部クライアントのクラスを1つのExitStackでpatchする"""
+    with ExitStack() as stack:
+        yield SimpleNamespace(
+            **{
+                name: stack.enter_context(patch(f"src.ai_secretary.secretary.{name}"))
+                for name in ("OllamaClient", "COEIROINKClient", "AudioPlayer")
+            }
+        )
+
+
+@pytest.fixture
+def patched_secretary_deps() -> Iterator[SimpleNamespace]:
+    """テストごとに外部クライアントのクラスをpatchし、クラス名で参照できるモックを返す"""
+    with _patch_secretary_deps() as deps:
+        yield deps
+
+
+@pytest.fixture(scope="module")
+def actual_config():
+    """実際の設定ファイルから読み込んだConfig（ファイルがなければNone）"""
+    if not ACTUAL_CONFIG_PATH.exists():
+        return None
+    return Config.from_yaml(ACTUAL_CONFIG_PATH)
+
+
+def _make_config(system_prompt):
+    """AISecretary用のConfig（Mockではなく実際のdataclassで属性だけを持たせる）"""
+    return Config(
+        ollama=OllamaConfig(host="http://localhost:11434", model="qwen3:8b"),
+        temperature=0.7,
+        max_tokens=2000,
+        system_prompt=system_prompt,
+        audio_output_dir="outputs/audio",
+        coeiroink_api_url="http://localhost:50032",
+    )
+
+
+def _first_system(history):
+    """会話履歴の最初のシステムメッセージ（なければNone）"""
+    return next((msg for msg in history if msg["role"] == "system"), None)
+
+
+def _count_role(history, role):
+    """会話履歴のうち指定ロールのメッセージ数"""
+    return sum(1 for msg in history if msg["role"] == role)
 
 class TestSystemPromptFromYAML:
     """YAMLファイルからのsystem_prompt読み込みテスト"""
 
-    def test_load_system_prompt_from_file(self, tmp_path):
-        """設定ファイルからsystem_promptを読み込めるか"""
-        # テスト用のsystem_prompt.txtを作成
-        prompt_content = "You are a helpful AI assistant specialized in Python development."
-        prompt_file = tmp_path / "test_system_prompt.txt"
-        prompt_file.write_text(prompt_content, encoding="utf-8")
-
-        # テスト用のYAML設定を作成（相対パスではなく絶対パスを使用）
-        config_content = f"""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def config_cases(cls, tmp_path_factory, write_files):
+        """ケース名 -> (設定ファイルパス, 期待するsystem_prompt)。ファイルはクラス内で1回だけ書き出す"""
+        base = tmp_path_factory.mktemp("configs")
+        ascii_prompt = "You are a helpful AI assistant specialized in Python development."
+        japanese_prompt = "あなたは親切で有能なAI秘書です。ユーザーの業務を支援します。"
+        # system_prompt_fileは相対パスではなく絶対パスで指定する
+        write_files(
+            base,
+            {
+                "test_system_prompt.txt": ascii_prompt,
+                "japanese_prompt.txt": japanese_prompt,
+                "ascii.yaml": f"""
 ollama:
   host: http://localhost:11434
   model: qwen3:8b
@@ -47,61 +109,25 @@ coeiroink:
 ai:
   max_tokens: 4096
   temperature: 0.7
-  system_prompt_file: {str(prompt_file)}
-"""
-        config_file = tmp_path / "test_config.yaml"
-        config_file.write_text(config_content, encoding="utf-8")
-
-        # Configを読み込む
-        config = Config.from_yaml(config_file)
-
-        assert config.system_prompt == prompt_content
-        assert "Python development" in config.system_prompt
-
-    def test_load_system_prompt_with_japanese_content(self, tmp_path):
-        """日本語のsystem_promptを正しく読み込めるか"""
-        # 日本語のsystem_prompt
-        prompt_content = "あなたは親切で有能なAI秘書です。ユーザーの業務を支援します。"
-        prompt_file = tmp_path / "japanese_prompt.txt"
-        prompt_file.write_text(prompt_content, encoding="utf-8")
-
-        config_content = f"""
+  system_prompt_file: {base / "test_system_prompt.txt"}
+""",
+                "japanese.yaml": f"""
 ollama:
   host: http://localhost:11434
   model: qwen3:8b
 
 ai:
-  system_prompt_file: {str(prompt_file)}
-"""
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text(config_content, encoding="utf-8")
-
-        config = Config.from_yaml(config_file)
-
-        assert config.system_prompt == prompt_content
-        assert "AI秘書" in config.system_prompt
-
-    def test_system_prompt_file_not_exists(self, tmp_path):
-        """system_promptファイルが存在しない場合"""
-        config_content = """
+  system_prompt_file: {base / "japanese_prompt.txt"}
+""",
+                "missing.yaml": """
 ollama:
   host: http://localhost:11434
   model: qwen3:8b
 
 ai:
   system_prompt_file: non_existent_file.txt
-"""
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text(config_content, encoding="utf-8")
-
-        config = Config.from_yaml(config_file)
-
-        # ファイルが存在しない場合はNone
-        assert config.system_prompt is None
-
-    def test_system_prompt_file_not_specified(self, tmp_path):
-        """system_prompt_fileが指定されていない場合"""
-        config_content = """
+""",
+                "unspecified.yaml": """
 ollama:
   host: http://localhost:11434
   model: qwen3:8b
@@ -109,24 +135,32 @@ ollama:
 ai:
   max_tokens: 4096
   temperature: 0.7
-"""
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text(config_content, encoding="utf-8")
+""",
+            },
+        )
+        return {
+            "ascii": (base / "ascii.yaml", ascii_prompt),
+            "japanese": (base / "japanese.yaml", japanese_prompt),
+            # ファイルが存在しない場合・指定されていない場合はNone
+            "missing": (base / "missing.yaml", None),
+            "unspecified": (base / "unspecified.yaml", None),
+        }
+
+    @pytest.mark.parametrize("case", ["ascii", "japanese", "missing", "unspecified"])
+    def test_load_system_prompt(self, config_cases, case):
+        """設定ファイルのsystem_prompt_fileからsystem_promptを読み込めるか"""
+        config_file, expected = config_cases[case]
 
         config = Config.from_yaml(config_file)
 
-        assert config.system_prompt is None
+        assert config.system_prompt == expected
 
-    def test_load_actual_system_prompt(self):
+    def test_load_actual_system_prompt(self, actual_config):
         """実際のconfig/system_prompt.txtを読み込めるか"""
-        # プロジェクトルートからの相対パスで読み込み
-        project_root = Path(__file__).parent.parent
-        config_path = project_root / "config" / "app_config.yaml"
-
-        if not config_path.exists():
+        if actual_config is None:
             pytest.skip("app_config.yaml not found")
 
-        config = Config.from_yaml(config_path)
+        config = actual_config
 
         # system_promptが読み込まれているか確認
         if config.system_prompt:
@@ -134,6 +168,29 @@ ai:
             # 実際のプロンプトには「AI秘書」が含まれているはず
             assert "AI秘書" in config.system_prompt or "assistant" in config.system_prompt.lower()
 
+    def test_unchanged_config_is_not_reparsed(self, tmp_path):
+        """変更のない設定ファイルとsystem_promptファイルは再読み込みしない"""
+        prompt_file = tmp_path / "prompt.txt"
+        prompt_file.write_text("初期プロンプト", encoding="utf-8")
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(f"ai:\n  system_prompt_file: {prompt_file}\n", encoding="utf-8")
+
+        Config.from_yaml(config_file)
+        yaml_misses = _load_yaml_cached.cache_info().misses
+        text_misses = _load_text_cached.cache_info().misses
+
+        assert Config.from_yaml(config_file).system_prompt == "初期プロンプト"
+        # 複数のConfigで同じ文字列オブジェクトを共有する
+        assert Config.from_yaml(config_file).system_prompt is Config.from_yaml(
+            config_file
+        ).system_prompt
+        assert _load_yaml_cached.cache_info().misses == yaml_misses
+        assert _load_text_cached.cache_info().misses == text_misses
+
+        # ファイルを更新すると読み込み直す
+        prompt_file.write_text("更新されたプロンプト", encoding="utf-8")
+        assert Config.from_yaml(config_file).system_prompt == "更新されたプロンプト"
+        assert _load_text_cached.cache_info().misses == text_misses + 1
 
 class TestSystemPromptFromEnv:
     """環境変数からのsystem_prompt読み込みテスト"""
@@ -164,142 +221,100 @@ class TestSystemPromptFromEnv:
 class TestSystemPromptInSecretary:
     """AISecretaryでのsystem_prompt使用テスト"""
 
-    @pytest.fixture
-    def mock_config_with_prompt(self):
-        """system_prompt付きのモックConfig"""
-        config = Mock()
-        config.ollama = Mock(host="http://localhost:11434", model="qwen3:8b")
-        config.temperature = 0.7
-        config.max_tokens = 2000
-        config.system_prompt = "You are a helpful AI assistant."
-        config.audio_output_dir = "outputs/audio"
-        config.coeiroink_api_url = "http://localhost:50032"
-        return config
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def _patch_clients(cls):
+        """外部クライアントのpatchをクラス内で1回だけ適用する"""
+        with _patch_secretary_deps():
+            yield
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def _shared_secretary(cls, _patch_clients):
+        """system_prompt付きのAISecretary（構築はクラス内で1回だけ）"""
+        return AISecretary(
+            config=_make_config("You are a helpful AI assistant."),
+            ollama_client=Mock(),
+            coeiroink_client=None,
+            audio_player=None,
+        )
 
     @pytest.fixture
-    def mock_config_without_prompt(self):
-        """system_promptなしのモックConfig"""
-        config = Mock()
-        config.ollama = Mock(host="http://localhost:11434", model="qwen3:8b")
-        config.temperature = 0.7
-        config.max_tokens = 2000
-        config.system_prompt = None
-        config.audio_output_dir = "outputs/audio"
-        config.coeiroink_api_url = "http://localhost:50032"
-        return config
-
-    def test_system_prompt_added_to_conversation_history(self, mock_config_with_prompt):
+    def secretary_with_prompt(self, _shared_secretary):
+        """クラス共有のAISecretary（テスト後に会話履歴とセッションを元に戻す）"""
+        secretary = _shared_secretary
+        history = list(secretary.conversation_history)
+        session = (secretary.session_id, secretary.session_title)
+        yield secretary
+        secretary.conversation_history[:] = history
+        secretary.session_id, secretary.session_title = session
+
+    def test_system_prompt_added_to_conversation_history(self, secretary_with_prompt):
         """system_promptが会話履歴に追加されるか"""
-        with patch("src.ai_secretary.secretary.OllamaClient"), patch(
-            "src.ai_secretary.secretary.COEIROINKClient"
-        ), patch("src.ai_secretary.secretary.AudioPlayer"):
-            secretary = AISecretary(
-                config=mock_config_with_prompt,
-                ollama_client=Mock(),
-                coeiroink_client=None,
-                audio_player=None,
-            )
-
-            # 会話履歴の最初にsystem_promptが含まれているか確認
-            system_messages = [
-                msg for msg in secretary.conversation_history if msg.get("role") == "system"
-            ]
-
-            # system_prompt + COEIROINK instruction (+ BASH instruction if enabled)
-            assert len(system_messages) >= 1
-
-            # 最初のシステムメッセージがsystem_prompt
-            assert system_messages[0]["content"] == "You are a helpful AI assistant."
-
-    def test_system_prompt_not_added_when_none(self, mock_config_without_prompt):
+        secretary = secretary_with_prompt
+
+        # 会話履歴の最初のシステムメッセージがsystem_prompt
+        # （system_prompt + COEIROINK instruction (+ BASH instruction if enabled)）
+        first = _first_system(secretary.conversation_history)
+        assert first is not None
+        assert first["content"] == "You are a helpful AI assistant."
+
+    def test_system_prompt_not_added_when_none(self):
         """system_promptがNoneの場合は追加されないか"""
-        with patch("src.ai_secretary.secretary.OllamaClient"), patch(
-            "src.ai_secretary.secretary.COEIROINKClient"
-        ), patch("src.ai_secretary.secretary.AudioPlayer"):
-            secretary = AISecretary(
-                config=mock_config_without_prompt,
-                ollama_client=Mock(),
-                coeiroink_client=None,
-                audio_player=None,
-            )
-
-            # system_promptがNoneの場合は追加されない
-            system_messages = [
-                msg
-                for msg in secretary.conversation_history
-                if msg.get("role") == "system"
-                and msg.get("content") == mock_config_without_prompt.system_prompt
-            ]
-
-            assert len(system_messages) == 0
-
-    def test_reset_conversation_preserves_system_prompt(self, mock_config_with_prompt):
+        config = _make_config(None)
+        secretary = AISecretary(
+            config=config,
+            ollama_client=Mock(),
+            coeiroink_client=None,
+            audio_player=None,
+        )
+
+        # system_promptがNoneの場合は追加されない
+        assert not any(
+            msg["role"] == "system" and msg["content"] == config.system_prompt
+            for msg in secretary.conversation_history
+        )
+
+    def test_reset_conversation_preserves_system_prompt(self, secretary_with_prompt):
         """会話履歴リセット時にsystem_promptは保持されるか"""
-        with patch("src.ai_secretary.secretary.OllamaClient"), patch(
-            "src.ai_secretary.secretary.COEIROINKClient"
-        ), patch("src.ai_secretary.secretary.AudioPlayer"):
-            secretary = AISecretary(
-                config=mock_config_with_prompt,
-                ollama_client=Mock(),
-                coeiroink_client=None,
-                audio_player=None,
-            )
-
-            # ユーザーメッセージを追加
-            secretary.conversation_history.append({"role": "user", "content": "Hello"})
-            secretary.conversation_history.append({"role": "assistant", "content": "Hi!"})
-
-            # 会話履歴をリセット
-            secretary.reset_conversation()
-
-            # system_promptは残っているか
-            system_messages = [
-                msg for msg in secretary.conversation_history if msg.get("role") == "system"
-            ]
-
-            assert len(system_messages) >= 1
-            assert system_messages[0]["content"] == "You are a helpful AI assistant."
-
-            # ユーザーメッセージとアシスタントメッセージは削除されているか
-            user_messages = [
-                msg for msg in secretary.conversation_history if msg.get("role") == "user"
-            ]
-            assistant_messages = [
-                msg for msg in secretary.conversation_history if msg.get("role") == "assistant"
-            ]
-
-            assert len(user_messages) == 0
-            assert len(assistant_messages) == 0
+        secretary = secretary_with_prompt
 
-    def test_system_prompt_with_japanese_characters(self):
-        """日本語のsystem_promptが正しく動作するか"""
-        config = Mock()
-        config.ollama = Mock(host="http://localhost:11434", model="qwen3:8b")
-        config.temperature = 0.7
-        config.max_tokens = 2000
-        config.system_prompt = "あなたは親切で有能なAI秘書です。"
-        config.audio_output_dir = "outputs/audio"
-        config.coeiroink_api_url = "http://localhost:50032"
+        # ユーザーメッセージを追加
+        secretary.conversation_history.append({"role": "user", "content": "Hello"})
+        secretary.conversation_history.append({"role": "assistant", "content": "Hi!"})
 
-        with patch("src.ai_secretary.secretary.OllamaClient"), patch(
-            "src.ai_secretary.secretary.COEIROINKClient"
-        ), patch("src.ai_secretary.secretary.AudioPlayer"):
-            secretary = AISecretary(
-                config=config, ollama_client=Mock(), coeiroink_client=None, audio_player=None
-            )
+        # 会話履歴をリセット
+        secretary.reset_conversation()
 
-            system_messages = [
-                msg for msg in secretary.conversation_history if msg.get("role") == "system"
-            ]
+        # system_promptは残っているか
+        first = _first_system(secretary.conversation_history)
+        assert first is not None
+        assert first["content"] == "You are a helpful AI assistant."
 
-            assert len(system_messages) >= 1
-            assert "AI秘書" in system_messages[0]["content"]
+        # ユーザーメッセージとアシスタントメッセージは削除されているか
+        assert _count_role(secretary.conversation_history, "user") == 0
+        assert _count_role(secretary.conversation_history, "assistant") == 0
+
+    def test_system_prompt_with_japanese_characters(self):
+        """日本語のsystem_promptが正しく動作するか"""
+        secretary = AISecretary(
+            config=_make_config("あなたは親切で有能なAI秘書です。"),
+            ollama_client=Mock(),
+            coeiroink_client=None,
+            audio_player=None,
+        )
+
+        first = _first_system(secretary.conversation_history)
+        assert first is not None
+        assert "AI秘書" in first["content"]
 
 
 class TestSystemPromptIntegration:
     """system_promptの統合テスト"""
 
-    def test_system_prompt_affects_conversation(self, tmp_path):
+    def test_system_prompt_affects_conversation(
+        self, tmp_path, patched_secretary_deps, monkeypatch
+    ):
         """system_promptが会話に影響を与えるか"""
         # カスタムsystem_promptを作成
         prompt_content = "You are a Python expert. Always provide code examples."
@@ -319,71 +334,58 @@ ai:
 
         config = Config.from_yaml(config_file)
 
-        with patch("src.ai_secretary.secretary.OllamaClient") as mock_ollama_class, patch(
-            "src.ai_secretary.secretary.COEIROINKClient", side_effect=Exception("Disabled")
-        ), patch("src.ai_secretary.secretary.AudioPlayer"), patch(
-            "src.bash_executor.create_executor", side_effect=Exception("Disabled")
-        ):
-            mock_ollama = Mock()
-            mock_ollama_class.return_value = mock_ollama
-
-            secretary = AISecretary(
-                config=config, ollama_client=mock_ollama, coeiroink_client=None, audio_player=None
-            )
-
-            # Ollamaクライアントが受け取るメッセージにsystem_promptが含まれているか確認
-            mock_ollama.chat.return_value = {
-                "text": "Here is a code example...",
-            }
+        patched_secretary_deps.COEIROINKClient.side_effect = Exception("Disabled")
+        monkeypatch.setattr(
+            "src.bash_executor.create_executor", Mock(side_effect=Exception("Disabled"))
+        )
+        mock_ollama = Mock()
+        patched_secretary_deps.OllamaClient.return_value = mock_ollama
+
+        secretary = AISecretary(
+            config=config, ollama_client=mock_ollama, coeiroink_client=None, audio_player=None
+        )
+
+        # Ollamaクライアントが受け取るメッセージにsystem_promptが含まれているか確認
+        mock_ollama.chat.return_value = {
+            "text": "Here is a code example...",
+        }
 
-            secretary.chat("How do I write a for loop?", play_audio=False)
+        secretary.chat("How do I write a for loop?", play_audio=False)
 
-            # Ollamaクライアントが呼ばれたか確認
-            mock_ollama.chat.assert_called_once()
+        # Ollamaクライアントが呼ばれたか確認
+        mock_ollama.chat.assert_called_once()
 
-            # 渡されたメッセージを取得
-            call_args = mock_ollama.chat.call_args
-            messages = call_args[1]["messages"]
+        # 渡されたメッセージを取得
+        call_args = mock_ollama.chat.call_args
+        messages = call_args[1]["messages"]
 
-            # system_promptが含まれているか確認
-            # 最初のメッセージがsystem_prompt
-            assert messages[0]["role"] == "system"
-            assert "Python expert" in messages[0]["content"]
+        # system_promptが含まれているか確認
+        # 最初のメッセージがsystem_prompt
+        assert messages[0]["role"] == "system"
+        assert "Python expert" in messages[0]["content"]
 
-    def test_multiple_system_messages_order(self):
+    def test_multiple_system_messages_order(self, patched_secretary_deps):
         """複数のシステムメッセージが正しい順序で追加されるか"""
-        config = Mock()
-        config.ollama = Mock(host="http://localhost:11434", model="qwen3:8b")
-        config.temperature = 0.7
-        config.max_tokens = 2000
-        config.system_prompt = "Initial system prompt."
-        config.audio_output_dir = "outputs/audio"
-        config.coeiroink_api_url = "http://localhost:50032"
-
-        with patch("src.ai_secretary.secretary.OllamaClient"), patch(
-            "src.ai_secretary.secretary.COEIROINKClient"
-        ) as mock_coeiro_class, patch("src.ai_secretary.secretary.AudioPlayer"):
-            # COEIROINKクライアントのモック
-            mock_coeiro = Mock()
-            mock_coeiro.speakers = {}  # 空のスピーカーリスト
-            mock_coeiro_class.return_value = mock_coeiro
-
-            secretary = AISecretary(
-                config=config,
-                ollama_client=Mock(),
-                coeiroink_client=mock_coeiro,
-                audio_player=None,
-            )
-
-            # システムメッセージの順序を確認
-            # 1. system_prompt
-            # 2. COEIROINK instruction (speakers が空なので空文字列)
-            # 3. BASH instruction (bash_executorが有効な場合)
-
-            system_messages = [
-                msg for msg in secretary.conversation_history if msg.get("role") == "system"
-            ]
-
-            # 最低でもsystem_promptは含まれているはず
-            assert len(system_messages) >= 1
-            assert system_messages[0]["content"] == "Initial system prompt."
+        config = _make_config("Initial system prompt.")
+
+        # COEIROINKクライアントのモック
+        mock_coeiro = Mock()
+        mock_coeiro.speakers = {}  # 空のスピーカーリスト
+        patched_secretary_deps.COEIROINKClient.return_value = mock_coeiro
+
+        secretary = AISecretary(
+            config=config,
+            ollama_client=Mock(),
+            coeiroink_client=mock_coeiro,
+            audio_player=None,
+        )
+
+        # システムメッセージの順序を確認
+        # 1. system_prompt
+        # 2. COEIROINK instruction (speakers が空なので空文字列)
+        # 3. BASH instruction (bash_executorが有効な場合)
+
+        # 最低でもsystem_promptは含まれているはず
+        first = _first_system(secretary.conversation_history)
+        assert first is not None
+        assert first["content"] == "Initial system prompt."
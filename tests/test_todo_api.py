@@ -1,21 +1,28 @@
-import os
+from typing import Iterator
 
+import pytest
 from fastapi.testclient import TestClient
 
-from src.server.app import create_app
 from src.server.dependencies import get_todo_repository
+from src.todo import TodoRepository
 
 
-def create_test_client(tmp_path, monkeypatch) -> TestClient:
-    db_path = tmp_path / "api_todos.db"
-    monkeypatch.setenv("AI_SECRETARY_DB_PATH", str(db_path))
-    get_todo_repository.cache_clear()
-    app = create_app()
-    return TestClient(app)
+@pytest.fixture(scope="module")
+def client(api_app) -> TestClient:
+    return TestClient(api_app)
 
 
-def test_todo_api_crud_flow(tmp_path, monkeypatch):
-    client = create_test_client(tmp_path, monkeypatch)
+@pytest.fixture
+def todo_repository(api_app, memory_db_uri) -> Iterator[TodoRepository]:
+    """テストごとのインメモリDBを使うリポジトリを依存性オーバーライドで差し込む"""
+    repo = TodoRepository(db_path=memory_db_uri)
+    api_app.dependency_overrides[get_todo_repository] = lambda: repo
+    yield repo
+    api_app.dependency_overrides.pop(get_todo_repository, None)
+
+
+@pytest.mark.usefixtures("todo_repository")
+def test_todo_api_crud_flow(client):
 
     resp = client.get("/api/todos")
     assert resp.status_code == 200
@@ -47,3 +54,21 @@ def test_todo_api_crud_flow(tmp_path, monkeypatch):
     resp = client.get("/api/todos")
     assert resp.status_code == 200
     assert resp.json() == []
+
+
+def test_todo_api_lists_seeded_todos(client, todo_repository):
+    todo_repository.bulk_create(
+        [
+            {"title": "Write report", "priority": 2},
+            {"title": "Book flights", "priority": 1, "due_date": "2025-12-01"},
+            {"title": "Archive mail", "priority": 1, "status": "done"},
+        ]
+    )
+
+    resp = client.get("/api/todos")
+    assert resp.status_code == 200
+    assert [todo["title"] for todo in resp.json()] == [
+        "Book flights",
+        "Archive mail",
+        "Write report",
+    ]
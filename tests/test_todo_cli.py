@@ -1,39 +1,64 @@
 """TODO CLI の動作テスト"""
 
-import json
+import io
 import subprocess
 import sys
+from contextlib import redirect_stderr, redirect_stdout
 from pathlib import Path
+from types import SimpleNamespace
 
+from src.todo.cli import main as cli_main
+from src.utils.jsonio import loads as _loads
 
-def run_cli(args: list[str], db_path: Path) -> subprocess.CompletedProcess:
-    """CLI実行ヘルパー"""
-    cmd = [
-        sys.executable,
-        "-m",
-        "src.todo.cli",
-        "--db-path",
-        str(db_path),
-    ] + args
-    return subprocess.run(
-        cmd,
+# エントリポイント確認用サブプロセスの作業ディレクトリ
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def run_cli(args: list[str], db_path: str) -> SimpleNamespace:
+    """CLI実行ヘルパー（プロセスを起動せず main(argv) を同一プロセスで呼び出す）"""
+    stdout, stderr = io.StringIO(), io.StringIO()
+    with redirect_stdout(stdout), redirect_stderr(stderr):
+        try:
+            returncode = cli_main(["--db-path", db_path, *args])
+        except SystemExit as exc:  # argparseの引数エラー・--help
+            returncode = exc.code or 0
+    return SimpleNamespace(
+        returncode=returncode, stdout=stdout.getvalue(), stderr=stderr.getvalue()
+    )
+
+
+def test_cli_module_entrypoint(tmp_path):
+    """python -m src.todo.cli として実行できる（エントリポイントの確認のみサブプロセスで行う）"""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "src.todo.cli",
+            "--db-path",
+            str(tmp_path / "cli_test.db"),
+            "list",
+            "--format",
+            "json",
+        ],
         capture_output=True,
         text=True,
-        cwd=Path(__file__).parent.parent,
+        cwd=PROJECT_ROOT,
     )
+    assert result.returncode == 0
+    assert _loads(result.stdout) == []
 
 
-def test_cli_list_empty(tmp_path):
+def test_cli_list_empty(memory_db_uri):
     """空のリスト取得"""
-    db_path = tmp_path / "cli_test.db"
+    db_path = memory_db_uri
     result = run_cli(["list", "--format", "json"], db_path)
     assert result.returncode == 0
-    assert json.loads(result.stdout) == []
+    assert _loads(result.stdout) == []
 
 
-def test_cli_add_and_list(tmp_path):
+def test_cli_add_and_list(memory_db_uri):
     """TODO追加とリスト取得"""
-    db_path = tmp_path / "cli_test.db"
+    db_path = memory_db_uri
 
     # 追加
     result = run_cli(
@@ -53,7 +78,7 @@ def test_cli_add_and_list(tmp_path):
         db_path,
     )
     assert result.returncode == 0
-    added = json.loads(result.stdout)
+    added = _loads(result.stdout)
     assert added["title"] == "会議準備"
     assert added["status"] == "doing"
     assert added["due_date"] == "2025-12-15"
@@ -62,14 +87,14 @@ def test_cli_add_and_list(tmp_path):
     # リスト確認
     result = run_cli(["list", "--format", "json"], db_path)
     assert result.returncode == 0
-    items = json.loads(result.stdout)
+    items = _loads(result.stdout)
     assert len(items) == 1
     assert items[0]["id"] == todo_id
 
 
-def test_cli_update(tmp_path):
+def test_cli_update(memory_db_uri):
     """TODO更新"""
-    db_path = tmp_path / "cli_test.db"
+    db_path = memory_db_uri
 
     # 追加
     result = run_cli(
@@ -77,7 +102,7 @@ def test_cli_update(tmp_path):
         db_path,
     )
     assert result.returncode == 0
-    todo_id = json.loads(result.stdout)["id"]
+    todo_id = _loads(result.stdout)["id"]
 
     # 更新
     result = run_cli(
@@ -97,53 +122,53 @@ def test_cli_update(tmp_path):
         db_path,
     )
     assert result.returncode == 0
-    updated = json.loads(result.stdout)
+    updated = _loads(result.stdout)
     assert updated["title"] == "買い物（牛乳とパン）"
     assert updated["description"] == "スーパーで購入"
     assert updated["status"] == "done"
 
 
-def test_cli_complete(tmp_path):
+def test_cli_complete(memory_db_uri):
     """TODO完了"""
-    db_path = tmp_path / "cli_test.db"
+    db_path = memory_db_uri
 
     # 追加
     result = run_cli(["add", "--title", "タスクA", "--format", "json"], db_path)
     assert result.returncode == 0
-    todo_id = json.loads(result.stdout)["id"]
+    todo_id = _loads(result.stdout)["id"]
 
     # 完了
     result = run_cli(["complete", "--id", str(todo_id), "--format", "json"], db_path)
     assert result.returncode == 0
-    completed = json.loads(result.stdout)
+    completed = _loads(result.stdout)
     assert completed["status"] == "done"
 
 
-def test_cli_delete(tmp_path):
+def test_cli_delete(memory_db_uri):
     """TODO削除"""
-    db_path = tmp_path / "cli_test.db"
+    db_path = memory_db_uri
 
     # 追加
     result = run_cli(["add", "--title", "タスクB", "--format", "json"], db_path)
     assert result.returncode == 0
-    todo_id = json.loads(result.stdout)["id"]
+    todo_id = _loads(result.stdout)["id"]
 
     # 削除
     result = run_cli(["delete", "--id", str(todo_id), "--format", "json"], db_path)
     assert result.returncode == 0
-    deleted_info = json.loads(result.stdout)
+    deleted_info = _loads(result.stdout)
     assert deleted_info["deleted"] is True
     assert deleted_info["id"] == todo_id
 
     # リスト確認（空）
     result = run_cli(["list", "--format", "json"], db_path)
     assert result.returncode == 0
-    assert json.loads(result.stdout) == []
+    assert _loads(result.stdout) == []
 
 
-def test_cli_get(tmp_path):
+def test_cli_get(memory_db_uri):
     """特定TODO取得"""
-    db_path = tmp_path / "cli_test.db"
+    db_path = memory_db_uri
 
     # 追加
     result = run_cli(
@@ -151,20 +176,20 @@ def test_cli_get(tmp_path):
         db_path,
     )
     assert result.returncode == 0
-    todo_id = json.loads(result.stdout)["id"]
+    todo_id = _loads(result.stdout)["id"]
 
     # 取得
     result = run_cli(["get", "--id", str(todo_id), "--format", "json"], db_path)
     assert result.returncode == 0
-    todo = json.loads(result.stdout)
+    todo = _loads(result.stdout)
     assert todo["id"] == todo_id
     assert todo["title"] == "確認用タスク"
     assert todo["description"] == "詳細情報"
 
 
-def test_cli_update_clear_due_date(tmp_path):
+def test_cli_update_clear_due_date(memory_db_uri):
     """期限日クリア"""
-    db_path = tmp_path / "cli_test.db"
+    db_path = memory_db_uri
 
     # 追加（期限あり）
     result = run_cli(
@@ -172,8 +197,8 @@ def test_cli_update_clear_due_date(tmp_path):
         db_path,
     )
     assert result.returncode == 0
-    todo_id = json.loads(result.stdout)["id"]
-    assert json.loads(result.stdout)["due_date"] == "2025-12-31"
+    todo_id = _loads(result.stdout)["id"]
+    assert _loads(result.stdout)["due_date"] == "2025-12-31"
 
     # 期限クリア
     result = run_cli(
@@ -181,22 +206,22 @@ def test_cli_update_clear_due_date(tmp_path):
         db_path,
     )
     assert result.returncode == 0
-    updated = json.loads(result.stdout)
+    updated = _loads(result.stdout)
     assert updated["due_date"] is None
 
 
-def test_cli_error_invalid_id(tmp_path):
+def test_cli_error_invalid_id(memory_db_uri):
     """存在しないID指定でエラー"""
-    db_path = tmp_path / "cli_test.db"
+    db_path = memory_db_uri
 
     result = run_cli(["get", "--id", "999", "--format", "json"], db_path)
     assert result.returncode == 1
     assert "見つかりません" in result.stderr
 
 
-def test_cli_text_format(tmp_path):
+def test_cli_text_format(memory_db_uri):
     """テキスト形式出力"""
-    db_path = tmp_path / "cli_test.db"
+    db_path = memory_db_uri
 
     # 追加
     run_cli(["add", "--title", "テキストテスト", "--description", "説明文"], db_path)
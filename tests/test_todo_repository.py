@@ -1,10 +1,11 @@
-from datetime import date
+import gc
+import sqlite3
 
 from src.todo.repository import TodoRepository, TodoStatus
 
 
-def test_todo_repository_crud_cycle(tmp_path):
-    repo = TodoRepository(db_path=tmp_path / "todo.db")
+def test_todo_repository_crud_cycle(memory_db_uri):
+    repo = TodoRepository(db_path=memory_db_uri)
 
     created = repo.create(
         title="Write report",
@@ -31,3 +32,60 @@ def test_todo_repository_crud_cycle(tmp_path):
 
     assert repo.delete(created.id) is True
     assert repo.list() == []
+
+
+def test_schema_recreated_after_db_file_removed(tmp_path):
+    """同じパスのDBファイルが削除されていてもスキーマを作り直す"""
+    db_path = tmp_path / "recreate.db"
+    TodoRepository(db_path=db_path)
+    db_path.unlink()
+
+    repo = TodoRepository(db_path=db_path)
+
+    assert repo.list() == []
+
+
+def test_schema_recreated_after_memory_db_discarded(_shared_db_factory):
+    """共有キャッシュのインメモリDBが最後の接続で破棄された後も、同じURIで作り直す"""
+    uri = _shared_db_factory()
+    TodoRepository(db_path=uri).create(title="破棄前")
+    gc.collect()  # 開いたままの接続を確実に閉じ、インメモリDBを破棄させる
+
+    repo = TodoRepository(db_path=uri)
+
+    assert repo.list() == []
+
+
+def test_missing_indexes_are_created_for_existing_table(tmp_path):
+    """todo_itemsがあっても索引が欠けていれば作成する"""
+    db_path = tmp_path / "no_index.db"
+    TodoRepository(db_path=db_path)
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("DROP INDEX idx_todo_due")
+
+    TodoRepository(db_path=db_path)
+
+    with sqlite3.connect(db_path) as conn:
+        names = {
+            row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+        }
+    assert {"idx_todo_status", "idx_todo_priority", "idx_todo_due"} <= names
+
+
+def test_bulk_create_inserts_in_one_batch(memory_db_uri):
+    repo = TodoRepository(db_path=memory_db_uri)
+    existing = repo.create(title="既存")
+
+    created = repo.bulk_create(
+        [
+            {"title": "低優先", "priority": 5},
+            {"title": "完了済み", "priority": 1, "status": TodoStatus.DONE.value},
+            {"title": "高優先", "priority": 1, "due_date": "2025-01-01"},
+        ]
+    )
+
+    assert [item.title for item in created] == ["低優先", "完了済み", "高優先"]
+    assert [item.id for item in created] == [existing.id + 1, existing.id + 2, existing.id + 3]
+    assert created[1].status is TodoStatus.DONE
+    assert [item.title for item in repo.list()] == ["高優先", "完了済み", "既存", "低優先"]
+    assert repo.bulk_create([]) == []